@@ -5,8 +5,14 @@ PyMiniDB Core Package
 
 Modules:
     row: Row 데이터 구조
+    schema: 테이블 Schema와 Record Codec
     page: Page 관리 (Leaf/Internal)
-    pager: Disk I/O 관리자
+    pager: Disk I/O 관리자 (Buffer Pool)
+    mmap_pager: mmap 기반 Pager
+    shadow_pager: Copy-on-Write Pager (Shadow Paging, Snapshot)
+    snapshot: 읽기 전용 Table Snapshot (MVCC Reader)
+    superblock: DB 파일 헤더 (0번 페이지)
+    wal: Write-Ahead Log (Group Commit, Recovery)
     node: B+Tree Node 직렬화
     cursor: 데이터 순회 커서
     table: 테이블 조율자
@@ -16,9 +22,20 @@ Modules:
 __version__ = "0.4.0"  # Phase 4: B+Tree Integration
 __all__ = [
     "Row",
+    "Schema",
+    "Column",
+    "ColumnType",
+    "RecordCodec",
     "Page",
     "PageType",
+    "LeafFormat",
     "Pager",
+    "SyncPolicy",
+    "MmapPager",
+    "ShadowPager",
+    "TableSnapshot",
+    "Superblock",
+    "WriteAheadLog",
     "BTreeNode",
     "Cursor",
     "Table",
@@ -27,8 +44,14 @@ __all__ = [
 
 # 편의를 위한 import (선택사항)
 from .row import Row
-from .page import Page, PageType
-from .pager import Pager
+from .schema import Column, ColumnType, RecordCodec, Schema
+from .page import LeafFormat, Page, PageType
+from .pager import Pager, SyncPolicy
+from .mmap_pager import MmapPager
+from .shadow_pager import ShadowPager
+from .snapshot import TableSnapshot
+from .superblock import Superblock
+from .wal import WriteAheadLog
 from .node import BTreeNode
 from .cursor import Cursor
 from .table import Table
@@ -7,12 +7,30 @@ BTreeManager: B+Tree 삽입 및 Split 로직을 담당하는 클래스
 from src.row import Row
 from src.page import Page, PageType
 from src.pager import Pager
-from src.table import Table
 from src.node import BTreeNode
-from typing import Tuple, Optional, List, Iterator
-from src.cursor import Cursor
+from src.schema import ROW_CODEC
+from typing import (
+    TYPE_CHECKING,
+    ClassVar,
+    Dict,
+    Tuple,
+    Optional,
+    List,
+    Iterable,
+    Iterator,
+    Sequence,
+)
 
 import bisect
+import heapq
+import struct
+import tempfile
+
+# Avoid circular import (Table이 BTreeManager를 생성함)
+if TYPE_CHECKING:
+    import numpy as np
+
+    from src.table import Table
 
 
 class BTreeManager:
@@ -25,6 +43,13 @@ class BTreeManager:
     - Root Split 처리
     """
 
+    # [Step 5.9] Bulk Load: 메모리에서 한 번에 정렬할 Row 수 (넘으면 임시 파일로 외부 정렬)
+    SORT_RUN_ROWS: ClassVar[int] = 200_000
+    # [Step 5.9] Bulk Load: 한 번에 모아서 기록할 페이지 수
+    BULK_WRITE_PAGES: ClassVar[int] = 256
+    # [Step 5.17] 외부 정렬 임시 파일에서 각 Row 앞에 붙는 길이
+    _run_length: ClassVar[struct.Struct] = struct.Struct("<H")
+
     def __init__(self, table: "Table"):
         """
         Args:
@@ -32,6 +57,22 @@ class BTreeManager:
         """
         self.table = table
         self.pager: Pager = table.pager
+        # [Step 5.18] Record 인코딩과 키 추출은 파일의 codec을 따름
+        # (기본 Row 테이블이면 row.user_id, Schema 테이블이면 record[0])
+        self.codec = self.pager.codec
+        self._key = self.codec.key
+
+        # [Step 5.12] 오른쪽 끝 Leaf까지의 경로 (순차 증가 키 Append용)
+        # 구조가 바뀌면(Split/Merge/Bulk Load) None으로 무효화하고 다음 탐색에서 다시 채움
+        self._rightmost_path: Optional[List[int]] = None
+        self.append_hits: int = 0
+
+    @property
+    def max_keys(self) -> int:
+        """[Step 5.7] 이 파일의 page_size에서 Internal 노드의 최대 키 개수 (key_limit이 있으면 그 값)"""
+        if self.pager.key_limit is not None:
+            return self.pager.key_limit
+        return BTreeNode.max_keys_for(self.pager.page_size - Page.HEADER_SIZE)
 
     def _find_path_to_leaf(self, key: int) -> List[int]:
         """
@@ -53,7 +94,7 @@ class BTreeManager:
         path = [pid]
 
         while not page.is_leaf:
-            keys, childs = page.read_internal_node()
+            keys, childs = page.internal_node()
             idx = bisect.bisect_right(keys, key)
             pid = childs[idx]
             path.append(pid)
@@ -61,29 +102,33 @@ class BTreeManager:
 
         return path
 
-    def scan(self, start_key: int, end_key: int) -> Iterator[Row]:
+    def scan(
+        self, start_key: int, end_key: int, columns: Optional[Sequence[str]] = None
+    ) -> Iterator[Row]:
         """
         B+Tree Range Scan - Iterator Pattern으로 범위 내 Row 반환
 
         Algorithm:
             1. start_key가 있을 Leaf Page 찾기 (_find_path_to_leaf)
             2. Sibling pointer를 따라 Leaf Page 순회 (Outer Loop)
-            3. 각 페이지의 Row 필터링 (Inner Loop):
-                - key < start_key → continue (첫 페이지에서만 발생)
-                - key > end_key → return (조기 종료, 불필요한 I/O 방지)
-                - start_key <= key <= end_key → yield
+            3. 각 페이지에서 범위 [lo, hi)를 이진 탐색으로 구해 yield (Inner Loop):
+                - lo: 첫 페이지에서만 start_key 위치, 이후 페이지는 0
+                - hi < row_count → end_key를 넘었으므로 조기 종료 (불필요한 I/O 방지)
 
         Args:
             start_key: 시작 키 (inclusive)
             end_key: 종료 키 (inclusive)
+            columns: [Step 5.19] 주면 Row 대신 해당 컬럼 값만 담은 tuple을 yield
+                (Projection Pushdown - Page.projector로 필요한 필드만 unpack)
 
         Yields:
-            Row: 범위 내의 Row 객체들 (정렬된 순서로)
+            Row: 범위 내의 Row 객체들 (정렬된 순서로), columns가 있으면 tuple
 
         Example:
             >>> btree = BTreeManager(table)
             >>> for row in btree.scan(10, 100):
             ...     print(row.user_id, row.username)
+            >>> count = sum(1 for _ in btree.scan(10, 100, columns=["user_id"]))
 
         Performance:
             - Time: O(log N + K), N=총 Row 수, K=반환되는 Row 수
@@ -91,23 +136,73 @@ class BTreeManager:
         """
         leaf_pid = self._find_path_to_leaf(start_key)[-1]
         leaf_page = self.pager.read_page(leaf_pid)
+        lo = leaf_page.search(start_key)[0]
 
         while leaf_page:
-            for i in range(leaf_page.row_count):
-                row = leaf_page.read_at(i)
-                key = row.user_id
-                if key < start_key:
-                    continue
+            hi = leaf_page.search(end_key + 1)[0]
+            read = leaf_page.read_at if columns is None else leaf_page.projector(columns)
+            for i in range(lo, hi):
+                yield read(i)
+
+            if hi < leaf_page.row_count or not leaf_page.has_next_sibling:
+                return
+
+            leaf_page = self.pager.read_page(leaf_page.next_sibling_id)
+            lo = 0
+
+    def scan_batches(self, start_key: int, end_key: int) -> Iterator["np.ndarray"]:
+        """
+        [Step 5.20] Vectorized Range Scan - Leaf마다 NumPy structured array 하나씩 반환
+
+        scan()과 같은 Leaf 순회지만 Row 객체를 만들지 않고 Page.to_array로
+        Leaf 본문을 통째로 배열로 바꿉니다. (dtype: Row.NUMPY_FIELDS)
+        범위에 해당하는 Row가 없는 Leaf는 건너뜁니다.
+
+        Example:
+            >>> total = sum(batch["user_id"].sum() for batch in btree.scan_batches(0, 10**6))
 
-                if key > end_key:
-                    return
-                yield row
+        Raises:
+            ValueError: SLOTTED 파일 (가변 길이 Record)
+            ImportError: numpy가 설치되지 않았을 때
+        """
+        leaf_pid = self._find_path_to_leaf(start_key)[-1]
+        leaf_page = self.pager.read_page(leaf_pid)
 
-            if not leaf_page.has_next_sibling:
+        while leaf_page:
+            batch = leaf_page.to_array(start_key, end_key)
+            if len(batch):
+                yield batch
+
+            last = leaf_page.row_count - 1
+            if not leaf_page.has_next_sibling or (
+                last >= 0 and leaf_page.key_at(last) >= end_key
+            ):
                 return
 
             leaf_page = self.pager.read_page(leaf_page.next_sibling_id)
 
+    def get(self, key: int) -> Optional[Row]:
+        """
+        [Step 5.8] Point Lookup - key에 해당하는 Row 하나 반환
+
+        scan(key, key)와 달리 Leaf의 Row를 모두 복원하지 않고,
+        raw bytes에서 키만 이진 탐색한 뒤 찾은 Row 하나만 deserialize합니다.
+
+        Args:
+            key: 찾을 키 (user_id)
+
+        Returns:
+            Optional[Row]: 찾은 Row (없으면 None)
+
+        Performance:
+            - Time: O(log N) 페이지 접근 + Leaf 내 O(log MAX_ROWS) 키 비교
+        """
+        leaf = self.pager.read_page(self._find_path_to_leaf(key)[-1])
+        index, found = leaf.search(key)
+        if not found:
+            return None
+        return leaf.read_at(index)
+
     def insert(self, row: Row) -> bool:
         """
         B+Tree에 Row 삽입
@@ -116,7 +211,9 @@ class BTreeManager:
         1. find_leaf로 삽입할 Leaf PID 찾기
         2. Leaf 로드
         3. 공간 있으면 바로 삽입
-        4. 없으면 split_leaf 후 insert_into_parent
+        4. 없으면 split_leaf 후 insert_into_parent,
+           그 다음 promote_key 기준으로 좌/우 Leaf 중 하나에 삽입
+        5. [Step 5.4] table.row_count 증가 (Superblock에 반영)
 
         Args:
             row: 삽입할 Row
@@ -124,54 +221,532 @@ class BTreeManager:
         Returns:
             bool: 성공 여부
         """
-        path = self._find_path_to_leaf(row.user_id)
+        # [Step 5.12] 현재 최대 키보다 큰 키면 Root부터 내려가지 않고 캐시된 경로 사용
+        key = self._key(row)
+        append = self._append_target(key)
+        if append is not None:
+            self.append_hits += 1
+            path, leaf = append
+            return self._insert_at(path, leaf, row)
+
+        path = self._find_path_to_leaf(key)
+        return self._insert_at(path, self.pager.read_page(path[-1]), row)
+
+    def _append_target(self, key: int) -> Optional[Tuple[List[int], Page]]:
+        """
+        [Step 5.12] key를 오른쪽 끝 Leaf에 Split 없이 바로 붙일 수 있으면 (path, leaf) 반환
+
+        조건:
+            - 캐시된 경로의 Root가 현재 Root와 같음
+            - 그 Leaf가 여전히 오른쪽 끝(next sibling 없음)이고 가득 차지 않음
+            - key가 그 Leaf의 마지막 키보다 큼
+
+        Leaf가 가득 찬 경우는 Split에 정확한 부모 경로가 필요하므로 일반 탐색으로 넘깁니다.
+        (Leaf Split은 수십 번의 Append에 한 번이므로 탐색 비용은 그때만 발생)
+        """
+        path = self._rightmost_path
+        if path is None or path[0] != self.table.root_page_id:
+            return None
+
+        leaf = self.pager.read_page(path[-1])
+        if (
+            not leaf.is_leaf
+            or leaf.has_next_sibling
+            or leaf.is_full
+            or leaf.row_count == 0
+            or key <= leaf.key_at(leaf.row_count - 1)
+        ):
+            return None
+        return path, leaf
+
+    def insert_many(self, rows: Iterable[Row]) -> int:
+        """
+        [Step 5.14] 여러 Row를 한 번에 삽입 (같은 Leaf로 가는 Row는 한 번에 처리)
+
+        알고리즘:
+        1. Row를 키 순으로 정렬
+        2. 아직 처리하지 않은 첫 Row로 Leaf를 찾고, 그 Leaf의 키 상한(오른쪽 Separator)
+           미만인 Row를 모두 모음
+        3. 기존 Row(raw bytes)와 새 Row를 병합해 Leaf를 한 번에 다시 씀
+           - 넘치면 필요한 만큼 새 Leaf를 만들어 나눠 담고 각각 insert_into_parent
+        4. 모든 Row를 처리할 때까지 2~3 반복
+
+        Row마다 탐색 / Shift / write_page를 하는 대신, Leaf마다 탐색 한 번과
+        쓰기 한 번만 발생합니다.
+
+        Args:
+            rows: 삽입할 Row들 (정렬되어 있지 않아도 됨)
+
+        Returns:
+            int: 삽입한 Row 개수
+        """
+        batch = sorted(rows, key=self._key)
+        i = 0
+        while i < len(batch):
+            path, upper = self._find_path_and_upper_bound(self._key(batch[i]))
+            j = i + 1
+            while j < len(batch) and (upper is None or self._key(batch[j]) < upper):
+                j += 1
+            self._merge_into_leaf(path, batch[i:j])
+            # Leaf마다 반영 (뒤의 Row가 encode에 실패해도 이미 기록한 Row 수와 일치)
+            self.table.row_count += j - i
+            i = j
+
+        return len(batch)
+
+    def _find_path_and_upper_bound(self, key: int) -> Tuple[List[int], Optional[int]]:
+        """
+        [Step 5.14] key의 Leaf 경로와, 그 Leaf에 들어갈 수 있는 키의 상한
+
+        Returns:
+            (path, upper): upper 미만의 키는 모두 같은 Leaf로 감 (None이면 상한 없음)
+        """
+        pid = self.table.root_page_id
+        page = self.pager.read_page(pid)
+        path = [pid]
+        upper: Optional[int] = None
+
+        while not page.is_leaf:
+            keys, childs = page.internal_node()
+            idx = bisect.bisect_right(keys, key)
+            if idx < len(keys) and (upper is None or keys[idx] < upper):
+                upper = keys[idx]
+            pid = childs[idx]
+            path.append(pid)
+            page = self.pager.read_page(pid)
+
+        return path, upper
+
+    def _merge_into_leaf(self, path: List[int], rows: List[Row]):
+        """
+        [Step 5.14] 정렬된 rows를 path[-1] Leaf의 기존 Row와 병합해 기록
+
+        한 Leaf에 다 들어가지 않으면 Leaf를 여러 개로 나눠 담습니다.
+        (오른쪽 끝 Leaf에 뒤로 붙는 경우는 FILL_FACTOR만큼, 그 외에는 균등하게)
+        """
         leaf_pid = path[-1]
         leaf = self.pager.read_page(leaf_pid)
+        capacity = leaf.capacity_bytes
+
+        existing = [(leaf.key_at(i), leaf.row_bytes(i)) for i in range(leaf.row_count)]
+        incoming = ((self._key(row), leaf.encode_row(row)) for row in rows)
+        merged = [
+            blob for _, blob in heapq.merge(existing, incoming, key=lambda e: e[0])
+        ]
+        # [Step 5.17] 용량은 바이트로 계산 (고정 길이 배치는 Row 개수 기준과 같음)
+        costs = [leaf.row_cost(blob) for blob in merged]
+        total = sum(costs)
+
+        if total <= capacity:
+            leaf.set_rows(merged)
+            self.pager.write_page(leaf_pid, leaf)
+            return
+
+        appending = not leaf.has_next_sibling and (
+            leaf.row_count == 0 or self._key(rows[0]) >= leaf.key_at(leaf.row_count - 1)
+        )
+        chunks = self._chunk_rows(merged, costs, capacity, appending)
+
+        # 새 Leaf들을 sibling chain에 연결: leaf → new_1 → ... → 원래 next
+        self._rightmost_path = None
+        new_pids = [self.pager.get_new_page_id() for _ in chunks[1:]]
+        next_pids = new_pids + [leaf._next_page_id]
+        pages = [leaf] + [self.pager.new_page(PageType.LEAF) for _ in new_pids]
+        for page, chunk, next_pid in zip(pages, chunks, next_pids):
+            page._next_page_id = next_pid
+            page.set_rows(chunk)
+        for pid, page in zip([leaf_pid] + new_pids, pages):
+            self.pager.write_page(pid, page)
 
-        if leaf.is_full:
-            new_pid, promote_key = self.split_leaf(leaf_pid)
+        # 각 새 Leaf를 부모에 등록 (앞선 등록으로 부모가 Split될 수 있으므로 경로는 매번 새로)
+        left_path = path
+        for left_page, new_pid, page in zip(pages, new_pids, pages[1:]):
+            if left_path is None:
+                left_path = self._find_path_to_leaf(left_page.key_at(0))
             self.insert_into_parent(
-                left_pid=leaf_pid,
-                key=promote_key,
+                left_pid=left_path[-1],
+                key=page.key_at(0),
                 right_pid=new_pid,
-                path=path[:-1],
-                parent_pid=path[:-1][-1] if len(path[:-1]) > 0 else None,
+                path=left_path[:-2],
+                parent_pid=left_path[-2] if len(left_path) > 1 else None,
             )
+            left_path = None
+
+    @staticmethod
+    def _chunk_rows(
+        blobs: List[bytes], costs: List[int], capacity: int, appending: bool
+    ) -> List[List[bytes]]:
+        """
+        [Step 5.14] 한 Leaf에 넘치는 blobs를 여러 Leaf 분량으로 나눔
+
+        - appending: 앞쪽 Leaf를 FILL_FACTOR만큼 채움 (이후 Append 대비)
+        - 그 외: 필요한 Leaf 수로 균등하게 (각 Leaf가 평균 분량에 도달하면 다음 Leaf로)
+        [Step 5.17] 가변 길이 Row도 다루도록 바이트(costs) 기준으로 나눕니다.
+        """
+        if appending:
+            limit = capacity * BTreeNode.FILL_FACTOR
         else:
-            # Leaf에 정렬된 위치에 삽입 (B+Tree Invariant 유지)
-            keys = [leaf.read_at(i).user_id for i in range(leaf.row_count)]
-            insert_idx = bisect.bisect_left(keys, row.user_id)
+            num_leaves = -(-sum(costs) // capacity)
+            limit = sum(costs) / num_leaves
+
+        chunks: List[List[bytes]] = [[]]
+        used = 0
+        for blob, cost in zip(blobs, costs):
+            if chunks[-1] and (
+                used + cost > capacity
+                or (used + cost > limit if appending else used >= limit)
+            ):
+                chunks.append([])
+                used = 0
+            chunks[-1].append(blob)
+            used += cost
+        return chunks
+
+    def update(self, key: int, row: Row) -> bool:
+        """
+        [Step 5.11] key의 Row를 제자리에서 덮어쓰기
 
-            # Shift: insert_idx부터 뒤쪽 Row들을 한 칸씩 오른쪽으로
-            for i in range(leaf.row_count - 1, insert_idx - 1, -1):
-                old_row = leaf.read_at(i)
-                leaf.write_at(i + 1, old_row)  # write_at은 row_count 건드리지 않음
+        Row는 고정 길이이므로 기존 슬롯에 그대로 쓰면 되고,
+        Split/Shift 없이 Leaf 한 페이지만 기록합니다.
+        [Step 5.17] Slotted Leaf에서 길어진 Row가 들어가지 않으면 빼고 다시 삽입합니다.
 
-            # Insert: insert_idx 위치에 새 Row 삽입
-            leaf.write_at(insert_idx, row)
+        Args:
+            key: 수정할 키
+            row: 새 내용 (row의 키는 key와 같아야 함)
+
+        Returns:
+            bool: 수정했으면 True, key가 없으면 False
 
-            # Metadata 업데이트
-            leaf.row_count += 1
-            leaf._update_header()
+        Raises:
+            ValueError: row의 키가 key와 다를 때 (키 변경은 delete + insert로)
+        """
+        if self._key(row) != key:
+            raise ValueError(f"Cannot change key {key} to {self._key(row)} via update")
 
-            self.pager.write_page(page_index=leaf_pid, page=leaf)
+        path = self._find_path_to_leaf(key)
+        leaf = self.pager.read_page(path[-1])
+        index, found = leaf.search(key)
+        if not found:
+            return False
 
+        self._overwrite(path, leaf, index, row)
         return True
 
-    def split_leaf(self, leaf_pid: int) -> Tuple[int, int]:
+    def upsert(self, row: Row) -> bool:
+        """
+        [Step 5.11] key가 있으면 update, 없으면 insert
+
+        탐색은 한 번만 합니다. (없을 때도 찾은 경로로 바로 삽입)
+
+        Returns:
+            bool: 새 Row를 삽입했으면 True, 기존 Row를 덮어썼으면 False
+        """
+        key = self._key(row)
+        path = self._find_path_to_leaf(key)
+        leaf_pid = path[-1]
+        leaf = self.pager.read_page(leaf_pid)
+        index, found = leaf.search(key)
+        if found:
+            self._overwrite(path, leaf, index, row)
+            return False
+
+        return self._insert_at(path, leaf, row)
+
+    def _overwrite(self, path: List[int], leaf: Page, index: int, row: Row):
+        """
+        [Step 5.11] path[-1] Leaf의 index Row를 row로 덮어쓰고 기록
+
+        [Step 5.17] Slotted Leaf에 더 긴 Row가 들어갈 자리가 없으면
+        기존 Row를 빼고 _insert_at으로 다시 넣습니다. (필요하면 Split)
+        """
+        try:
+            leaf.write_at(index, row)
+        except OverflowError:
+            leaf.remove_at(index)
+            self.pager.write_page(path[-1], leaf)
+            self.table.row_count -= 1
+            self._insert_at(path, leaf, row)
+            return
+        self.pager.write_page(path[-1], leaf)
+
+    def _insert_at(self, path: List[int], leaf: Page, row: Row) -> bool:
+        """
+        path[-1] Leaf(이미 로드된 leaf)에 row 삽입 (필요하면 Split)
+
+        Args:
+            path: Root부터 Leaf까지의 PID (_find_path_to_leaf 결과)
+            leaf: path[-1]의 Page
+            row: 삽입할 Row
+        """
+        leaf_pid = path[-1]
+        key = self._key(row)
+        # [Step 5.17] 남은 공간은 Row 개수가 아니라 직렬화된 바이트로 판단
+        blob = leaf.encode_row(row)
+        split = not leaf.has_room_for(blob)
+
+        if split:
+            # [Step 5.12] Split으로 경로가 바뀌므로 캐시 무효화
+            self._rightmost_path = None
+            # [Step 5.6] 오른쪽 끝 Leaf에 최대 키가 들어오면 FILL_FACTOR로 Split
+            rightmost = not leaf.has_next_sibling and (
+                key >= leaf.key_at(leaf.row_count - 1)
+            )
+            split_index = leaf.split_index(rightmost)
+
+            # [Step 5.1] Split 도중 Leaf가 Buffer Pool에서 Eviction되지 않도록 고정
+            self.pager.pin(leaf_pid)
+            try:
+                new_pid, promote_key = self.split_leaf(leaf_pid, split_index)
+                # path = [root, ..., parent, leaf] → parent의 조상은 path[:-2]
+                self.insert_into_parent(
+                    left_pid=leaf_pid,
+                    key=promote_key,
+                    right_pid=new_pid,
+                    path=path[:-2],
+                    parent_pid=path[-2] if len(path) > 1 else None,
+                )
+            finally:
+                self.pager.unpin(leaf_pid)
+
+            # Split 후 새 Row가 들어갈 쪽 (탐색 규칙 bisect_right와 동일하게)
+            if key >= promote_key:
+                leaf_pid = new_pid
+            leaf = self.pager.read_page(leaf_pid)
+
+        # Leaf에 정렬된 위치에 삽입 (B+Tree Invariant 유지)
+        insert_idx, _ = leaf.search(key)
+
+        # [Step 5.15] 뒤쪽 Row들은 decode/encode 없이 바이트 구간째로 이동
+        leaf.insert_bytes_at(insert_idx, blob)
+
+        self.pager.write_page(page_index=leaf_pid, page=leaf)
+        self.table.row_count += 1
+
+        # [Step 5.12] Split 없이 오른쪽 끝 Leaf에 넣었다면 그 경로를 기억
+        if not split and not leaf.has_next_sibling:
+            self._rightmost_path = path
+
+        return True
+
+    def bulk_load(
+        self, rows: Iterable[Row], fill_factor: float = BTreeNode.FILL_FACTOR
+    ) -> int:
+        """
+        [Step 5.9] 빈 테이블에 Row들을 한 번에 적재 (Bottom-up Build)
+
+        insert를 N번 호출하면 Row마다 Root → Leaf 탐색, Leaf 재기록, Row Shift,
+        연쇄 Split이 일어납니다. bulk_load는 정렬된 Row로 Leaf를 앞에서부터 채우고,
+        그 위 Internal 레벨을 아래에서 위로 한 층씩 만듭니다.
+
+        동작:
+            1. Row 정렬 (SORT_RUN_ROWS 초과 시 임시 파일 + k-way merge 외부 정렬)
+            2. Leaf를 fill_factor만큼 채우며 순서대로 기록 (sibling pointer 연결)
+            3. 각 노드의 (첫 키, PID)로 상위 Internal 레벨 생성, Root 하나가 남을 때까지 반복
+            4. 페이지는 BULK_WRITE_PAGES개씩 모아 Pager.write_pages로 연속 기록
+            5. 빈 Root Leaf는 Free-list로 반납, Superblock(root/row_count/height) 갱신
+
+        Args:
+            rows: 적재할 Row들 (정렬되어 있지 않아도 됨)
+            fill_factor: 노드를 채울 비율 (0 < fill_factor <= 1)
+                         이후 insert가 많으면 낮춰서 Split 여유를 남겨둠
+
+        Returns:
+            int: 적재한 Row 개수
+
+        Raises:
+            ValueError: 테이블이 비어있지 않거나, 키가 중복되거나, fill_factor가 범위 밖
+                        (중복 키는 페이지를 할당하기 전에 검사하므로 파일은 그대로)
+        """
+        if not 0 < fill_factor <= 1:
+            raise ValueError(f"fill_factor must be in (0, 1], got {fill_factor}")
+        if self.table.row_count != 0:
+            raise ValueError("bulk_load requires an empty table")
+
+        # Internal은 최소 2개의 자식을 가져야 함
+        fanout = max(2, int((self.max_keys + 1) * fill_factor))
+
+        pending: Dict[int, Page] = {}
+        level: List[Tuple[int, int]] = []  # (노드의 첫 키, PID)
+        leaf_pid, leaf = None, None
+        count = 0
+
+        for row in self._sorted_rows(rows):
+            key = self._key(row)
+
+            # [Step 5.17] Leaf 채움은 바이트로 계산 (가변 길이 Row 대응)
+            blob = None if leaf is None else leaf.encode_row(row)
+            if leaf is None or (
+                leaf.row_count > 0
+                and leaf.used_bytes + leaf.row_cost(blob)
+                > leaf.capacity_bytes * fill_factor
+            ):
+                new_pid = self.pager.get_new_page_id()
+                if leaf is not None:
+                    leaf._next_page_id = new_pid
+                    self._emit(pending, leaf_pid, leaf)
+                leaf_pid, leaf = new_pid, self.pager.new_page(PageType.LEAF)
+                level.append((key, leaf_pid))
+                blob = leaf.encode_row(row)
+
+            leaf.insert_bytes_at(leaf.row_count, blob)
+            count += 1
+
+        if leaf is None:
+            return 0
+        self._emit(pending, leaf_pid, leaf)
+
+        height = 1
+        while len(level) > 1:
+            parents: List[Tuple[int, int]] = []
+            groups = [level[i : i + fanout] for i in range(0, len(level), fanout)]
+            if len(groups) > 1 and len(groups[-1]) < 2:
+                # 마지막 노드가 자식 1개(키 0개)가 되지 않도록 앞 노드에서 하나 가져옴
+                # (앞 노드도 자식이 2개뿐이면 빼앗지 않고 합침: 자식 3개 <= MAX_KEYS + 1)
+                if len(groups[-2]) > 2:
+                    groups[-1].insert(0, groups[-2].pop())
+                else:
+                    groups[-2].extend(groups.pop())
+
+            for group in groups:
+                pid = self.pager.get_new_page_id()
+                node = self.pager.new_page(PageType.INTERNAL)
+                node.write_internal_node(
+                    [key for key, _ in group[1:]], [child for _, child in group]
+                )
+                self._emit(pending, pid, node)
+                parents.append((group[0][0], pid))
+
+            level = parents
+            height += 1
+
+        self.pager.write_pages(pending)
+
+        old_root = self.table.root_page_id
+        self._rightmost_path = None
+        self.table.root_page_id = level[0][1]
+        self.table.tree_height = height
+        self.table.row_count = count
+        self.pager.free_page(old_root)
+        self.pager.sync()
+        return count
+
+    def _emit(self, pending: Dict[int, Page], pid: int, page: Page):
+        """[Step 5.9] 완성된 페이지를 모아두었다가 BULK_WRITE_PAGES개마다 기록"""
+        page._update_header()
+        pending[pid] = page
+        if len(pending) >= self.BULK_WRITE_PAGES:
+            self.pager.write_pages(pending)
+            pending.clear()
+
+    def _sorted_rows(self, rows: Iterable[Row]) -> Iterator[Row]:
+        """
+        [Step 5.9] 키(user_id) 순으로 정렬된 Row 스트림 (External Merge Sort)
+
+        SORT_RUN_ROWS개씩 메모리에서 정렬한 run을 임시 파일에 기록하고,
+        heapq.merge로 모든 run을 동시에 읽으며 합칩니다.
+        입력이 한 run에 들어가면 임시 파일 없이 메모리에서 정렬합니다.
+
+        중복 키는 첫 Row를 내보내기 전에 검사합니다. (run이 여러 개면 merge를 한 번
+        더 읽어 확인) → bulk_load가 페이지를 할당한 뒤에 중단되지 않음
+
+        Raises:
+            ValueError: 키가 중복될 때
+        """
+        run_files = []
+        run: List[Row] = []
+        try:
+            for row in rows:
+                run.append(row)
+                if len(run) >= self.SORT_RUN_ROWS:
+                    run_files.append(self._spill_run(run, self.codec))
+                    run = []
+
+            if not run_files:
+                run.sort(key=self._key)
+                self._check_unique(run)
+                yield from run
+                return
+
+            if run:
+                run_files.append(self._spill_run(run, self.codec))
+                run = []
+            self._check_unique(
+                heapq.merge(*(self._read_run(f, self.codec) for f in run_files), key=self._key)
+            )
+            for f in run_files:
+                f.seek(0)
+            yield from heapq.merge(
+                *(self._read_run(f, self.codec) for f in run_files), key=self._key
+            )
+        finally:
+            for f in run_files:
+                f.close()
+
+    def _check_unique(self, sorted_rows: Iterable[Row]):
+        """[Step 5.9] 정렬된 Row 스트림에서 이웃한 키가 같으면 ValueError"""
+        prev_key = None
+        for row in sorted_rows:
+            key = self._key(row)
+            if key == prev_key:
+                raise ValueError(f"Duplicate key {key}")
+            prev_key = key
+
+    @staticmethod
+    def _spill_run(run: List[Row], codec=ROW_CODEC):
+        """
+        정렬한 run을 임시 파일에 기록
+
+        [Step 5.17] Slotted 파일의 긴 Row도 담을 수 있도록 가변 길이(serialize_var)로,
+        각 Row 앞에 길이(2B)를 붙여 기록합니다.
+        [Step 5.18] 인코딩은 codec을 따름 (Schema 테이블의 Record도 같은 방식)
+        """
+        run.sort(key=codec.key)
+        f = tempfile.TemporaryFile()
+        parts = []
+        for row in run:
+            blob = codec.encode(row)
+            parts.append(BTreeManager._run_length.pack(len(blob)))
+            parts.append(blob)
+        f.write(b"".join(parts))
+        f.seek(0)
+        return f
+
+    @staticmethod
+    def _read_run(f, codec=ROW_CODEC) -> Iterator[Row]:
+        """임시 파일의 run을 청크 단위로 읽어 Row로 복원"""
+        length_size = BTreeManager._run_length.size
+        buffer = b""
+        while True:
+            chunk = f.read(codec.max_size * 1024)
+            if not chunk:
+                return
+            buffer += chunk
+            offset = 0
+            while offset + length_size <= len(buffer):
+                (length,) = BTreeManager._run_length.unpack_from(buffer, offset)
+                if offset + length_size + length > len(buffer):
+                    break
+                yield codec.decode_from(buffer, offset + length_size)
+                offset += length_size + length
+            buffer = buffer[offset:]
+
+    def split_leaf(
+        self, leaf_pid: int, split_index: Optional[int] = None
+    ) -> Tuple[int, int]:
         """
         Leaf Page Split
 
         동작:
         1. 기존 Leaf 로드
-        2. 중간 지점(MAX_ROWS // 2) 계산
+        2. 분할 지점 계산 (기본: row_count // 2)
         3. 새 Leaf 생성 (get_new_page_id)
-        4. 우측 절반 데이터를 새 Leaf로 이동
-        5. Sibling pointer 연결
+        4. 분할 지점 이후 데이터를 새 Leaf로 이동
+        5. Sibling pointer 연결 (old → new → old의 원래 next)
         6. 양쪽 페이지 저장
 
         Args:
             leaf_pid: Split할 Leaf PID
+            split_index: [Step 5.6] 왼쪽에 남길 Row 개수 (BTreeNode.split_point)
 
         Returns:
             (new_right_pid, promote_key):
@@ -179,28 +754,17 @@ class BTreeManager:
                 - promote_key: 우측의 첫 번째 키 (부모에 삽입용)
         """
         old_leaf = self.pager.read_page(leaf_pid)
-        mid = old_leaf.row_count // 2
+        mid = old_leaf.row_count // 2 if split_index is None else split_index
 
         # 새 Leaf 생성
         new_pid = self.pager.get_new_page_id()
-        new_page = Page(page_type=PageType.LEAF)
+        new_page = self.pager.new_page(PageType.LEAF)
 
-        # 데이터 복사
-        old_offset = Page.HEADER_SIZE + (mid * Page.ROW_SIZE)
-        old_end = Page.HEADER_SIZE + (old_leaf.row_count * Page.ROW_SIZE)
-        copy_size = old_end - old_offset
+        # 데이터 이동 ([Step 5.15] Page.split_at: 한 번의 slice 복사 + 원래 자리 클리어)
+        old_leaf.split_at(mid, new_page)
 
-        new_offset = Page.HEADER_SIZE
-        new_page.data[new_offset : new_offset + copy_size] = old_leaf.data[
-            old_offset:old_end
-        ]
-
-        # Garbage 클리어 (개선!)
-        old_leaf.data[old_offset:old_end] = b"\x00" * copy_size
-
-        # 메타데이터 갱신
-        new_page.row_count = old_leaf.row_count - mid
-        old_leaf.row_count = mid
+        # Sibling pointer 갱신
+        new_page._next_page_id = old_leaf._next_page_id
         old_leaf._next_page_id = new_pid
 
         # Header 업데이트 (메서드 이름 수정!)
@@ -212,16 +776,22 @@ class BTreeManager:
         self.pager.write_page(new_pid, new_page)
 
         # Promote Key
-        promote_key = new_page.read_at(0).user_id
+        promote_key = new_page.key_at(0)
         return new_pid, promote_key
 
-    def split_internal(self, node_pid: int) -> Tuple[int, int]:
+    def split_internal(
+        self,
+        node_pid: int,
+        keys: Optional[List[int]] = None,
+        pids: Optional[List[int]] = None,
+        split_index: Optional[int] = None,
+    ) -> Tuple[int, int]:
         """
         Internal Page Split
 
         동작:
-        1. 기존 Internal 로드 (keys, pids)
-        2. 중간 인덱스(mid) 계산
+        1. 기존 Internal 로드 (keys, pids) - 인자로 받으면 그대로 사용
+        2. 분할 인덱스(mid) 계산 (기본: len(keys) // 2)
         3. 좌측: keys[:mid], pids[:mid+1]
         4. 우측: keys[mid+1:], pids[mid+1:]
         5. Promote: keys[mid]
@@ -229,16 +799,20 @@ class BTreeManager:
 
         Args:
             node_pid: Split할 Internal PID
+            keys, pids: [Step 5.6] 이미 MAX_KEYS를 넘긴 메모리상의 노드 내용
+                        (넘친 상태로는 페이지에 기록할 수 없으므로 직접 전달)
+            split_index: promote할 키의 index (BTreeNode.split_point)
 
         Returns:
             (new_right_pid, promote_key)
         """
         # 1. 기존 Internal 로드
         old_internal_node = self.pager.read_page(node_pid)
-        keys, pids = old_internal_node.read_internal_node()
+        if keys is None or pids is None:
+            keys, pids = old_internal_node.read_internal_node()
 
         # 2. 중간 지점 및 분할
-        mid = len(keys) // 2  # row_count 대신 len(keys) 사용 (더 명확)
+        mid = len(keys) // 2 if split_index is None else split_index
         promote_key = keys[mid]
 
         left_keys = keys[:mid]
@@ -248,7 +822,7 @@ class BTreeManager:
 
         # 3. 새 Internal 생성 (Right)
         new_pid = self.pager.get_new_page_id()
-        new_page = Page(raw_data=None, page_type=PageType.INTERNAL)
+        new_page = self.pager.new_page(PageType.INTERNAL)
         new_page.write_internal_node(right_keys, right_pids)  # row_count 자동 설정됨
 
         # 4. 기존 Internal 업데이트 (Left)
@@ -262,6 +836,18 @@ class BTreeManager:
 
         return new_pid, promote_key
 
+    def _is_right_edge(self, path: List[int]) -> bool:
+        """
+        [Step 5.6] path(Root → 노드)가 트리의 오른쪽 끝 경로인지 확인
+
+        각 단계에서 자식이 부모의 마지막 자식이면 오른쪽 끝입니다.
+        """
+        for parent_pid, child_pid in zip(path, path[1:]):
+            _, pids = self.pager.read_page(parent_pid).internal_node()
+            if pids[-1] != child_pid:
+                return False
+        return True
+
     def insert_into_parent(
         self,
         left_pid: int,
@@ -282,6 +868,7 @@ class BTreeManager:
             left_pid: 좌측 Child PID
             key: 삽입할 키
             right_pid: 우측 Child PID
+            path: parent_pid의 조상 PID 목록 (Root부터, parent_pid 제외)
             parent_pid: 부모 PID (None이면 Root Split)
         """
         # TODO: 가장 복잡한 부분! 천천히 구현
@@ -289,10 +876,11 @@ class BTreeManager:
         if parent_pid is None:
             # 새 Root 생성
             new_root_pid = self.pager.get_new_page_id()
-            root = Page(raw_data=None, page_type=PageType.INTERNAL)
+            root = self.pager.new_page(PageType.INTERNAL)
             root.write_internal_node(keys=[key], pids=[left_pid, right_pid])
             self.pager.write_page(new_root_pid, root)
             self.table.root_page_id = new_root_pid
+            self.table.tree_height += 1
 
         else:
             # Case 2 & 3: 부모에 삽입
@@ -305,13 +893,18 @@ class BTreeManager:
             pids.insert(idx + 1, right_pid)
 
             if (
-                len(keys) > BTreeNode.MAX_KEYS
+                len(keys) > self.max_keys
             ):  # Note: MAX_KEYS는 최대 키 개수이므로, 초과하면 split
-                # Case 3: 공간 없음 - 저장 후 Split
-                parent_page.write_internal_node(keys, pids)
-                self.pager.write_page(parent_pid, parent_page)
+                # Case 3: 공간 없음 - 메모리에서 바로 Split
+                # [Step 5.6] MAX_KEYS + 1개는 페이지에 들어가지 않으므로 기록하지 않음
+                rightmost = idx == len(keys) - 1 and self._is_right_edge(
+                    path + [parent_pid]
+                )
+                split_index = BTreeNode.split_point(len(keys), rightmost, min_right=2)
 
-                new_pid, promote_key = self.split_internal(parent_pid)
+                new_pid, promote_key = self.split_internal(
+                    parent_pid, keys, pids, split_index
+                )
                 grandparent_pid = path[-1] if len(path) > 0 else None
 
                 self.insert_into_parent(
@@ -325,3 +918,172 @@ class BTreeManager:
                 # Case 2: 공간 있음 - 그냥 저장
                 parent_page.write_internal_node(keys, pids)
                 self.pager.write_page(parent_pid, parent_page)
+
+    def delete(self, key: int) -> bool:
+        """
+        [Step 5.10] B+Tree에서 key 삭제
+
+        알고리즘:
+        1. key가 있는 Leaf를 찾아 Row 제거 (뒤쪽 Row를 한 칸씩 당김)
+        2. Leaf가 Root가 아니고 절반 미만이 되면 _rebalance
+           - 형제와 합쳐도 한 페이지에 들어가면 Merge (오른쪽 노드는 Free-list로 반납)
+           - 아니면 형제에게서 하나 빌려오고(Redistribution) 부모의 Separator 갱신
+        3. Merge로 부모의 키가 빠지면 부모도 같은 방식으로 재귀 처리
+           (insert_into_parent의 역방향)
+        4. Root가 키 0개(자식 1개)가 되면 그 자식을 새 Root로 (높이 감소)
+
+        Args:
+            key: 삭제할 키
+
+        Returns:
+            bool: 삭제했으면 True, key가 없으면 False
+        """
+        path = self._find_path_to_leaf(key)
+        leaf_pid = path[-1]
+        leaf = self.pager.read_page(leaf_pid)
+        index, found = leaf.search(key)
+        if not found:
+            return False
+
+        leaf.remove_at(index)
+        self.pager.write_page(leaf_pid, leaf)
+        self.table.row_count -= 1
+
+        if len(path) > 1 and leaf.is_underflow:
+            # [Step 5.12] Merge로 캐시된 Leaf가 반납될 수 있으므로 무효화
+            self._rightmost_path = None
+            self._rebalance(path)
+        return True
+
+    def _min_keys(self) -> int:
+        """[Step 5.10] Root가 아닌 Internal의 최소 키 개수"""
+        return self.max_keys // 2
+
+    def _rebalance(self, path: List[int]):
+        """
+        [Step 5.10] path[-1] 노드의 Underflow 해소
+
+        Args:
+            path: Root부터 Underflow된 노드까지의 PID (길이 >= 2)
+        """
+        node_pid, parent_pid = path[-1], path[-2]
+        parent = self.pager.read_page(parent_pid)
+        keys, pids = parent.read_internal_node()
+
+        # 왼쪽 형제를 우선 사용 (없으면 오른쪽)
+        child_index = pids.index(node_pid)
+        left_index = child_index - 1 if child_index > 0 else child_index
+        left_pid, right_pid = pids[left_index], pids[left_index + 1]
+
+        self.pager.pin(parent_pid)
+        try:
+            left = self.pager.read_page(left_pid)
+            right = self.pager.read_page(right_pid)
+            if left.is_leaf:
+                merged = self._rebalance_leaves(
+                    left_pid, left, right_pid, right, keys, left_index
+                )
+            else:
+                merged = self._rebalance_internals(
+                    left_pid, left, right_pid, right, keys, left_index
+                )
+
+            if merged:
+                del keys[left_index]
+                del pids[left_index + 1]
+                self.pager.free_page(right_pid)
+
+            parent.write_internal_node(keys, pids)
+            self.pager.write_page(parent_pid, parent)
+        finally:
+            self.pager.unpin(parent_pid)
+
+        if len(path) == 2:
+            # 부모가 Root: 자식 하나만 남으면 그 자식이 새 Root
+            if len(keys) == 0:
+                self.table.root_page_id = pids[0]
+                self.table.tree_height -= 1
+                self.pager.free_page(parent_pid)
+        elif len(keys) < self._min_keys():
+            self._rebalance(path[:-1])
+
+    def _rebalance_leaves(
+        self,
+        left_pid: int,
+        left: Page,
+        right_pid: int,
+        right: Page,
+        keys: List[int],
+        sep_index: int,
+    ) -> bool:
+        """
+        [Step 5.10] 인접한 두 Leaf를 Merge하거나 Row 하나를 재분배
+
+        Returns:
+            bool: Merge했으면 True (호출자가 right를 반납하고 Separator 제거)
+        """
+        if left.can_absorb(right):
+            left.extend_from(right)
+            left._next_page_id = right._next_page_id
+            left._update_header()
+            self.pager.write_page(left_pid, left)
+            return True
+
+        if left.used_bytes < right.used_bytes:
+            # 오른쪽의 첫 Row → 왼쪽 끝
+            left.append(right.read_at(0))
+            right.remove_at(0)
+        else:
+            # 왼쪽의 마지막 Row → 오른쪽 맨 앞
+            right.insert_at(0, left.read_at(left.row_count - 1))
+            left.remove_at(left.row_count - 1)
+
+        keys[sep_index] = right.key_at(0)
+        self.pager.write_page(left_pid, left)
+        self.pager.write_page(right_pid, right)
+        return False
+
+    def _rebalance_internals(
+        self,
+        left_pid: int,
+        left: Page,
+        right_pid: int,
+        right: Page,
+        keys: List[int],
+        sep_index: int,
+    ) -> bool:
+        """
+        [Step 5.10] 인접한 두 Internal을 Merge하거나 자식 하나를 재분배
+
+        Separator는 Merge 시 두 노드 사이로 내려오고,
+        재분배 시 형제의 끝 키와 자리를 바꿉니다 (Rotation).
+
+        Returns:
+            bool: Merge했으면 True (호출자가 right를 반납하고 Separator 제거)
+        """
+        left_keys, left_pids = left.read_internal_node()
+        right_keys, right_pids = right.read_internal_node()
+        separator = keys[sep_index]
+
+        if len(left_keys) + len(right_keys) + 1 <= self.max_keys:
+            left.write_internal_node(
+                left_keys + [separator] + right_keys, left_pids + right_pids
+            )
+            self.pager.write_page(left_pid, left)
+            return True
+
+        if len(left_keys) < len(right_keys):
+            left_keys.append(separator)
+            left_pids.append(right_pids.pop(0))
+            keys[sep_index] = right_keys.pop(0)
+        else:
+            right_keys.insert(0, separator)
+            right_pids.insert(0, left_pids.pop())
+            keys[sep_index] = left_keys.pop()
+
+        # 줄어든 노드의 남는 영역은 row_count(키 개수)로 무시되므로 그대로 둠
+        left.write_internal_node(left_keys, left_pids)
+        right.write_internal_node(right_keys, right_pids)
+        self.pager.write_page(left_pid, left)
+        self.pager.write_page(right_pid, right)
+        return False
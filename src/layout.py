@@ -0,0 +1,17 @@
+"""
+Step 5.6: Page 레이아웃 상수
+
+page.py가 node.py를 import하므로, 두 모듈이 함께 쓰는 Page 크기 / Header 형식은
+어느 쪽에도 의존하지 않는 이 모듈에 둡니다.
+
+Header (<HBHI, Little-endian, 9 bytes):
+    row_count (2B) | page_type (1B) | free_space (2B) | next_page_id (4B)
+"""
+
+import struct
+
+# OS Page Size (기본값)
+PAGE_SIZE = 4096
+
+PAGE_HEADER_FORMAT = "<HBHI"
+PAGE_HEADER_SIZE = struct.calcsize(PAGE_HEADER_FORMAT)
@@ -1,8 +1,45 @@
+from src.row import Row
 from src.table import Table
 import sys
 
 # Table Class was moved to src/table.py for better architecture.
 
+# [Step 5.18] Schema 없는 기본 테이블의 컬럼
+DEFAULT_COLUMNS = ("id", "username", "email")
+
+
+def column_names(table: Table) -> tuple:
+    """[Step 5.18] 이 테이블의 컬럼 이름 (insert / update 인자 순서)"""
+    if table.schema is None:
+        return DEFAULT_COLUMNS
+    return table.schema.names
+
+
+def parse_values(table: Table, args: list) -> tuple:
+    """
+    [Step 5.18] 명령 인자 문자열 → 컬럼 값
+
+    Schema 테이블은 Schema.parse로 컬럼 타입에 맞게 변환하고,
+    기본 테이블은 id만 정수로 변환합니다.
+
+    Raises:
+        ValueError: 값이 컬럼 타입으로 변환되지 않을 때
+    """
+    if table.schema is not None:
+        return table.schema.parse(args)
+    try:
+        return (int(args[0]), *args[1:])
+    except ValueError:
+        raise ValueError(f"ID must be an integer, got '{args[0]}'")
+
+
+def projection(table: Table, args: list) -> tuple:
+    """[Step 5.19] select 인자 → 컬럼 이름 (기본 테이블의 "id"는 Row.user_id)"""
+    if table.schema is not None:
+        return tuple(args)
+    fields = dict(zip(DEFAULT_COLUMNS, Row.FIELDS))
+    return tuple(fields.get(name, name) for name in args)
+
 
 def main():
     table = Table()
@@ -20,6 +57,9 @@ def main():
                     table.close()
                     print("Bye!")
                     sys.exit(0)
+                elif user_input == ".schema":
+                    # [Step 5.18] 컬럼 목록 출력
+                    print(table.schema if table.schema is not None else DEFAULT_COLUMNS)
                 else:
                     print(f"Unrecognized command '{user_input}'")
                 continue
@@ -29,25 +69,77 @@ def main():
             cmd_parts = user_input.split()
             cmd_type = cmd_parts[0].lower()
 
-            if cmd_type == "insert":
+            if cmd_type in ("insert", "update"):
                 # db > insert 1 user1 user@1.com
-                if len(cmd_parts) != 4:
-                    print("Error: insert requires 3 arguments (id username email)")
+                # db > update 1 user1 new@1.com
+                # [Step 5.18] 인자 개수와 타입은 테이블 Schema를 따름
+                names = column_names(table)
+                if len(cmd_parts) != len(names) + 1:
+                    print(
+                        f"Error: {cmd_type} requires {len(names)} arguments "
+                        f"({' '.join(names)})"
+                    )
                     continue
 
                 try:
                     # 🔧 타입 변환: ID는 정수여야 함
+                    values = parse_values(table, cmd_parts[1:])
+                except ValueError as e:
+                    print(f"Error: {e}")
+                    continue
+
+                try:
+                    if cmd_type == "insert":
+                        table.execute_insert(*values)
+                    elif not table.execute_update(*values):
+                        print(f"Not found: {values[0]}")
+                except Exception as e:
+                    print(f"{cmd_type.capitalize()} failed: {e}")
+
+            elif cmd_type == "find":
+                # db > find 1
+                if len(cmd_parts) != 2:
+                    print("Error: find requires 1 argument (id)")
+                    continue
+
+                try:
                     id_val = int(cmd_parts[1])
-                    username_val = cmd_parts[2]
-                    email_val = cmd_parts[3]
-                    table.execute_insert(id_val, username_val, email_val)
                 except ValueError:
                     print(f"Error: ID must be an integer, got '{cmd_parts[1]}'")
-                except Exception as e:
-                    print(f"Insert failed: {e}")
+                    continue
+
+                row = table.execute_find(id_val)
+                print(row if row is not None else f"Not found: {id_val}")
+
+            elif cmd_type == "delete":
+                # db > delete 1
+                if len(cmd_parts) != 2:
+                    print("Error: delete requires 1 argument (id)")
+                    continue
+
+                try:
+                    id_val = int(cmd_parts[1])
+                except ValueError:
+                    print(f"Error: ID must be an integer, got '{cmd_parts[1]}'")
+                    continue
+
+                if not table.execute_delete(id_val):
+                    print(f"Not found: {id_val}")
+
+            elif cmd_type in ("begin", "commit", "rollback"):
+                # db > begin  ... db > commit   ([Step 5.22] 트랜잭션)
+                try:
+                    getattr(table, cmd_type)()
+                except RuntimeError as e:
+                    print(f"Error: {e}")
 
             elif cmd_type == "select":
-                table.execute_select()
+                # db > select
+                # db > select id email   ([Step 5.19] 일부 컬럼만)
+                try:
+                    table.execute_select(projection(table, cmd_parts[1:]) or None)
+                except ValueError as e:
+                    print(f"Error: {e}")
 
             else:
                 print(f"Unrecognized keyword at start of '{user_input}'")
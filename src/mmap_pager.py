@@ -0,0 +1,257 @@
+"""
+Step 5.3: Memory-mapped Pager
+
+MmapPager: DB 파일을 mmap으로 매핑하고, 매핑 영역의 memoryview를 그대로
+감싸는 Page를 반환하는 Pager 구현입니다. (읽기 위주 + 파일이 Page Cache에 들어가는 환경용)
+
+Pager와의 차이:
+- read_page: 디스크 read() + bytearray 복사 없음 (Page.from_buffer)
+- write_page: 매핑에서 받은 Page라면 이미 제자리에서 수정되었으므로 복사 생략
+- Buffer Pool 없음: OS Page Cache가 그 역할을 대신함
+- get_new_page_id가 매핑 크기를 넘으면 파일을 늘리고 다시 매핑
+- [Step 5.25] Frame이 없으므로 latched / flush_page도 매핑을 직접 사용
+  (mapping lock(_lock)이 _views와 매핑 확장을 보호, Latch는 PID마다 하나)
+"""
+
+import mmap
+import os
+import weakref
+from contextlib import contextmanager
+
+from src.page import LeafFormat, Page
+from src.pager import Frame, Latch, Pager, SyncPolicy
+from src.schema import Schema
+from src.superblock import Superblock
+from typing import ClassVar, Dict, Iterator, List, Optional
+
+
+class MmapPager(Pager):
+    """
+    mmap 기반 Pager
+
+    매핑 확장 시 기존 mmap 객체는 닫지 않고 _retired_maps에 보관합니다.
+    이미 반환된 Page들이 옛 매핑의 memoryview를 들고 있을 수 있기 때문입니다.
+    (MAP_SHARED이므로 옛 매핑과 새 매핑은 같은 파일 페이지를 가리킴)
+    """
+
+    # 매핑을 늘릴 때 최소 단위 (페이지 수)
+    GROW_PAGES: ClassVar[int] = 64
+
+    def __init__(
+        self,
+        filename: str,
+        sync_policy: SyncPolicy = SyncPolicy.BATCH,
+        sync_interval_ms: int = Pager.DEFAULT_SYNC_INTERVAL_MS,
+        page_size: int = Page.PAGE_SIZE,
+        leaf_format: LeafFormat = LeafFormat.ROWS,
+        schema: Optional[Schema] = None,
+        row_limit: Optional[int] = None,
+        key_limit: Optional[int] = None,
+    ):
+        super().__init__(
+            filename,
+            sync_policy=sync_policy,
+            sync_interval_ms=sync_interval_ms,
+            page_size=page_size,
+            leaf_format=leaf_format,
+            schema=schema,
+            row_limit=row_limit,
+            key_limit=key_limit,
+        )
+        self.mmap: Optional[mmap.mmap] = None
+        self.mapped_pages: int = 0
+        self._retired_maps: List[mmap.mmap] = []
+
+        # PID → 현재 살아있는 Page (같은 메모리를 두 Page 객체가 보는 것을 방지)
+        self._views: "weakref.WeakValueDictionary[int, Page]" = (
+            weakref.WeakValueDictionary()
+        )
+        # [Step 5.25] PID → latched()가 잡는 Latch (Frame 대신)
+        self._latches: Dict[int, Latch] = {}
+
+        if self.page_count > 0:
+            self._remap(self.page_count)
+
+    def get_new_page_id(self) -> int:
+        """새 PID 발급 + 매핑 범위를 넘으면 파일 확장/재매핑"""
+        pid = super().get_new_page_id()
+        with self._lock:
+            self._ensure_mapped(pid)
+        return pid
+
+    def read_page(self, page_index: int) -> Page:
+        """
+        매핑 영역을 그대로 감싼 Page 반환 (복사 없음)
+
+        아직 초기화되지 않은 영역(Header의 PageType이 0)이면 새 Page를 반환하며,
+        이 Page는 write_page 시점에 매핑으로 복사됩니다.
+        """
+        with self._lock:
+            if page_index >= self.page_count:
+                return self.new_page()
+
+            page = self._views.get(page_index)
+            if page is not None:
+                self.hit_count += 1
+                return page
+
+            self.miss_count += 1
+            view = self._view(page_index)
+            if view[2] == 0:
+                return self.new_page()
+
+            page = Page.from_buffer(view, self.leaf_format, self.codec, self.row_limit)
+            self._views[page_index] = page
+            return page
+
+    def write_page(self, page_index: int, page: Page):
+        """
+        Page를 매핑에 반영
+
+        read_page로 받은 Page라면 데이터가 이미 매핑 안에 있으므로 복사하지 않습니다.
+        """
+        if self.superblock is not None and page_index == Superblock.PAGE_ID:
+            raise ValueError("Page 0 is reserved for the superblock")
+        with self._lock:
+            if page_index >= self.page_count:
+                self.page_count = page_index + 1
+            self._ensure_mapped(page_index)
+
+            if self._views.get(page_index) is not page:
+                start = page_index * self.page_size
+                self.mmap[start : start + self.page_size] = page.data
+                self._views.pop(page_index, None)
+
+        if self.sync_policy == SyncPolicy.WRITE:
+            self.sync()
+
+    def write_pages(self, pages: Dict[int, Page]):
+        """[Step 5.9] 여러 페이지를 매핑에 반영 (매핑이 곧 파일이므로 페이지별 복사)"""
+        if self.superblock is not None and Superblock.PAGE_ID in pages:
+            raise ValueError("Page 0 is reserved for the superblock")
+
+        with self._lock:
+            for pid in sorted(pages):
+                if pid >= self.page_count:
+                    self.page_count = pid + 1
+                self._ensure_mapped(pid)
+                start = pid * self.page_size
+                self.mmap[start : start + self.page_size] = pages[pid].data
+                self._views.pop(pid, None)
+
+        if self.sync_policy == SyncPolicy.WRITE:
+            self.sync()
+
+    def pin(self, page_index: int) -> Page:
+        """Eviction이 없으므로 pin은 read_page와 같음"""
+        return self.read_page(page_index)
+
+    def unpin(self, page_index: int, is_dirty: bool = False):
+        """Eviction이 없으므로 아무 것도 하지 않음"""
+
+    @contextmanager
+    def latched(self, page_index: int, exclusive: bool = False) -> Iterator[Page]:
+        """
+        [Step 5.25] 매핑 페이지를 PID의 Latch를 잡은 채로 사용 (Pager.latched와 같은 사용법)
+
+        Frame이 없으므로 read_page가 주는 매핑 view를 그대로 넘깁니다.
+        (아직 매핑에 없는 새 Page였다면 exclusive 사용 후 write_page로 복사)
+        """
+        with self._lock:
+            latch = self._latches.get(page_index)
+            if latch is None:
+                latch = self._latches[page_index] = Latch()
+        if exclusive:
+            latch.acquire_exclusive()
+        else:
+            latch.acquire_shared()
+        try:
+            page = self.read_page(page_index)
+            yield page
+            if exclusive:
+                self.write_page(page_index, page)
+        finally:
+            if exclusive:
+                latch.release_exclusive()
+            else:
+                latch.release_shared()
+
+    def flush_page(self, page_index: int):
+        """[Step 5.25] 매핑의 페이지 하나를 디스크에 기록 (msync 범위는 할당 단위로 맞춤)"""
+        with self._lock:
+            if self.mmap is None or page_index >= self.mapped_pages:
+                return
+            start = page_index * self.page_size
+            aligned = start - start % mmap.ALLOCATIONGRANULARITY
+            self.mmap.flush(aligned, start + self.page_size - aligned)
+
+    def _fetch(self, page_index: int, pin: bool) -> Optional[Frame]:
+        """[Step 5.25] Buffer Pool Frame이 없으므로 호출되면 안 됨 (매핑과 어긋난 사본 방지)"""
+        raise TypeError("MmapPager has no buffer-pool frames (use read_page / latched)")
+
+    def begin(self):
+        """[Step 5.22] 매핑의 페이지는 제자리에서 수정되어 되돌릴 수 없으므로 트랜잭션 미지원"""
+        raise RuntimeError("Transactions are not supported with mmap (pages change in place)")
+
+    def sync(self):
+        """매핑의 변경 내용을 디스크에 기록 (msync + fsync)"""
+        if self.superblock is not None:
+            self._write_superblock()
+        if self.mmap is not None:
+            self.mmap.flush()
+        os.fsync(self.file.fileno())
+        self.sync_count += 1
+
+    def close(self):
+        """
+        매핑 해제 후 미리 늘려둔 영역을 잘라내어 파일 크기를 page_count에 맞춤
+        """
+        if not self.file or self.file.closed:
+            return
+
+        self.sync()
+        self._views.clear()
+        for m in self._retired_maps + ([self.mmap] if self.mmap else []):
+            try:
+                m.close()
+            except BufferError:
+                # 아직 Page가 memoryview를 들고 있음 → GC에 맡김
+                pass
+        self._retired_maps = []
+        self.mmap = None
+
+        os.ftruncate(self.file.fileno(), self.page_count * self.page_size)
+        self.file.close()
+
+    def _discard(self, page_index: int):
+        """[Step 5.5] 반납/재사용되는 페이지의 view 캐시 제거"""
+        with self._lock:
+            self._views.pop(page_index, None)
+
+    def _write_superblock(self):
+        """[Step 5.4] Superblock을 매핑의 0번 페이지에 기록"""
+        self.superblock.page_count = self.page_count
+        with self._lock:
+            self._ensure_mapped(Superblock.PAGE_ID)
+            self.mmap[0 : self.page_size] = self.superblock.serialize()
+
+    def _view(self, page_index: int) -> memoryview:
+        start = page_index * self.page_size
+        return memoryview(self.mmap)[start : start + self.page_size]
+
+    def _ensure_mapped(self, page_index: int):
+        if page_index >= self.mapped_pages:
+            new_pages = max(page_index + 1, self.mapped_pages * 2, self.GROW_PAGES)
+            self._remap(new_pages)
+
+    def _remap(self, num_pages: int):
+        """파일을 num_pages 크기로 늘리고(필요 시) 새로 매핑"""
+        size = num_pages * self.page_size
+        fileno = self.file.fileno()
+        if os.fstat(fileno).st_size < size:
+            os.ftruncate(fileno, size)
+
+        if self.mmap is not None:
+            self._retired_maps.append(self.mmap)
+        self.mmap = mmap.mmap(fileno, size)
+        self.mapped_pages = num_pages
@@ -6,8 +6,12 @@ Step 4.1.2: B+Tree Node 직렬화 계층
 - Leaf Page: 기존 Row 방식 유지
 """
 
+from array import array
 from typing import List, Tuple, Iterable
 import struct
+import sys
+
+from src.layout import PAGE_HEADER_SIZE, PAGE_SIZE
 
 
 class BTreeNode:
@@ -58,13 +62,51 @@ class BTreeNode:
     KEY_COUNT_SIZE = 2
     INT_SIZE = 4
 
-    # 이론상 최대값의 70~80%만 사용
+    # Page.PAGE_SIZE - Page.HEADER_SIZE (page.py가 node.py를 import하므로 layout에서 가져옴)
+    BODY_SIZE = PAGE_SIZE - PAGE_HEADER_SIZE
+
+    # [Step 5.6] 오른쪽 끝 노드를 Split할 때 왼쪽 노드에 남길 비율
+    # (순차 증가 키 삽입 시 왼쪽 노드가 반만 찬 채로 남는 것을 방지)
     FILL_FACTOR = 0.9
-    MAX_KEYS = 10
-    MAX_CHILDREN = 11
-    ORDER = 11
 
-    MAX_KEYS_SPLIT = MAX_KEYS * FILL_FACTOR
+    # [Step 5.6] Page 용량에서 유도 (아래 공간 제약 계산 참고)
+    MAX_KEYS = (BODY_SIZE - KEY_COUNT_SIZE - INT_SIZE) // (2 * INT_SIZE)
+    MAX_CHILDREN = MAX_KEYS + 1
+    ORDER = MAX_CHILDREN
+
+    @staticmethod
+    def max_keys_for(body_size: int) -> int:
+        """
+        [Step 5.6] Body 크기에 들어가는 최대 키 개수
+
+        2 + 4N + 4(N+1) ≤ body_size  →  N ≤ (body_size - 6) / 8
+
+        [Step 5.7] 항상 body_size에서 유도 (MAX_KEYS는 기본 크기의 참고용 상수)
+        """
+        return (
+            body_size - BTreeNode.KEY_COUNT_SIZE - BTreeNode.INT_SIZE
+        ) // (2 * BTreeNode.INT_SIZE)
+
+    @staticmethod
+    def split_point(count: int, rightmost: bool = False, min_right: int = 1) -> int:
+        """
+        [Step 5.6] Split 위치 계산
+
+        Args:
+            count: Split 대상 항목 수
+            rightmost: 트리의 오른쪽 끝 노드에 가장 큰 키가 들어와 Split하는 경우
+            min_right: 오른쪽 노드에 최소로 남겨야 할 항목 수
+
+        Returns:
+            int: 왼쪽 노드가 가질 항목 수 (Internal은 promote할 키의 index)
+                - 일반: 절반 (count // 2)
+                - rightmost: count * FILL_FACTOR (왼쪽을 거의 가득 채움)
+        """
+        if rightmost:
+            mid = int(count * BTreeNode.FILL_FACTOR)
+        else:
+            mid = count // 2
+        return max(1, min(mid, count - min_right))
 
     @staticmethod
     def serialize_internal(keys: List[int], child_pids: List[int]) -> bytes:
@@ -105,6 +147,30 @@ class BTreeNode:
 
         return bytes(buffer)
 
+    @staticmethod
+    def decode_internal(data: bytes) -> Tuple[array, array]:
+        """
+        [Step 5.13] 바이트 → Internal 노드 (array('I')로 복원)
+
+        deserialize_internal과 달리 포맷 문자열 생성 / struct.unpack / list 변환 없이
+        바이트 구간을 그대로 array에 담습니다. 탐색 전용 캐시(Page.internal_node)에서 사용.
+
+        Returns:
+            (keys, child_pids): array('I') 두 개
+        """
+        key_count = struct.unpack_from("<H", data, 0)[0]
+        keys_start = BTreeNode.KEY_COUNT_SIZE
+        keys_end = keys_start + key_count * BTreeNode.INT_SIZE
+        pids_end = keys_end + (key_count + 1) * BTreeNode.INT_SIZE
+
+        keys = array("I", bytes(data[keys_start:keys_end]))
+        child_pids = array("I", bytes(data[keys_end:pids_end]))
+        if sys.byteorder == "big":
+            # 디스크 포맷은 Little-endian
+            keys.byteswap()
+            child_pids.byteswap()
+        return keys, child_pids
+
     @staticmethod
     def deserialize_internal(data: bytes) -> Tuple[List[int], List[int]]:
         """
@@ -1,8 +1,13 @@
 from src.row import Row
+from src.layout import PAGE_HEADER_FORMAT, PAGE_SIZE
 from src.node import BTreeNode
-from typing import ClassVar, Optional, Tuple, List
+from src.schema import ROW_CODEC
+from array import array
+from typing import Callable, ClassVar, Dict, List, Optional, Sequence, Tuple
 from enum import IntEnum
+import bisect
 import struct
+import sys
 
 # [Sentinel Value] "다음 페이지 없음"을 의미하는 특별한 값
 # 현재는 0을 사용하지만, 나중에 0xFFFFFFFF로 변경 가능
@@ -10,16 +15,57 @@ import struct
 INVALID_PAGE_ID = 0
 
 
+def _numpy():
+    """[Step 5.20] numpy는 선택 의존성 → 배열 변환을 쓸 때만 import"""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("Batch scans require numpy (pip install numpy)") from e
+    return numpy
+
+
 class PageType(IntEnum):
     """Page 타입 구분"""
 
     LEAF = 1  # Data Page (Row 저장)
     INTERNAL = 2  # Index Page (keys + child PIDs)
+    FREE_TRUNK = 3  # Free-list Trunk Page (재사용 가능한 PID 목록)
+    PAGE_MAP = 4  # [Step 5.23] Copy-on-Write 파일의 논리 PID → 물리 PID 표
+
+
+class LeafFormat(IntEnum):
+    """
+    [Step 5.16] Leaf 본문 배치 방식 (파일마다 Superblock에 기록)
+
+    ROWS:
+        ┌────────┬──────────────┬──────────────┬─────┐
+        │ Header │ Row0 (44B)   │ Row1 (44B)   │ ... │   (key는 각 Row의 앞 4B)
+        └────────┴──────────────┴──────────────┴─────┘
+    KEY_DIRECTORY:
+        ┌────────┬────┬────┬─────┬────────────────┬────────────────┬─────┐
+        │ Header │ K0 │ K1 │ ... │ Payload0 (40B) │ Payload1 (40B) │ ... │
+        └────────┴────┴────┴─────┴────────────────┴────────────────┴─────┘
+        key 배열이 연속이므로 탐색 시 unpack_from 한 번으로 모든 key를 읽음.
+        Row 하나의 크기는 같으므로 용량(MAX_ROWS)도 같음.
+    SLOTTED:
+        ┌────────┬───────┬───────┬─────┬─────────────┬─────────┬─────────┐
+        │ Header │ Slot0 │ Slot1 │ ... │ Free space  │ Record1 │ Record0 │
+        └────────┴───────┴───────┴─────┴─────────────┴─────────┴─────────┘
+        [Step 5.17] Slot(8B) = key + record offset + record length (key 순 정렬)
+        Record는 가변 길이(Row.serialize_var)이고 페이지 끝에서 앞으로 쌓임.
+        ([Step 5.18] Schema 테이블의 Record는 RecordCodec으로 인코딩)
+        Header의 FreeSpace = Slot 배열 끝과 Record 영역 시작 사이의 연속 빈 공간.
+        삭제/축소로 생긴 Record 사이의 구멍은 compact()로 회수.
+    """
+
+    ROWS = 0
+    KEY_DIRECTORY = 1
+    SLOTTED = 2
 
 
 class Page:
     """
-    4KB 크기의 메모리 블록을 관리하며 여러 Row를 저장합니다.
+    4KB(기본) 크기의 메모리 블록을 관리하며 여러 Row를 저장합니다.
     파일 시스템과 소통하는 Pager에서 읽어온 raw bytes 데이터를 페이지라는 단위로
     분할하여 구조화하는 모듈이다.
 
@@ -31,38 +77,225 @@ class Page:
     NextPageId: (B-Tree 연결을 위한) 다음 페이지 번호.
     """
 
-    # OS Page Size
-    PAGE_SIZE: ClassVar[int] = 4096
-    ROW_SIZE: ClassVar[int] = Row(0, "", "").size
-    MAX_ROWS: ClassVar[int] = 10  # (PAGE_SIZE - 9) // ROW_SIZE
+    # OS Page Size (기본값, [Step 5.7] 파일마다 SUPPORTED_PAGE_SIZES 중 선택 가능)
+    PAGE_SIZE: ClassVar[int] = PAGE_SIZE
+    SUPPORTED_PAGE_SIZES: ClassVar[Tuple[int, ...]] = (4096, 8192, 16384, 32768, 65536)
 
     # [New] Header Constants
-    HEADER_FORMAT: ClassVar[str] = f"<HBHI"
-    HEADER_SIZE: ClassVar[int] = 9
+    HEADER_FORMAT: ClassVar[str] = PAGE_HEADER_FORMAT
     header_struct: ClassVar[struct.Struct] = struct.Struct(HEADER_FORMAT)
+    HEADER_SIZE: ClassVar[int] = header_struct.size
 
-    def __init__(self, raw_data: bytes = None, page_type: PageType = PageType.LEAF):
+    # [Step 5.6] 용량은 Page 크기와 Row 크기에서 유도 (4096 - 9) // 44 = 92
+    # [Step 5.7] MAX_ROWS는 기본 크기(PAGE_SIZE) 페이지의 용량 (참고용 상수, 용량 계산은 max_rows_for)
+    ROW_SIZE: ClassVar[int] = Row(0, "", "").size
+    MAX_ROWS: ClassVar[int] = (PAGE_SIZE - HEADER_SIZE) // ROW_SIZE
+
+    # [Step 5.8] Row의 첫 4바이트(user_id)만 읽기 위한 Struct (Row.STRUCT_FORMAT의 "<i")
+    key_struct: ClassVar[struct.Struct] = struct.Struct("<i")
+    KEY_SIZE: ClassVar[int] = key_struct.size
+    # [Step 5.16] KEY_DIRECTORY 배치에서 key를 뺀 나머지 필드 크기
+    PAYLOAD_SIZE: ClassVar[int] = ROW_SIZE - KEY_SIZE
+    # [Step 5.17] SLOTTED 배치의 Slot: key, record offset, record length
+    slot_struct: ClassVar[struct.Struct] = struct.Struct("<iHH")
+    SLOT_SIZE: ClassVar[int] = slot_struct.size
+
+    # [Step 5.19] 고정 길이 배치의 Projection 함수 캐시 (leaf_format, page_size, columns)
+    _fixed_projectors: ClassVar[Dict[tuple, Callable]] = {}
+
+    def __init__(
+        self,
+        raw_data: bytes = None,
+        page_type: PageType = PageType.LEAF,
+        page_size: int = PAGE_SIZE,
+        leaf_format: LeafFormat = LeafFormat.ROWS,
+        codec=None,
+        row_limit: Optional[int] = None,
+    ):
         """
         Args:
             raw_data: 디스크에서 읽어온 바이트 (없으면 새 페이지)
             page_type: Leaf 또는 Internal (기본값: Leaf)
+            page_size: [Step 5.7] 새 페이지의 크기 (raw_data가 있으면 그 길이를 따름)
+            leaf_format: [Step 5.16] Leaf 본문 배치 (파일 단위 설정, Pager가 전달)
+            codec: [Step 5.18] SLOTTED Record codec (RecordCodec, 기본값은 Row용 ROW_CODEC)
+            row_limit: [Step 5.7] 고정 길이 Leaf를 이 Row 수에서 가득 찬 것으로 봄
+                       (Split 유도용, 배치는 그대로 page_size에서 유도 / Pager가 전달)
         """
+        # [Step 5.13] 디코딩된 Internal 노드 캐시 (write_internal_node 시 무효화)
+        self._internal_cache: Optional[Tuple[array, array]] = None
+        self.leaf_format: LeafFormat = leaf_format
+        self.codec = codec if codec is not None else ROW_CODEC
+        self.row_limit: Optional[int] = row_limit
+
         if raw_data:
             self.data: bytearray = bytearray(raw_data)
-            # 🔧 Header 전체 언팩 (4개 필드 모두)
-            header_values = self.header_struct.unpack(self.data[: Page.HEADER_SIZE])
-            self.row_count = header_values[0]
-            self.page_type = PageType(header_values[1])  # Enum으로 변환
-            self._free_space = header_values[2]
-            self._next_page_id: int = header_values[3]
+            self._load_header()
         else:
-            self.data: bytearray = bytearray(Page.PAGE_SIZE)
+            self.data: bytearray = bytearray(page_size)
             self.row_count = 0
             self.page_type = page_type  # 생성 시 타입 지정
             self._free_space = 0
+            if self.is_slotted:
+                # [Step 5.17] 빈 Slotted Leaf는 Header 뒤 전체가 연속 빈 공간
+                self._free_space = page_size - Page.HEADER_SIZE
             self._next_page_id: int = INVALID_PAGE_ID
             self._update_header()
 
+    @classmethod
+    def from_buffer(
+        cls,
+        buffer: memoryview,
+        leaf_format: LeafFormat = LeafFormat.ROWS,
+        codec=None,
+        row_limit: Optional[int] = None,
+    ) -> "Page":
+        """
+        [Step 5.3] 복사 없이 외부 버퍼(mmap의 memoryview 등)를 그대로 감싸는 Page 생성
+
+        Page.__init__(raw_data)는 bytearray로 복사하지만, 여기서는 buffer를
+        self.data로 직접 사용합니다. write_at 등의 수정이 곧바로 buffer에 반영됩니다.
+
+        Args:
+            buffer: 페이지 크기만큼의 쓰기 가능한 버퍼
+            leaf_format: [Step 5.16] Leaf 본문 배치
+            codec: [Step 5.18] SLOTTED Record codec
+            row_limit: [Step 5.7] 고정 길이 Leaf의 용량 축소 (Page.__init__ 참고)
+
+        Returns:
+            Page: buffer를 공유하는 Page
+        """
+        page = cls.__new__(cls)
+        page.data = buffer
+        page._internal_cache = None
+        page.leaf_format = leaf_format
+        page.codec = codec if codec is not None else ROW_CODEC
+        page.row_limit = row_limit
+        page._load_header()
+        return page
+
+    def _load_header(self):
+        """self.data의 Header(9 bytes)를 언팩하여 필드에 반영"""
+        # 🔧 Header 전체 언팩 (4개 필드 모두)
+        header_values = self.header_struct.unpack_from(self.data, 0)
+        self.row_count = header_values[0]
+        self.page_type = PageType(header_values[1])  # Enum으로 변환
+        self._free_space = header_values[2]
+        self._next_page_id: int = header_values[3]
+
+    @classmethod
+    def max_rows_for(cls, page_size: int) -> int:
+        """
+        [Step 5.7] page_size 크기 고정 길이 Leaf의 Row 슬롯 수
+
+        항상 page_size에서 유도합니다. ([Step 5.16] KEY_DIRECTORY의 payload 위치도 이 값 기준)
+        """
+        return (page_size - cls.HEADER_SIZE) // cls.ROW_SIZE
+
+    @classmethod
+    def max_record_size(cls, page_size: int) -> int:
+        """
+        [Step 5.18] page_size 크기 SLOTTED Leaf에 허용하는 Record 최대 크기
+
+        Record 하나가 본문의 1/4 이하면, 절반으로 Split한 어느 쪽에도 새 Record가 들어갑니다.
+        """
+        return (page_size - cls.HEADER_SIZE) // 4 - cls.SLOT_SIZE
+
+    @property
+    def page_size(self) -> int:
+        """[Step 5.7] 이 페이지의 크기 (bytes)"""
+        return len(self.data)
+
+    @property
+    def max_rows(self) -> int:
+        """
+        [Step 5.7] 이 페이지에 들어가는 최대 Row 개수 (row_limit이 있으면 그 값까지)
+
+        [Step 5.17] SLOTTED는 Record 길이에 따라 달라지므로 가장 짧은 Record(key만) 기준 상한
+        """
+        if self.is_slotted:
+            return self.capacity_bytes // (Page.SLOT_SIZE + Page.KEY_SIZE)
+        slots = Page.max_rows_for(len(self.data))
+        if self.row_limit is None:
+            return slots
+        return min(self.row_limit, slots)
+
+    @property
+    def is_slotted(self) -> bool:
+        """[Step 5.17] Slotted 배치의 Leaf인지 (Internal은 배치와 무관)"""
+        return self.leaf_format == LeafFormat.SLOTTED and self.page_type == PageType.LEAF
+
+    @property
+    def capacity_bytes(self) -> int:
+        """[Step 5.17] Row를 담을 수 있는 전체 바이트 (SLOTTED는 Slot 포함)"""
+        if self.is_slotted:
+            return len(self.data) - Page.HEADER_SIZE
+        return self.max_rows * Page.ROW_SIZE
+
+    @property
+    def used_bytes(self) -> int:
+        """[Step 5.17] 현재 Row들이 차지하는 바이트 (구멍은 제외)"""
+        if self.is_slotted:
+            return self.row_count * Page.SLOT_SIZE + sum(self._record_lengths())
+        return self.row_count * Page.ROW_SIZE
+
+    def row_cost(self, blob: bytes) -> int:
+        """[Step 5.17] 직렬화된 Row 하나가 이 Page에서 차지하는 바이트"""
+        if self.is_slotted:
+            return len(blob) + Page.SLOT_SIZE
+        return Page.ROW_SIZE
+
+    def encode_row(self, row: Row) -> bytes:
+        """
+        [Step 5.17] 이 Page의 배치에 맞는 Row 직렬화 (SLOTTED면 가변 길이)
+
+        [Step 5.18] SLOTTED는 파일의 codec으로 인코딩 (Schema 테이블이면 tuple Record)
+        """
+        if self.is_slotted:
+            return self.codec.encode(row)
+        return row.serialize()
+
+    def has_room_for(self, blob: bytes) -> bool:
+        """[Step 5.17] blob 하나를 더 넣을 수 있는지 (SLOTTED는 compact 후 기준)"""
+        if self.is_slotted:
+            return self.used_bytes + self.row_cost(blob) <= self.capacity_bytes
+        return not self.is_full
+
+    @property
+    def is_underflow(self) -> bool:
+        """[Step 5.10] Root가 아닌 Leaf의 최소 채움 미달 ([Step 5.17] SLOTTED는 바이트 기준)"""
+        if self.is_slotted:
+            return self.used_bytes < self.capacity_bytes // 2
+        return self.row_count < self.max_rows // 2
+
+    def can_absorb(self, other: "Page") -> bool:
+        """[Step 5.10] other의 Row를 전부 이 Page에 합칠 수 있는지"""
+        if self.is_slotted:
+            return self.used_bytes + other.used_bytes <= self.capacity_bytes
+        return self.row_count + other.row_count <= self.max_rows
+
+    def split_index(self, rightmost: bool = False) -> int:
+        """
+        [Step 5.6] Leaf Split 시 왼쪽에 남길 Row 개수 (BTreeNode.split_point)
+
+        [Step 5.17] SLOTTED는 Row 개수가 아니라 바이트가 절반(rightmost면 FILL_FACTOR)이
+        되는 지점에서 나눕니다.
+        """
+        count = self.row_count
+        if not self.is_slotted:
+            return BTreeNode.split_point(count, rightmost)
+
+        costs = [length + Page.SLOT_SIZE for length in self._record_lengths()]
+        ratio = BTreeNode.FILL_FACTOR if rightmost else 0.5
+        target = sum(costs) * ratio
+        mid, acc = count, 0
+        for i, cost in enumerate(costs):
+            acc += cost
+            if acc >= target:
+                mid = i + 1
+                break
+        return max(1, min(mid, count - 1))
+
     def row_count(self):
         """
         Row의 개수가 몇개 인지 반환
@@ -88,8 +321,7 @@ class Page:
 
         Note:
             INVALID_PAGE_ID는 "다음 페이지 없음"을 의미합니다.
-            Root Page ID도 0이지만, Leaf chain에서는 혼동 없음.
-            (Root는 Internal이 되면 sibling chain에서 제외됨)
+            [Step 5.4] 0번 페이지는 Superblock이므로 실제 노드와 겹치지 않음.
         """
         return self._next_page_id != INVALID_PAGE_ID
 
@@ -127,7 +359,11 @@ class Page:
 
     @property
     def is_full(self) -> bool:
-        return True if self.row_count >= Page.MAX_ROWS else False
+        if self.is_slotted:
+            # [Step 5.17] 가장 긴 Record가 들어갈 자리가 없으면 가득 찬 것으로 봄
+            free = self.capacity_bytes - self.used_bytes
+            return free < Page.SLOT_SIZE + self.codec.max_size
+        return True if self.row_count >= self.max_rows else False
 
     def get_next_sibling_id(self) -> Optional[int]:
         """
@@ -154,7 +390,7 @@ class Page:
         호출자가 직접 row_count와 _update_header()를 관리해야 함.
 
         Args:
-            index: 0-based index (0 <= index < MAX_ROWS)
+            index: 0-based index (0 <= index < max_rows)
             row: 덮어쓸 Row 객체
 
         Raises:
@@ -174,12 +410,111 @@ class Page:
             >>> page.row_count += 1  # 호출자가 관리!
             >>> page._update_header()
         """
-        if index < 0 or index >= Page.MAX_ROWS:
-            raise IndexError(f"Index {index} out of range [0, {Page.MAX_ROWS})")
+        if self.is_slotted:
+            # [Step 5.17] Slotted는 기존 Row 교체만 가능 (길이가 바뀔 수 있음)
+            if index < 0 or index >= self.row_count:
+                raise IndexError(f"Index {index} out of range [0, {self.row_count})")
+            self._replace_record(index, self.codec.encode(row))
+            return
+
+        if index < 0 or index >= self.max_rows:
+            raise IndexError(f"Index {index} out of range [0, {self.max_rows})")
+
+        self._write_row_bytes(index, row.serialize())
+
+    def _regions(self) -> List[Tuple[int, int]]:
+        """
+        [Step 5.16] Row를 구성하는 바이트 영역들의 (시작 offset, 슬롯 크기)
+
+        Row i의 각 부분은 base + i * stride에 있습니다.
+            - ROWS: [(Header 끝, ROW_SIZE)]
+            - KEY_DIRECTORY: [(Header 끝, KEY_SIZE), (key 배열 끝, PAYLOAD_SIZE)]
+            - SLOTTED: [(Header 끝, SLOT_SIZE)] (Slot 배열만, key는 Slot의 앞 4B)
+        insert_at / remove_at / split_at은 영역마다 한 번씩 slice 이동을 합니다.
+        """
+        if self.is_slotted:
+            return [(Page.HEADER_SIZE, Page.SLOT_SIZE)]
+        if self.leaf_format == LeafFormat.KEY_DIRECTORY:
+            # 배치는 row_limit과 무관하게 page_size로만 정해짐
+            payload_base = Page.HEADER_SIZE + Page.max_rows_for(len(self.data)) * Page.KEY_SIZE
+            return [
+                (Page.HEADER_SIZE, Page.KEY_SIZE),
+                (payload_base, Page.PAYLOAD_SIZE),
+            ]
+        return [(Page.HEADER_SIZE, Page.ROW_SIZE)]
+
+    def _write_row_bytes(self, index: int, blob: bytes):
+        """[Step 5.16] 직렬화된 Row를 index 슬롯에 기록 (영역별로 나눠서)"""
+        pos = 0
+        for base, stride in self._regions():
+            offset = base + index * stride
+            self.data[offset : offset + stride] = blob[pos : pos + stride]
+            pos += stride
+
+    def row_bytes(self, index: int) -> bytes:
+        """[Step 5.16] index 슬롯의 Row를 직렬화된 바이트로 반환 (decode 없음)"""
+        if self.is_slotted:
+            _, offset, length = self._slot(index)
+            return bytes(self.data[offset : offset + length])
+        return b"".join(
+            self.data[base + index * stride : base + (index + 1) * stride]
+            for base, stride in self._regions()
+        )
+
+    def set_rows(self, blobs: List[bytes]):
+        """
+        [Step 5.16] Leaf의 Row 전체를 직렬화된 blobs로 교체 (영역마다 한 번의 slice 대입)
+
+        남는 옛 슬롯은 0으로 채우고 row_count와 Header도 갱신합니다.
+        """
+        if self.is_slotted:
+            self._set_records(blobs)
+            return
+
+        count = len(blobs)
+        if count > self.max_rows:
+            raise OverflowError(f"Page is full (MAX_ROWS={self.max_rows})")
+
+        pos = 0
+        for base, stride in self._regions():
+            end = base + count * stride
+            old_end = base + self.row_count * stride
+            if stride == Page.ROW_SIZE:
+                # ROWS 배치: Row 전체가 한 영역
+                self.data[base:end] = b"".join(blobs)
+            else:
+                self.data[base:end] = b"".join(b[pos : pos + stride] for b in blobs)
+            if old_end > end:
+                self.data[end:old_end] = bytes(old_end - end)
+            pos += stride
+
+        self.row_count = count
+        self._update_header()
 
-        offset = Page.HEADER_SIZE + (index * Page.ROW_SIZE)
-        end = offset + Page.ROW_SIZE
-        self.data[offset:end] = row.serialize()
+    def extend_from(self, src: "Page"):
+        """
+        [Step 5.16] src의 Row 전체를 이 Page 끝에 이어 붙임 (Merge용, decode 없음)
+
+        Raises:
+            OverflowError: 합친 Row 수가 용량을 넘을 때
+        """
+        if self.is_slotted:
+            self._set_records(
+                [self.row_bytes(i) for i in range(self.row_count)]
+                + [src.row_bytes(i) for i in range(src.row_count)]
+            )
+            return
+
+        if self.row_count + src.row_count > self.max_rows:
+            raise OverflowError(f"Page is full (MAX_ROWS={self.max_rows})")
+
+        for (base, stride), (src_base, _) in zip(self._regions(), src._regions()):
+            offset = base + self.row_count * stride
+            size = src.row_count * stride
+            self.data[offset : offset + size] = src.data[src_base : src_base + size]
+
+        self.row_count += src.row_count
+        self._update_header()
 
     def append(self, row: Row) -> bool:
         """
@@ -207,22 +542,433 @@ class Page:
             >>> page.row_count
             1
         """
-        if self.row_count >= Page.MAX_ROWS:
-            raise OverflowError(f"Page is full (MAX_ROWS={Page.MAX_ROWS})")
+        if self.is_slotted:
+            self.insert_at(self.row_count, row)
+            return True
+
+        if self.row_count >= self.max_rows:
+            raise OverflowError(f"Page is full (MAX_ROWS={self.max_rows})")
 
         self.write_at(self.row_count, row)
         self.row_count += 1
         self._update_header()
         return True
 
+    def insert_at(self, index: int, row: Row):
+        """
+        [Step 5.15] index 위치에 Row 삽입 (뒤쪽 Row는 한 번의 slice 대입으로 이동)
+
+        Row를 하나씩 read_at → write_at 하면 Row마다 decode/encode가 일어나므로,
+        [index, row_count) 바이트 구간을 ROW_SIZE만큼 통째로 밀어냅니다. (memmove)
+        row_count와 Header도 함께 갱신합니다.
+
+        Raises:
+            OverflowError: Page가 가득 찬 경우
+            IndexError: index가 [0, row_count] 범위 밖
+        """
+        self.insert_bytes_at(index, self.encode_row(row))
+
+    def insert_bytes_at(self, index: int, blob: bytes):
+        """
+        [Step 5.17] insert_at의 직렬화된 Row 버전 (blob은 encode_row 결과)
+
+        Raises:
+            OverflowError: Page가 가득 찬 경우
+            IndexError: index가 [0, row_count] 범위 밖
+        """
+        if not self.is_slotted and self.row_count >= self.max_rows:
+            raise OverflowError(f"Page is full (MAX_ROWS={self.max_rows})")
+        if index < 0 or index > self.row_count:
+            raise IndexError(f"Index {index} out of range [0, {self.row_count}]")
+        if self.is_slotted:
+            self._insert_record(index, blob)
+            return
+
+        for base, stride in self._regions():
+            offset = base + index * stride
+            end = base + self.row_count * stride
+            self.data[offset + stride : end + stride] = self.data[offset:end]
+        self._write_row_bytes(index, blob)
+
+        self.row_count += 1
+        self._update_header()
+
+    def remove_at(self, index: int):
+        """
+        [Step 5.15] index 위치의 Row 제거 (뒤쪽 Row를 한 번의 slice 대입으로 당김)
+
+        비워진 마지막 슬롯은 0으로 채웁니다. row_count와 Header도 함께 갱신합니다.
+
+        Raises:
+            IndexError: index가 [0, row_count) 범위 밖
+        """
+        if index < 0 or index >= self.row_count:
+            raise IndexError(f"Index {index} out of range [0, {self.row_count})")
+        if self.is_slotted:
+            self._remove_record(index)
+            return
+
+        for base, stride in self._regions():
+            offset = base + index * stride
+            end = base + self.row_count * stride
+            self.data[offset : end - stride] = self.data[offset + stride : end]
+            self.data[end - stride : end] = bytes(stride)
+
+        self.row_count -= 1
+        self._update_header()
+
+    def split_at(self, index: int, dest: "Page"):
+        """
+        [Step 5.15] [index, row_count) 구간의 Row를 빈 dest Page 앞쪽으로 옮김
+
+        옮긴 구간은 한 번의 slice 대입으로 복사하고 원래 자리는 0으로 채웁니다.
+        sibling pointer는 건드리지 않습니다. (호출자가 연결)
+
+        Args:
+            index: 이 Page에 남길 Row 개수
+            dest: Row를 받을 Page (비어 있어야 함)
+        """
+        if index < 0 or index > self.row_count:
+            raise IndexError(f"Index {index} out of range [0, {self.row_count}]")
+        if dest.row_count != 0:
+            raise ValueError("Split destination page must be empty")
+        if self.is_slotted:
+            blobs = [self.row_bytes(i) for i in range(self.row_count)]
+            dest.set_rows(blobs[index:])
+            self.set_rows(blobs[:index])
+            return
+
+        for (base, stride), (dest_base, _) in zip(self._regions(), dest._regions()):
+            offset = base + index * stride
+            end = base + self.row_count * stride
+            size = end - offset
+            dest.data[dest_base : dest_base + size] = self.data[offset:end]
+            self.data[offset:end] = bytes(size)
+
+        dest.row_count = self.row_count - index
+        self.row_count = index
+        dest._update_header()
+        self._update_header()
+
     def read_at(self, row_index: int) -> Row:
         """
         Page내에서 target index Row를 읽는다.
+
+        [Step 5.3] 슬라이스 복사 없이 self.data에서 직접 언팩합니다.
         """
+        if self.is_slotted:
+            return self.codec.decode_from(self.data, self._slot(row_index)[1])
+        if self.leaf_format == LeafFormat.KEY_DIRECTORY:
+            return Row.deserialize(self.row_bytes(row_index))
         offset = Page.HEADER_SIZE + (row_index * Page.ROW_SIZE)
-        end = offset + Page.ROW_SIZE
-        raw_data = self.data[offset:end]
-        return Row.deserialize(raw_data)
+        return Row.deserialize_from(self.data, offset)
+
+    def key_at(self, row_index: int) -> int:
+        """
+        [Step 5.8] row_index 위치 Row의 키(user_id)만 읽기 (Row 객체 생성 없음)
+        """
+        # key는 모든 배치에서 첫 영역의 앞 4바이트 (SLOTTED는 Slot의 앞 4바이트)
+        base, stride = self._regions()[0]
+        return self.key_struct.unpack_from(self.data, base + row_index * stride)[0]
+
+    def keys(self) -> Tuple[int, ...]:
+        """[Step 5.16] Leaf의 모든 key (KEY_DIRECTORY면 unpack_from 한 번)"""
+        if self.leaf_format == LeafFormat.KEY_DIRECTORY:
+            return struct.unpack_from(f"<{self.row_count}i", self.data, Page.HEADER_SIZE)
+        if self.is_slotted:
+            return struct.unpack_from("<" + "i4x" * self.row_count, self.data, Page.HEADER_SIZE)
+        return tuple(self.key_at(i) for i in range(self.row_count))
+
+    def projector(self, columns: Sequence[str]) -> Callable[[int], tuple]:
+        """
+        [Step 5.19] Projection: row_index → columns 값만 담은 tuple
+
+        read_at과 달리 Row 객체를 만들지 않고, 요청한 컬럼만 raw bytes에서 unpack_from으로
+        읽습니다. 요청하지 않은 문자열 컬럼은 decode하지 않습니다.
+            - key만 요청: key 영역에서 "<i" 하나 (key_at과 같음)
+            - SLOTTED: Slot의 record offset → codec.projector
+            - ROWS / KEY_DIRECTORY: 고정 Row의 필드 offset (_compile_fixed_projector)
+
+        Raises:
+            ValueError: 없는 컬럼 이름
+        """
+        columns = tuple(columns)
+        data = self.data
+        if columns == self.codec.names[:1]:
+            unpack_from = self.key_struct.unpack_from
+            base, stride = self._regions()[0]
+            return lambda index: unpack_from(data, base + index * stride)
+
+        if self.is_slotted:
+            project = self.codec.projector(columns)
+            slot_from = self.slot_struct.unpack_from
+            return lambda index: project(
+                data, slot_from(data, Page.HEADER_SIZE + index * Page.SLOT_SIZE)[1]
+            )
+
+        cache_key = (self.leaf_format, len(self.data), columns)
+        project = Page._fixed_projectors.get(cache_key)
+        if project is None:
+            project = self._compile_fixed_projector(columns)
+            Page._fixed_projectors[cache_key] = project
+        return lambda index: project(data, index)
+
+    def to_array(self, start_key: int, end_key: int):
+        """
+        [Step 5.20] [start_key, end_key] 범위의 Row들 → NumPy structured array (Row.NUMPY_FIELDS)
+
+        Row 객체 없이 np.frombuffer로 페이지 본문을 그대로 보고, searchsorted로 범위를 자릅니다.
+            - ROWS: Row 배열이 그대로 dtype과 같으므로 frombuffer 한 번
+            - KEY_DIRECTORY: key 배열 / payload 배열을 각각 frombuffer 후 필드 단위로 복사
+        반환 배열은 복사본입니다. (페이지는 Buffer Pool에서 수정 / 교체되고,
+        mmap 버퍼는 export된 view가 남아 있으면 닫거나 늘릴 수 없음)
+
+        Raises:
+            ValueError: SLOTTED Leaf (가변 길이 Record는 고정 dtype에 대응하지 않음)
+            ImportError: numpy가 설치되지 않았을 때
+        """
+        if self.is_slotted:
+            raise ValueError(
+                "SLOTTED leaves hold variable-length records; use scan(columns=...) instead"
+            )
+        np = _numpy()
+        dtype = np.dtype(list(Row.NUMPY_FIELDS))
+        count = self.row_count
+        if self.leaf_format == LeafFormat.KEY_DIRECTORY:
+            keys = np.frombuffer(self.data, "<i4", count=count, offset=Page.HEADER_SIZE)
+        else:
+            rows = np.frombuffer(self.data, dtype, count=count, offset=Page.HEADER_SIZE)
+            keys = rows["user_id"]
+
+        # 범위 밖 Python int는 int32로 변환되지 않으므로 키 범위로 제한
+        lo = int(keys.searchsorted(max(start_key, -(2**31)), side="left"))
+        hi = int(keys.searchsorted(min(end_key, 2**31 - 1), side="right"))
+        if self.leaf_format != LeafFormat.KEY_DIRECTORY:
+            return rows[lo:hi].copy()
+
+        payload_base = self._regions()[1][0]
+        payload = np.frombuffer(
+            self.data, np.dtype(list(Row.NUMPY_FIELDS[1:])), count=count, offset=payload_base
+        )
+        batch = np.empty(max(hi - lo, 0), dtype)
+        batch["user_id"] = keys[lo:hi]
+        for name, _ in Row.NUMPY_FIELDS[1:]:
+            batch[name] = payload[name][lo:hi]
+        return batch
+
+    def _compile_fixed_projector(self, columns: Tuple[str, ...]) -> Callable:
+        """
+        [Step 5.19] 고정 길이 Row 배치용 project(data, index) 소스 생성
+
+        Row 필드의 offset(Row.STRUCT_FORMAT 기준)을 _regions()의 영역에 나눠 배치하고,
+        영역마다 요청한 필드만 담은 Struct(사이는 pad "x")로 unpack_from 한 번씩 합니다.
+        """
+        fields = {
+            "user_id": (0, "i"),
+            "username": (Row.ID_SIZE, f"{Row.USERNAME_SIZE}s"),
+            "email": (Row.ID_SIZE + Row.USERNAME_SIZE, f"{Row.EMAIL_SIZE}s"),
+        }
+        unknown = [name for name in columns if name not in fields]
+        if unknown:
+            raise ValueError(f"Unknown columns {unknown} (columns: {Row.FIELDS})")
+
+        wanted = sorted(set(columns), key=lambda name: fields[name][0])
+        lines = ["def project(data, index):"]
+        namespace = {}
+        start = 0
+        for r, (base, stride) in enumerate(self._regions()):
+            items = [
+                (fields[name][0] - start, fields[name][1], name)
+                for name in wanted
+                if start <= fields[name][0] < start + stride
+            ]
+            start += stride
+            if not items:
+                continue
+            fmt, pos = "<", 0
+            for offset, code, _ in items:
+                if offset > pos:
+                    fmt += f"{offset - pos}x"
+                fmt += code
+                pos = offset + struct.calcsize("<" + code)
+            namespace[f"unpack{r}"] = struct.Struct(fmt).unpack_from
+            lines.append(
+                f"    {', '.join(name for _, _, name in items)}, = "
+                f"unpack{r}(data, {base} + index * {stride})"
+            )
+        for name in wanted:
+            if fields[name][1].endswith("s"):
+                lines.append(f"    {name} = {name}.rstrip(b'\\x00').decode('utf-8')")
+        lines.append(f"    return ({', '.join(columns)},)")
+
+        exec("\n".join(lines), namespace)
+        return namespace["project"]
+
+    def search(self, key: int) -> Tuple[int, bool]:
+        """
+        [Step 5.8] Leaf 안에서 key를 이진 탐색 (raw bytes에서 키만 읽음)
+
+        Returns:
+            (index, found):
+                - index: key 이상인 첫 Row의 위치 (bisect_left와 동일)
+                - found: 그 위치의 키가 key와 같은지
+        """
+        if self.leaf_format == LeafFormat.KEY_DIRECTORY:
+            # [Step 5.16] 연속된 key 배열을 int32 배열로 보고 C 레벨 bisect
+            # (Little-endian 머신이면 복사 없이 memoryview.cast, 아니면 한 번에 언팩)
+            if sys.byteorder == "little":
+                end = Page.HEADER_SIZE + self.row_count * Page.KEY_SIZE
+                keys = memoryview(self.data)[Page.HEADER_SIZE : end].cast("i")
+            else:
+                keys = self.keys()
+            lo = bisect.bisect_left(keys, key)
+            return lo, lo < len(keys) and keys[lo] == key
+
+        unpack_from = self.key_struct.unpack_from
+        data = self.data
+        base, stride = self._regions()[0]
+        lo, hi = 0, self.row_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if unpack_from(data, base + mid * stride)[0] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        found = lo < self.row_count and self.key_at(lo) == key
+        return lo, found
+
+    def compact(self):
+        """
+        [Step 5.17] Record 사이의 구멍을 없애 빈 공간을 하나로 모음 (SLOTTED 전용)
+
+        삭제나 길이가 바뀐 update로 생긴 구멍은 FreeSpace에 포함되지 않으므로,
+        연속 빈 공간이 모자랄 때 insert가 자동으로 호출합니다.
+        고정 길이 배치는 항상 빈틈이 없으므로 아무 일도 하지 않습니다.
+        """
+        if self.is_slotted:
+            self._set_records([self.row_bytes(i) for i in range(self.row_count)])
+
+    @property
+    def fragmented_bytes(self) -> int:
+        """[Step 5.17] compact()로 회수할 수 있는 구멍의 크기"""
+        if not self.is_slotted:
+            return 0
+        return self.capacity_bytes - self.used_bytes - self._free_space
+
+    def _slot(self, index: int) -> Tuple[int, int, int]:
+        """[Step 5.17] index번 Slot의 (key, record offset, record length)"""
+        return self.slot_struct.unpack_from(
+            self.data, Page.HEADER_SIZE + index * Page.SLOT_SIZE
+        )
+
+    def _record_lengths(self) -> Tuple[int, ...]:
+        """[Step 5.17] 모든 Record의 길이 (Slot 배열에서 unpack_from 한 번)"""
+        return struct.unpack_from("<" + "6xH" * self.row_count, self.data, Page.HEADER_SIZE)
+
+    def _heap_start(self) -> int:
+        """[Step 5.17] Record 영역의 시작 offset (= Slot 배열 끝 + FreeSpace)"""
+        return Page.HEADER_SIZE + self.row_count * Page.SLOT_SIZE + self._free_space
+
+    def _set_records(self, blobs: List[bytes]):
+        """
+        [Step 5.17] Slotted Leaf 본문을 blobs로 다시 씀 (구멍 없이 페이지 끝부터 채움)
+
+        본문을 새로 만들어 한 번에 대입하므로, 용량을 넘으면 Page는 바뀌지 않습니다.
+        """
+        count = len(blobs)
+        used = count * Page.SLOT_SIZE + sum(len(blob) for blob in blobs)
+        if used > self.capacity_bytes:
+            raise OverflowError(
+                f"Page is full ({used} > {self.capacity_bytes} bytes)"
+            )
+
+        body = bytearray(self.capacity_bytes)
+        offset = len(self.data)
+        for i, blob in enumerate(blobs):
+            offset -= len(blob)
+            body[offset - Page.HEADER_SIZE : offset - Page.HEADER_SIZE + len(blob)] = blob
+            key = self.key_struct.unpack_from(blob, 0)[0]
+            self.slot_struct.pack_into(body, i * Page.SLOT_SIZE, key, offset, len(blob))
+        self.data[Page.HEADER_SIZE :] = body
+
+        self.row_count = count
+        self._free_space = offset - (Page.HEADER_SIZE + count * Page.SLOT_SIZE)
+        self._update_header()
+
+    def _insert_record(self, index: int, blob: bytes):
+        """[Step 5.17] Record를 Heap 앞에 쓰고 Slot 배열의 index 자리에 Slot 삽입"""
+        cost = len(blob) + Page.SLOT_SIZE
+        if cost > self._free_space:
+            if self.used_bytes + cost > self.capacity_bytes:
+                raise OverflowError(
+                    f"Page is full ({self.used_bytes} + {cost} > {self.capacity_bytes} bytes)"
+                )
+            self.compact()
+
+        heap_start = self._heap_start()
+        offset = heap_start - len(blob)
+        self.data[offset:heap_start] = blob
+
+        slot = Page.HEADER_SIZE + index * Page.SLOT_SIZE
+        end = Page.HEADER_SIZE + self.row_count * Page.SLOT_SIZE
+        self.data[slot + Page.SLOT_SIZE : end + Page.SLOT_SIZE] = self.data[slot:end]
+        key = self.key_struct.unpack_from(blob, 0)[0]
+        self.slot_struct.pack_into(self.data, slot, key, offset, len(blob))
+
+        self.row_count += 1
+        self._free_space -= cost
+        self._update_header()
+
+    def _remove_record(self, index: int):
+        """
+        [Step 5.17] index번 Slot 제거
+
+        Record가 Heap 맨 앞이면 바로 빈 공간으로 돌려주고,
+        아니면 구멍으로 남겨 두었다가 compact() 때 회수합니다.
+        """
+        _, offset, length = self._slot(index)
+        heap_start = self._heap_start()
+
+        slot = Page.HEADER_SIZE + index * Page.SLOT_SIZE
+        end = Page.HEADER_SIZE + self.row_count * Page.SLOT_SIZE
+        self.data[slot : end - Page.SLOT_SIZE] = self.data[slot + Page.SLOT_SIZE : end]
+        self.data[end - Page.SLOT_SIZE : end] = bytes(Page.SLOT_SIZE)
+        self.data[offset : offset + length] = bytes(length)
+
+        self._free_space += Page.SLOT_SIZE
+        if offset == heap_start:
+            self._free_space += length
+        self.row_count -= 1
+        self._update_header()
+
+    def _replace_record(self, index: int, blob: bytes):
+        """
+        [Step 5.17] index번 Record를 blob으로 교체 (key는 같다고 가정)
+
+        - 같거나 짧아지면 제자리에 덮어씀 (남는 꼬리는 구멍)
+        - 길어지면 Heap 앞에 새로 쓰고 옛 Record는 구멍으로
+        - 연속 빈 공간도 모자라면 compact하며 교체 (그래도 넘치면 OverflowError)
+        """
+        key, offset, length = self._slot(index)
+        slot = Page.HEADER_SIZE + index * Page.SLOT_SIZE
+
+        if len(blob) <= length:
+            self.data[offset : offset + len(blob)] = blob
+            self.data[offset + len(blob) : offset + length] = bytes(length - len(blob))
+            self.slot_struct.pack_into(self.data, slot, key, offset, len(blob))
+        elif len(blob) <= self._free_space:
+            heap_start = self._heap_start()
+            new_offset = heap_start - len(blob)
+            self.data[new_offset:heap_start] = blob
+            self.data[offset : offset + length] = bytes(length)
+            self.slot_struct.pack_into(self.data, slot, key, new_offset, len(blob))
+            self._free_space -= len(blob)
+            self._update_header()
+        else:
+            blobs = [self.row_bytes(i) for i in range(self.row_count)]
+            blobs[index] = blob
+            self._set_records(blobs)
 
     def read_internal_node(self) -> Tuple[List[int], List[int]]:
         """
@@ -233,11 +979,27 @@ class Page:
             return BTreeNode.deserialize_internal(self.data[Page.HEADER_SIZE :])
         raise TypeError("Not an Internal page")
 
+    def internal_node(self) -> Tuple[array, array]:
+        """
+        [Step 5.13] 탐색용 (keys, pids) - 한 번 디코딩한 결과를 Page에 캐시
+
+        Page 객체가 Buffer Pool에 남아 있는 동안 Root / 상위 레벨은 한 번만 디코딩됩니다.
+        반환값은 캐시 자체이므로 수정하면 안 됩니다. (수정용은 read_internal_node)
+        """
+        if self._internal_cache is None:
+            if self.is_leaf:
+                raise TypeError("Not an Internal page")
+            self._internal_cache = BTreeNode.decode_internal(
+                self.data[Page.HEADER_SIZE :]
+            )
+        return self._internal_cache
+
     def write_internal_node(self, keys: List[int], pids: List[int]):
         """
         Internal Page에 keys, pids 쓰기
         """
         if not self.is_leaf:
+            self._internal_cache = None
             body = BTreeNode.serialize_internal(keys, pids)
             # Header(9 bytes) 이후에 덮어쓰기
             self.data[Page.HEADER_SIZE : Page.HEADER_SIZE + len(body)] = body
@@ -1,18 +1,195 @@
 import pathlib
 import os
+import struct
+import threading
+import time
 
-from src.page import Page, PageType
+from src.node import BTreeNode
+from src.page import INVALID_PAGE_ID, LeafFormat, Page, PageType
+from src.schema import ROW_CODEC, Schema
+from src.superblock import Superblock
+from src.wal import WriteAheadLog
 from io import BufferedRandom
-from typing import Optional, Union
+from collections import OrderedDict
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import ClassVar, Dict, Iterator, List, Optional, Tuple, Union
+
+
+class SyncPolicy(IntEnum):
+    """
+    [Step 5.2] Durability 정책 (dirty 페이지를 언제 디스크로 내보낼 것인가)
+
+    WRITE: write_page마다 즉시 기록 + flush (Phase 3 방식, 가장 안전/가장 느림)
+    BATCH: sync()/close() 호출 시에만 한 번에 기록 (Bulk Insert용)
+    INTERVAL: 마지막 sync 이후 sync_interval_ms가 지나면 write_page가 sync() 수행
+    """
+
+    WRITE = 1
+    BATCH = 2
+    INTERVAL = 3
+
+
+class Latch:
+    """
+    [Step 5.25] 읽기/쓰기 Latch (여러 shared 또는 exclusive 하나)
+
+    threading에는 RW Lock이 없으므로 Lock 두 개로 구현합니다. (Reader 우선)
+        - _write: exclusive 한 명 또는 shared 전체가 잡고 있음
+        - _count: shared 수를 세는 구간 (첫 shared가 _write를 잡고 마지막 shared가 놓음)
+    Frame마다 하나씩 생기므로 Condition보다 가벼운 Lock만 사용합니다.
+    """
+
+    __slots__ = ("_write", "_count", "_readers")
+
+    def __init__(self):
+        self._write = threading.Lock()
+        self._count = threading.Lock()
+        self._readers: int = 0
+
+    def acquire_shared(self):
+        with self._count:
+            self._readers += 1
+            if self._readers == 1:
+                self._write.acquire()
+
+    def release_shared(self):
+        with self._count:
+            self._readers -= 1
+            if self._readers == 0:
+                self._write.release()
+
+    def acquire_exclusive(self, blocking: bool = True) -> bool:
+        """
+        Args:
+            blocking: False면 바로 잡을 수 없을 때 기다리지 않고 False 반환
+        """
+        return self._write.acquire(blocking)
+
+    def release_exclusive(self):
+        self._write.release()
+
+    def wait(self):
+        """지금 잡고 있는 스레드가 놓을 때까지 기다림 (Latch는 잡지 않음)"""
+        self.acquire_shared()
+        self.release_shared()
+
+
+class Frame:
+    """
+    [Step 5.1] Buffer Pool의 한 칸 (Frame)
+
+    Attributes:
+        page: 메모리에 올라와 있는 Page 객체
+        pin_count: 현재 이 페이지를 사용 중인 작업 수 (0보다 크면 Eviction 금지)
+        is_dirty: 디스크 내용과 달라졌는지 여부 (Eviction/close 시 Write-back 대상)
+        loading: [Step 5.25] 디스크에서 읽는 중 (읽는 스레드가 latch를 exclusive로 잡고 있음)
+        latch: [Step 5.25] 페이지 I/O와 latched() 사용 구간을 보호하는 Latch
+    """
+
+    __slots__ = ("page", "pin_count", "is_dirty", "loading", "latch")
+
+    def __init__(self, page: Optional[Page], is_dirty: bool = False):
+        self.page: Optional[Page] = page
+        self.pin_count: int = 0
+        self.is_dirty: bool = is_dirty
+        self.loading: bool = False
+        self.latch: Latch = Latch()
 
 
 class Pager:
     """
     [Phase 3] Disk Persistence
     파일 시스템과 직접 통신하며 Page 단위로 데이터를 읽고 씁니다.
+
+    [Step 5.1] Buffer Pool
+    - 최대 pool_size개의 Frame을 메모리에 유지 (LRU 순서: OrderedDict)
+    - read_page: Pool에 있으면 디스크 I/O 없이 반환 (Hit)
+    - write_page: 디스크에 바로 쓰지 않고 Frame을 dirty로 표시만 함
+    - Eviction 또는 close() 시점에 dirty Frame만 디스크로 Write-back
+    - pin()된 Frame은 Eviction 대상에서 제외 (Split 도중인 페이지 보호)
+
+    [Step 5.2] Write-back
+    - sync(): dirty Frame을 PID 순으로 정렬하고, 연속된 PID는 한 번의 write로 묶음
+    - sync_policy로 기록 시점 선택 (SyncPolicy 참고)
+
+    [Step 5.5] Free-list (SQLite식 Trunk chain)
+    - free_page(pid): 반납된 PID를 Trunk Page의 목록에 추가
+    - get_new_page_id(): 파일을 늘리기 전에 Free-list에서 먼저 꺼내 씀
+    - Trunk Page 구조: Header(row_count = 항목 수, next = 다음 Trunk) + PID 배열(4B each)
+    - 첫 Trunk PID는 Superblock.free_list_head에 저장
+
+    [Step 5.7] Page 크기
+    - 파일마다 page_size를 가짐 (생성 시 지정, Superblock에 기록)
+    - Superblock이 있는 파일을 열면 인자와 관계없이 파일에 기록된 값을 사용
+    - 노드 용량은 항상 page_size에서 유도 (파일 배치도 그 값 기준)
+    - row_limit / key_limit: 이 Pager로 여는 동안만 Leaf / Internal을 더 일찍 가득 찬 것으로 봄
+      (작은 트리로 Split / Merge를 시험할 때, 파일 배치와 Superblock에는 영향 없음)
+
+    [Step 5.16] Leaf 배치 (LeafFormat)
+    - page_size와 같은 방식으로 파일마다 정하고 Superblock에 기록
+    - Pager가 만들거나 읽어온 Page에 leaf_format을 전달
+
+    [Step 5.18] Schema / Record Codec
+    - 파일마다 Schema를 가질 수 있고 Superblock에 기록 (없으면 기본 Row 테이블)
+    - 열 때 한 번 compile한 codec을 Page에 전달 (Schema 테이블은 SLOTTED 필수)
+
+    [Step 5.21] Write-Ahead Log (wal=True)
+    - 페이지 기록(_write_run / _write_to_disk / Superblock)은 DB 파일 대신 WAL Frame으로
+    - sync() = Commit (Superblock Frame에 commit 표시 + 로그 fsync 한 번, Group Commit)
+    - 로그가 checkpoint_pages Frame 이상이면 sync 후 Checkpoint (DB 파일 반영)
+    - 열 때 남은 로그가 있으면 wal 인자와 관계없이 먼저 Recovery
+
+    [Step 5.22] Transaction (begin / commit / rollback)
+    - begin: 이전 변경을 sync로 확정하고 Superblock 스냅샷 (WAL이면 로그 위치도) 저장
+    - WAL 모드 또는 Copy-on-Write([Step 5.23])에서만 (Commit이 원자적인 경우)
+    - 트랜잭션 중 Eviction된 dirty 페이지는 DB 파일에 쓰지 않음
+      (WAL이면 커밋 표시 없는 Frame, Copy-on-Write면 Commit 전까지 보이지 않는 새 물리 페이지)
+    - sync()는 commit까지 미룸 → 여러 연산이 fsync 한 번으로 확정
+    - rollback: Pool / 로그 Frame을 버리고 Superblock 복원
+
+    [Step 5.25] Thread-safe Buffer Pool
+    - 디스크 I/O는 모두 os.pread / os.pwrite (공유 파일 위치 없음 → seek 경쟁 없음)
+    - mapping lock(_lock): frames / LRU 순서 / pin_count / 통계만 보호, I/O 중에는 잡지 않음
+    - Page Fault: 빈 Frame을 exclusive latch로 먼저 등록하고 lock 밖에서 읽음
+      → 서로 다른 페이지는 동시에 읽고(GIL은 I/O 동안 풀림), 같은 페이지는 한 번만 읽음
+    - Eviction: 떼어낸 dirty Frame은 _evicting에 둔 채 lock 밖에서 Write-back
+      (끝날 때까지 그 PID는 다시 읽지 않음 → 옛 내용을 읽는 일 없음)
+    - latched(pid, exclusive): pin + Frame latch (여러 스레드가 같은 페이지를 읽고 고칠 때)
+    - sync / 트랜잭션은 _sync_lock으로 직렬화, Commit / rollback 동안 Write-back은 _io_gate에서 대기
+    - B+Tree 연산(BTreeManager)은 여전히 Writer 하나 (Reader는 [Step 5.24] Snapshot 사용)
     """
 
-    def __init__(self, filename: str):
+    DEFAULT_POOL_SIZE: ClassVar[int] = 256
+    _pid_struct: ClassVar[struct.Struct] = struct.Struct("<I")
+    DEFAULT_SYNC_INTERVAL_MS: ClassVar[int] = 1000
+    # [Step 5.21] 이 Frame 수를 넘으면 Checkpoint (SQLite 기본값과 같음)
+    DEFAULT_CHECKPOINT_PAGES: ClassVar[int] = 1000
+    # [Step 5.23] Copy-on-Write(Page Map) 파일을 열 수 있는지 (ShadowPager만 True)
+    SUPPORTS_PAGE_MAP: ClassVar[bool] = False
+    # [Step 5.22] WAL 없이도 Commit이 원자적인지 (ShadowPager만 True)
+    ATOMIC_COMMIT: ClassVar[bool] = False
+
+    def __init__(
+        self,
+        filename: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        sync_policy: SyncPolicy = SyncPolicy.BATCH,
+        sync_interval_ms: int = DEFAULT_SYNC_INTERVAL_MS,
+        page_size: int = Page.PAGE_SIZE,
+        leaf_format: LeafFormat = LeafFormat.ROWS,
+        schema: Optional[Schema] = None,
+        wal: bool = False,
+        checkpoint_pages: int = DEFAULT_CHECKPOINT_PAGES,
+        row_limit: Optional[int] = None,
+        key_limit: Optional[int] = None,
+    ):
+        if page_size not in Page.SUPPORTED_PAGE_SIZES:
+            raise ValueError(
+                f"Unsupported page size {page_size} "
+                f"(choose from {Page.SUPPORTED_PAGE_SIZES})"
+            )
+
         self.file_path: pathlib.Path = pathlib.Path(filename)
         # 1. 파일이 존재하는지 확인 (os.path.exists)
         # 2. 없으면 빈 파일 생성 ('wb' 모드로 열었다 닫기)
@@ -22,14 +199,197 @@ class Pager:
                 pass
 
         self.file: BufferedRandom = self.file_path.open("rb+")
+        # [Step 5.25] 페이지 I/O는 이 fd에 pread / pwrite (self.file은 수명 관리용)
+        self.fd: int = self.file.fileno()
+
+        # [Step 5.21] 지난번 크래시로 남은 WAL을 먼저 반영 (Superblock도 로그에 있을 수 있음)
+        wal_path = WriteAheadLog.path_for(self.file_path)
+        try:
+            self.recovered_pages: int = WriteAheadLog.recover(wal_path, self.file)
+        except ValueError:
+            self.file.close()
+            raise
+
+        # [Step 5.4] 0번 페이지가 Superblock이면 로드 (page_count도 Superblock 기준)
+        # [Step 5.7] page_size도 Superblock 기준 (앞부분만 읽으면 알 수 있음)
+        self.superblock: Optional[Superblock] = None
+        self.page_size: int = page_size
+        self.leaf_format: LeafFormat = LeafFormat(leaf_format)
+        self.schema: Optional[Schema] = schema
+        head = os.pread(self.fd, Superblock.SIZE, 0)
+        if len(head) == Superblock.SIZE and Superblock.is_superblock(head):
+            # [Step 5.18] Schema가 고정 필드 뒤에 있으므로 0번 페이지 전체를 읽음
+            self.superblock = Superblock.deserialize(
+                os.pread(self.fd, Superblock.peek_page_size(head), 0)
+            )
+            self.page_size = self.superblock.page_size
+            self.leaf_format = self.superblock.leaf_format
+            self.schema = self.superblock.schema
+
+        # [Step 5.18] Schema 전용 codec은 파일을 열 때 한 번만 생성
+        self.codec = ROW_CODEC if self.schema is None else self.schema.compile()
+        # [Step 5.7] 용량 축소 (None이면 page_size에서 유도한 용량 그대로)
+        self.row_limit: Optional[int] = row_limit
+        self.key_limit: Optional[int] = key_limit
+        error = None
+        if self.schema is not None and self.leaf_format != LeafFormat.SLOTTED:
+            error = "A table schema requires LeafFormat.SLOTTED leaves"
+        elif (
+            self.superblock is not None
+            and self.superblock.page_map_root != INVALID_PAGE_ID
+            and not self.SUPPORTS_PAGE_MAP
+        ):
+            error = "File uses copy-on-write pages; open it with ShadowPager"
+        elif self.codec.max_size > Page.max_record_size(self.page_size):
+            error = (
+                f"Record size {self.codec.max_size} exceeds "
+                f"{Page.max_record_size(self.page_size)} bytes for page size {self.page_size}"
+            )
+        else:
+            # [Step 5.7] 용량 축소는 page_size에서 유도한 용량 이하만 허용
+            body_size = self.page_size - Page.HEADER_SIZE
+            for name, limit, capacity in (
+                ("row_limit", row_limit, Page.max_rows_for(self.page_size)),
+                ("key_limit", key_limit, BTreeNode.max_keys_for(body_size)),
+            ):
+                if limit is not None and not 2 <= limit <= capacity:
+                    error = f"{name} must be in [2, {capacity}], got {limit}"
+        if error is not None:
+            self.file.close()
+            raise ValueError(error)
 
         # [Step 4.1.3] 현재 파일의 페이지 개수 계산
         file_size = self.file_path.stat().st_size
-        if file_size % Page.PAGE_SIZE != 0:
-            # 경고: 파일 크기가 4KB 배수가 아님 (손상 가능성)
+        if file_size % self.page_size != 0:
+            # 경고: 파일 크기가 page_size 배수가 아님 (손상 가능성)
             # 여기서는 일단 내림 혹은 올림 처리가 필요하나, 단순하게 처리
             pass
-        self.page_count: int = file_size // Page.PAGE_SIZE
+        self.page_count: int = file_size // self.page_size
+        if self.superblock is not None:
+            self.page_count = self.superblock.page_count
+
+        # [Step 5.5] Trunk 한 장에 담을 수 있는 PID 개수
+        self.free_trunk_capacity: int = (
+            self.page_size - Page.HEADER_SIZE
+        ) // self._pid_struct.size
+
+        # [Step 5.1] Buffer Pool (PID → Frame, 앞쪽이 가장 오래 안 쓰인 Frame)
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be >= 1, got {pool_size}")
+        self.pool_size: int = pool_size
+        self.frames: "OrderedDict[int, Frame]" = OrderedDict()
+
+        # [Step 5.25] 동시성 제어
+        # mapping lock: frames / _evicting / pin_count / page_count / 통계 (짧게만 잡음)
+        self._lock = threading.Lock()
+        # Frame이 풀렸을 때(pin 해제 / 읽기 완료 / 기록 완료) 자리를 기다리던 스레드를 깨움
+        self._frame_released = threading.Condition(self._lock)
+        # sync / flush_page가 기록하려고 잠시 pin한 Frame 수 (곧 풀리므로 Pool 고갈이 아님)
+        self._flushing: int = 0
+        # Write-back 중인 Frame (PID → Frame, 기록이 끝날 때까지 그 PID는 다시 읽지 않음)
+        self._evicting: Dict[int, Frame] = {}
+        # Write-back은 shared, Commit / rollback은 exclusive (확정 전에 진행 중인 기록을 기다림)
+        self._io_gate = Latch()
+        # sync / begin / commit / rollback / close 직렬화
+        self._sync_lock = threading.RLock()
+        # Free-list 할당 / 반납 (Trunk 페이지 읽고 쓰기)
+        self._alloc_lock = threading.RLock()
+
+        # [Step 5.2] Durability 정책
+        self.sync_policy: SyncPolicy = SyncPolicy(sync_policy)
+        self.sync_interval_ms: int = sync_interval_ms
+        self._last_sync: float = time.monotonic()
+
+        # [Step 5.21] Write-Ahead Log (None이면 DB 파일에 직접 기록)
+        self.wal: Optional[WriteAheadLog] = (
+            WriteAheadLog(wal_path, self.page_size) if wal else None
+        )
+        self.checkpoint_pages: int = checkpoint_pages
+
+        # [Step 5.22] 진행 중인 트랜잭션 (None이면 자동 커밋 모드)
+        self._txn_snapshot: Optional[bytes] = None
+        self._txn_wal_mark = None
+
+        # 통계 (Hit/Miss 측정용)
+        self.hit_count: int = 0
+        self.miss_count: int = 0
+        self.sync_count: int = 0
+
+    @property
+    def in_transaction(self) -> bool:
+        """[Step 5.22] begin() 이후 commit / rollback 전인지"""
+        return self._txn_snapshot is not None
+
+    def begin(self):
+        """
+        [Step 5.22] 트랜잭션 시작
+
+        Raises:
+            RuntimeError: 이미 트랜잭션 중이거나 Superblock이 없는 파일,
+                또는 WAL / Copy-on-Write가 아니어서 Commit을 원자적으로 할 수 없을 때
+        """
+        with self._sync_lock:
+            if self.in_transaction:
+                raise RuntimeError("Transaction already in progress")
+            if self.superblock is None:
+                raise RuntimeError("Transactions require a superblock")
+            if self.wal is None and not self.ATOMIC_COMMIT:
+                raise RuntimeError("Transactions require wal=True or copy-on-write")
+
+            # 이전 변경을 먼저 확정 → 이후 dirty 페이지는 모두 이 트랜잭션의 것
+            self.sync()
+            self._txn_snapshot = self.superblock.serialize()
+            if self.wal is not None:
+                self._txn_wal_mark = self.wal.mark()
+
+    def commit(self):
+        """
+        [Step 5.22] 트랜잭션의 변경을 한 번에 확정
+
+        sync() 한 번 (WAL이면 commit Frame 하나, CoW면 Superblock 교체로 원자적 반영)
+        """
+        with self._sync_lock:
+            if not self.in_transaction:
+                raise RuntimeError("No transaction in progress")
+
+            self._txn_snapshot = None
+            self._txn_wal_mark = None
+            lsn = self._write_commit()
+        self._make_durable(lsn)
+
+    def rollback(self):
+        """
+        [Step 5.22] 트랜잭션의 변경을 모두 버림
+
+        트랜잭션 중 읽은 페이지도 로그 Frame / 새 물리 페이지에서 왔을 수 있으므로
+        Pool 전체를 비우고, 다음 접근부터 확정된 내용을 다시 읽습니다.
+
+        [Step 5.25] 진행 중인 Write-back이 끝난 뒤에 버림 (늦게 끝난 기록이 되살아나지 않도록)
+
+        Raises:
+            RuntimeError: 트랜잭션 중이 아니거나 pin된 페이지가 남아 있을 때
+        """
+        with self._sync_lock:
+            if not self.in_transaction:
+                raise RuntimeError("No transaction in progress")
+
+            self._io_gate.acquire_exclusive()
+            try:
+                with self._lock:
+                    if any(
+                        frame.pin_count > 0 or frame.loading
+                        for frame in self.frames.values()
+                    ):
+                        raise RuntimeError("Cannot roll back while pages are pinned")
+                    self.frames.clear()
+                if self.wal is not None:
+                    self.wal.rollback_to(self._txn_wal_mark)
+                self.superblock = Superblock.deserialize(self._txn_snapshot)
+                self.page_count = self.superblock.page_count
+                self._txn_snapshot = None
+                self._txn_wal_mark = None
+            finally:
+                self._io_gate.release_exclusive()
 
     def get_new_page_id(self) -> int:
         """
@@ -38,42 +398,676 @@ class Pager:
         Disk에 공간을 바로 확보하지는 않고, 논리적인 ID만 발급합니다.
         실제 파일 크기 증가는 write_page()가 호출될 때 일어납s.
 
+        [Step 5.5] Free-list에 반납된 페이지가 있으면 그것을 먼저 재사용합니다.
+
         Returns:
             int: 새로 할당된 PID
         """
-        pid = self.page_count
-        self.page_count += 1
-        return pid
+        with self._alloc_lock:
+            if (
+                self.superblock is not None
+                and self.superblock.free_list_head != INVALID_PAGE_ID
+            ):
+                return self._pop_free_page()
+
+            with self._lock:
+                pid = self.page_count
+                self.page_count += 1
+            return pid
+
+    def free_page(self, page_index: int):
+        """
+        [Step 5.5] 더 이상 쓰지 않는 페이지를 Free-list에 반납합니다.
+
+        동작:
+            1. 첫 Trunk에 자리가 있으면 PID를 Trunk 목록 끝에 추가
+            2. 없으면(또는 Trunk가 없으면) 반납된 페이지 자체를 새 Trunk로 만듦
+            3. 반납된 페이지의 Frame은 Pool에서 버림 (내용은 더 이상 의미 없음)
+
+        Raises:
+            RuntimeError: Superblock이 없는 파일 (Free-list head를 저장할 곳 없음)
+            ValueError: Superblock 페이지이거나 할당된 적 없는 PID
+        """
+        if self.superblock is None:
+            raise RuntimeError("Free-list requires a superblock")
+        if page_index == Superblock.PAGE_ID or page_index >= self.page_count:
+            raise ValueError(f"Cannot free page {page_index}")
+
+        with self._alloc_lock:
+            self._discard(page_index)
+            head = self.superblock.free_list_head
+
+            if head != INVALID_PAGE_ID:
+                trunk = self.read_page(head)
+                if trunk.row_count < self.free_trunk_capacity:
+                    offset = Page.HEADER_SIZE + trunk.row_count * self._pid_struct.size
+                    self._pid_struct.pack_into(trunk.data, offset, page_index)
+                    trunk.row_count += 1
+                    trunk._update_header()
+                    self.write_page(head, trunk)
+                    return
+
+            trunk = self.new_page(PageType.FREE_TRUNK)
+            trunk._next_page_id = head
+            trunk._update_header()
+            self.write_page(page_index, trunk)
+            self.superblock.free_list_head = page_index
+
+    def free_page_count(self) -> int:
+        """[Step 5.5] Free-list에 있는 페이지 수 (Trunk 자신 포함)"""
+        if self.superblock is None:
+            return 0
+
+        count = 0
+        with self._alloc_lock:
+            pid = self.superblock.free_list_head
+            while pid != INVALID_PAGE_ID:
+                trunk = self.read_page(pid)
+                count += 1 + trunk.row_count
+                pid = trunk.next_sibling_id
+        return count
+
+    def _pop_free_page(self) -> int:
+        """
+        [Step 5.5] Free-list에서 PID 하나 꺼내기
+
+        첫 Trunk에 항목이 있으면 마지막 항목을, 비어 있으면 Trunk 페이지 자체를 반환
+        """
+        head = self.superblock.free_list_head
+        trunk = self.read_page(head)
+
+        if trunk.row_count > 0:
+            trunk.row_count -= 1
+            offset = Page.HEADER_SIZE + trunk.row_count * self._pid_struct.size
+            pid = self._pid_struct.unpack_from(trunk.data, offset)[0]
+            trunk._update_header()
+            self.write_page(head, trunk)
+            return pid
+
+        self.superblock.free_list_head = trunk.next_sibling_id
+        self._discard(head)
+        return head
+
+    def _discard(self, page_index: int):
+        """
+        [Step 5.5] 반납/재사용되는 페이지의 Frame을 Write-back 없이 버림
+
+        [Step 5.25] Write-back 중이면 끝날 때까지 기다림 (옛 내용이 나중에 덮어쓰지 않도록)
+        """
+        while True:
+            with self._lock:
+                evicting = self._evicting.get(page_index)
+                if evicting is None:
+                    frame = self.frames.get(page_index)
+                    if frame is not None:
+                        if frame.pin_count > 0 or frame.loading:
+                            raise RuntimeError(f"Cannot discard pinned page {page_index}")
+                        del self.frames[page_index]
+                    return
+            evicting.latch.wait()
+
+    def init_superblock(self) -> Superblock:
+        """
+        [Step 5.4] 0번 페이지를 Superblock으로 지정합니다.
+
+        빈 파일이면 PID 0을 새로 할당하고, 기존 0번 페이지가 있으면
+        (구버전 파일 업그레이드) 그 자리를 Superblock으로 덮어씁니다.
+        실제 디스크 기록은 다음 sync()/close() 때 일어납니다.
+        """
+        if self.superblock is not None:
+            raise RuntimeError("Superblock already exists")
+
+        if self.page_count == 0:
+            self.get_new_page_id()
+        with self._lock:
+            self.frames.pop(Superblock.PAGE_ID, None)
+
+        self.superblock = Superblock(
+            page_count=self.page_count,
+            page_size=self.page_size,
+            leaf_format=self.leaf_format,
+            schema=self.schema,
+        )
+        return self.superblock
+
+    def new_page(self, page_type: PageType = PageType.LEAF) -> Page:
+        """[Step 5.7] 이 파일의 page_size(와 leaf_format, codec, row_limit)에 맞는 빈 Page 생성"""
+        return Page(
+            page_type=page_type,
+            page_size=self.page_size,
+            leaf_format=self.leaf_format,
+            codec=self.codec,
+            row_limit=self.row_limit,
+        )
+
+    def page_from_bytes(self, data: bytes) -> Page:
+        """[Step 5.7] 디스크 / 로그에서 읽은 바이트 → 이 파일 설정의 Page"""
+        return Page(
+            data, leaf_format=self.leaf_format, codec=self.codec, row_limit=self.row_limit
+        )
 
     def read_page(self, page_index: int) -> Page:
         """
         파일에서 특정 페이지를 읽어옵니다.
+
+        [Step 5.1] Buffer Pool을 먼저 확인하고, 없을 때만 디스크에서 읽습니다.
+        반환되는 Page는 Pool의 Frame과 같은 객체입니다.
+
+        [Step 5.25] 여러 스레드에서 호출 가능 (디스크 읽기는 mapping lock 밖에서)
         """
-        if page_index >= self.page_count:
+        with self._lock:
+            frame = self.frames.get(page_index)
+            if frame is not None and not frame.loading:
+                self.frames.move_to_end(page_index)
+                self.hit_count += 1
+                return frame.page
+
+        frame = self._fetch(page_index, pin=False)
+        if frame is None:
             # 아직 생성되지 않은 페이지 접근 시 빈 페이지 반환
             # (B+Tree 구현 시 빈 노드 필요할 때 유용)
-            return Page()
+            return self.new_page()
+        return frame.page
+
+    def _fetch(self, page_index: int, pin: bool) -> Optional[Frame]:
+        """
+        [Step 5.25] page_index의 Frame을 Pool에 올려서 반환 (pin=True면 pin_count + 1)
 
-        self.file.seek(page_index * Page.PAGE_SIZE)
-        buffered_data: bytes = self.file.read(Page.PAGE_SIZE)
+        동작:
+            1. (lock) Pool에 있으면 반환, 다른 스레드가 읽는 중 / Write-back 중이면 기다렸다가 재시도
+            2. (lock) 없으면 자리를 만들고 loading Frame을 exclusive latch로 등록
+            3. (lock 밖) 떼어낸 dirty Frame Write-back → 디스크에서 읽기 → latch 해제
 
-        if buffered_data:
-            return Page(buffered_data)
-        else:
-            return Page()
+        Returns:
+            Optional[Frame]: 아직 생성되지 않은 페이지이고 pin=False면 None
+        """
+        while True:
+            with self._lock:
+                frame = self.frames.get(page_index)
+                if frame is not None:
+                    if not frame.loading:
+                        self.frames.move_to_end(page_index)
+                        self.hit_count += 1
+                        if pin:
+                            frame.pin_count += 1
+                        return frame
+                    busy = frame
+                else:
+                    busy = self._evicting.get(page_index)
+                    if busy is None:
+                        fresh = page_index >= self.page_count
+                        if fresh and not pin:
+                            return None
+                        victims = self._make_room()
+                        if victims is None:
+                            continue
+                        frame = Frame(None)
+                        frame.loading = True
+                        frame.latch.acquire_exclusive()
+                        if pin:
+                            frame.pin_count += 1
+                        self.frames[page_index] = frame
+                        if not fresh:
+                            self.miss_count += 1
+                        break
+            busy.latch.wait()
+
+        try:
+            self._write_back(victims)
+            frame.page = self.new_page() if fresh else self._read_from_disk(page_index)
+        except BaseException:
+            with self._lock:
+                if self.frames.get(page_index) is frame:
+                    del self.frames[page_index]
+                frame.latch.release_exclusive()
+                self._frame_released.notify_all()
+            raise
+        with self._lock:
+            frame.loading = False
+            frame.latch.release_exclusive()
+            self._frame_released.notify_all()
+        return frame
 
     def write_page(self, page_index: int, page: Page):
         """
         데이터를 파일에 저장합니다.
+
+        [Step 5.1] 실제 디스크 쓰기는 Eviction/sync/close 시점으로 미룹니다.
+        [Step 5.2] 단, SyncPolicy.WRITE이면 즉시 기록하고,
+                   SyncPolicy.INTERVAL이면 주기가 지났을 때 sync()합니다.
+        [Step 5.21] WAL 모드에서 sync()는 Commit이므로, 연산 도중(Split 중간)에 하지 않고
+                   연산 경계에서 Table이 sync_if_due()를 호출합니다.
+        [Step 5.25] 같은 페이지를 읽는 중이거나 Write-back 중이면 끝난 뒤에 교체합니다.
+
+        Raises:
+            ValueError: Superblock 자리(0번)에 일반 페이지를 쓰려고 할 때
+        """
+        if self.superblock is not None and page_index == Superblock.PAGE_ID:
+            raise ValueError("Page 0 is reserved for the superblock")
+
+        write_through = self.sync_policy == SyncPolicy.WRITE
+
+        while True:
+            with self._lock:
+                frame = self.frames.get(page_index)
+                if frame is not None and frame.loading:
+                    busy = frame
+                else:
+                    busy = self._evicting.get(page_index)
+                if busy is None:
+                    victims = []
+                    if frame is not None:
+                        frame.page = page
+                        frame.is_dirty = not write_through
+                        self.frames.move_to_end(page_index)
+                    else:
+                        victims = self._make_room()
+                        if victims is None:
+                            continue
+                        self.frames[page_index] = Frame(page, is_dirty=not write_through)
+
+                    # [Step 4.1.3] 만약 새로 쓴 페이지가 범위를 넘어갔다면 page_count 업데이트
+                    if page_index >= self.page_count:
+                        self.page_count = page_index + 1
+                    break
+            busy.latch.wait()
+
+        self._write_back(victims)
+        if write_through:
+            self._io_gate.acquire_shared()
+            try:
+                self._write_to_disk(page_index, page)
+            finally:
+                self._io_gate.release_shared()
+        elif self.wal is None:
+            self.sync_if_due()
+
+    def sync_if_due(self):
+        """[Step 5.2] SyncPolicy.INTERVAL이고 마지막 sync 이후 주기가 지났으면 sync()"""
+        if self.sync_policy == SyncPolicy.INTERVAL:
+            elapsed_ms = (time.monotonic() - self._last_sync) * 1000
+            if elapsed_ms >= self.sync_interval_ms:
+                self.sync()
+
+    def write_pages(self, pages: Dict[int, Page]):
+        """
+        [Step 5.9] 여러 페이지를 Buffer Pool을 거치지 않고 바로 디스크에 기록합니다.
+
+        Bulk Load처럼 새 페이지를 대량으로 만드는 경우, Pool을 거치면
+        Eviction마다 페이지 단위 write가 발생하므로 연속된 PID를 한 번의 write로 씁니다.
+        (SyncPolicy와 관계없이 즉시 기록, fsync는 sync()에서)
+
+        Args:
+            pages: PID → Page
+
+        Raises:
+            ValueError: Superblock 자리(0번)가 포함된 경우
+        """
+        if self.superblock is not None and Superblock.PAGE_ID in pages:
+            raise ValueError("Page 0 is reserved for the superblock")
+
+        run: List[int] = []
+        self._io_gate.acquire_shared()
+        try:
+            for pid in sorted(pages):
+                # Pool에 남은 옛 내용이 나중에 Write-back되어 덮어쓰지 않도록 버림
+                self._discard(pid)
+                if run and pid != run[-1] + 1:
+                    self._write_run(run[0], [pages[p] for p in run])
+                    run = []
+                run.append(pid)
+            if run:
+                self._write_run(run[0], [pages[p] for p in run])
+        finally:
+            self._io_gate.release_shared()
+        if run:
+            with self._lock:
+                self.page_count = max(self.page_count, run[-1] + 1)
+
+    def pin(self, page_index: int) -> Page:
+        """
+        [Step 5.1] 페이지를 Pool에 고정하고 반환합니다.
+
+        pin_count > 0인 동안에는 Eviction되지 않으므로, Split처럼
+        여러 페이지를 오가는 작업 중에도 같은 Page 객체가 유지됩니다.
+        반드시 unpin()과 짝을 맞춰 호출해야 합니다.
+        (아직 디스크에 없는 페이지는 빈 Frame으로 올려둠)
+        """
+        return self._fetch(page_index, pin=True).page
+
+    def unpin(self, page_index: int, is_dirty: bool = False):
+        """
+        [Step 5.1] pin()을 해제합니다.
+
+        Args:
+            page_index: 해제할 PID
+            is_dirty: 사용 중 페이지를 수정했다면 True (Write-back 대상 표시)
+        """
+        with self._lock:
+            frame = self.frames.get(page_index)
+            if frame is None or frame.pin_count == 0:
+                raise RuntimeError(f"Page {page_index} is not pinned")
+            frame.pin_count -= 1
+            if is_dirty:
+                frame.is_dirty = True
+            if frame.pin_count == 0:
+                self._frame_released.notify_all()
+
+    @contextmanager
+    def latched(self, page_index: int, exclusive: bool = False) -> Iterator[Page]:
+        """
+        [Step 5.25] 페이지를 pin하고 Frame latch를 잡은 채로 사용
+
+        shared: 여러 스레드가 동시에 읽음 (그동안 제자리 수정 / Write-back 없음)
+        exclusive: 한 스레드만 제자리 수정, 끝나면 dirty 표시 (write_page 호출 불필요)
+
+        예시:
+            with pager.latched(pid, exclusive=True) as page:
+                page.write_at(0, row)
+        """
+        frame = self._fetch(page_index, pin=True)
+        if exclusive:
+            frame.latch.acquire_exclusive()
+        else:
+            frame.latch.acquire_shared()
+        try:
+            yield frame.page
+        finally:
+            if exclusive:
+                frame.latch.release_exclusive()
+            else:
+                frame.latch.release_shared()
+            self.unpin(page_index, is_dirty=exclusive)
+
+    def flush_page(self, page_index: int):
+        """dirty Frame 하나를 디스크에 기록 (Frame은 Pool에 유지)"""
+        with self._lock:
+            frame = self.frames.get(page_index)
+            if frame is None or not frame.is_dirty or frame.loading:
+                return
+            frame.pin_count += 1
+            self._flushing += 1
+        try:
+            self._io_gate.acquire_shared()
+            try:
+                self._flush_run([(page_index, frame)])
+            finally:
+                self._io_gate.release_shared()
+        finally:
+            with self._lock:
+                self._flushing -= 1
+            self.unpin(page_index)
+
+    def sync(self):
+        """
+        [Step 5.2] 모든 dirty Frame을 디스크에 기록하고 fsync합니다.
+
+        동작:
+            1. dirty Frame의 PID를 정렬
+            2. 연속된 PID끼리 하나의 run으로 묶음 (예: 3,4,5 → 1번의 write)
+            3. run마다 pwrite 한 번
+            4. [Step 5.4] Superblock 기록 (데이터 페이지 이후)
+            5. fsync 한 번
+
+        [Step 5.21] WAL 모드: 3~4가 로그 Frame 추가가 되고, Superblock Frame이 Commit 표시.
+            fsync는 로그에만 한 번 (Group Commit), 로그가 길어지면 Checkpoint
+        [Step 5.22] 트랜잭션 중에는 아무것도 하지 않음 (commit()이 대신 수행)
+        [Step 5.25] 4~5는 진행 중인 Write-back이 모두 끝난 뒤에 수행
+            WAL 로그 fsync는 lock을 놓은 뒤에 하므로, 동시에 sync한 스레드들의
+            Commit은 fsync 한 번으로 함께 확정됨 (Group Commit)
+        """
+        self._make_durable(self._write_commit())
+
+    def _write_commit(self) -> Optional[int]:
         """
-        self.file.seek(page_index * Page.PAGE_SIZE)
-        self.file.write(page.data)
-        self.file.flush()
+        [Step 5.25] sync()의 lock 안 부분: dirty Frame과 Superblock 기록
 
-        # [Step 4.1.3] 만약 새로 쓴 페이지가 범위를 넘어갔다면 page_count 업데이트
-        if page_index >= self.page_count:
-            self.page_count = page_index + 1
+        Returns:
+            WAL 모드에서 아직 fsync하지 않은 Commit Frame의 LSN (_make_durable에 전달)
+        """
+        with self._sync_lock:
+            if self.in_transaction:
+                return None
+
+            self._flush_dirty()
+            self._io_gate.acquire_exclusive()
+            try:
+                lsn = self._commit()
+            finally:
+                self._io_gate.release_exclusive()
+            self._last_sync = time.monotonic()
+            self.sync_count += 1
+            return lsn
+
+    def _make_durable(self, lsn: Optional[int]):
+        """[Step 5.25] Commit Frame까지 로그 fsync (lock 밖, [Step 5.21] Group Commit)"""
+        if lsn is not None:
+            self.wal.commit(lsn)
+
+    def _flush_dirty(self):
+        """[Step 5.2] dirty Frame을 PID 순으로, 연속된 PID는 한 번의 write로 기록"""
+        # [Step 5.25] 기록하는 동안 Eviction되지 않도록 pin (옛 내용이 늦게 기록되는 것 방지)
+        with self._lock:
+            dirty = [
+                (pid, self.frames[pid])
+                for pid in sorted(
+                    pid for pid, frame in self.frames.items() if frame.is_dirty
+                )
+            ]
+            for _, frame in dirty:
+                frame.pin_count += 1
+            self._flushing += len(dirty)
+
+        try:
+            self._io_gate.acquire_shared()
+            try:
+                run: List[Tuple[int, Frame]] = []
+                for pid, frame in dirty:
+                    if run and pid != run[-1][0] + 1:
+                        self._flush_run(run)
+                        run = []
+                    run.append((pid, frame))
+                if run:
+                    self._flush_run(run)
+            finally:
+                self._io_gate.release_shared()
+        finally:
+            with self._lock:
+                for _, frame in dirty:
+                    frame.pin_count -= 1
+                self._flushing -= len(dirty)
+                self._frame_released.notify_all()
+
+    def _commit(self) -> Optional[int]:
+        """
+        [Step 5.4] Superblock 기록 후 확정 (fsync, [Step 5.21] WAL이면 로그 Commit)
+
+        Returns:
+            [Step 5.25] WAL 모드면 Commit Frame의 LSN (fsync는 호출한 쪽이 lock 밖에서)
+        """
+        lsn = None
+        if self.superblock is not None:
+            lsn = self._write_superblock()
+
+        if self.wal is not None:
+            if lsn is None:
+                lsn = self.wal.append([])
+            if self.wal.frame_count >= self.checkpoint_pages:
+                # Checkpoint는 커밋되지 않은 Frame이 없는 지금 (gate exclusive) 수행
+                self.wal.commit(lsn)
+                self.wal.checkpoint(self.file)
+                return None
+            return lsn
+        os.fsync(self.fd)
+        return None
+
+    def checkpoint(self):
+        """
+        [Step 5.21] 지금까지의 변경을 Commit하고 WAL 내용을 DB 파일에 반영 (로그 비움)
+
+        WAL 모드가 아니면 sync()와 같습니다.
+
+        Raises:
+            RuntimeError: [Step 5.22] 트랜잭션 중일 때 (커밋되지 않은 Frame까지 반영되므로)
+        """
+        with self._sync_lock:
+            if self.in_transaction:
+                raise RuntimeError("Cannot checkpoint during a transaction")
+            self.sync()
+            if self.wal is not None:
+                self._io_gate.acquire_exclusive()
+                try:
+                    self.wal.checkpoint(self.file)
+                finally:
+                    self._io_gate.release_exclusive()
+
+    def _flush_run(self, run: List[Tuple[int, Frame]]):
+        """
+        연속된 PID들의 dirty Frame을 한 번의 write로 기록
+
+        [Step 5.25] 기록하는 동안 각 Frame의 latch를 shared로 잡음 (latched 수정과 겹치지 않음)
+        """
+        for _, frame in run:
+            frame.latch.acquire_shared()
+        try:
+            for _, frame in run:
+                frame.is_dirty = False
+            self._write_run(run[0][0], [frame.page for _, frame in run])
+        except BaseException:
+            for _, frame in run:
+                frame.is_dirty = True
+            raise
+        finally:
+            for _, frame in run:
+                frame.latch.release_shared()
+
+    def _pwrite(self, data: bytes, offset: int):
+        """[Step 5.25] DB 파일의 offset에 기록 (파일 위치를 쓰지 않으므로 스레드 간 경쟁 없음)"""
+        os.pwrite(self.fd, data, offset)
+
+    def _write_run(self, start_pid: int, pages: List[Page]):
+        """start_pid부터 연속된 페이지들을 pwrite 한 번으로 기록"""
+        if self.wal is not None:
+            self.wal.append(
+                (start_pid + i, page.data) for i, page in enumerate(pages)
+            )
+            return
+        self._pwrite(b"".join(page.data for page in pages), start_pid * self.page_size)
+
+    def _write_superblock(self) -> Optional[int]:
+        """
+        [Step 5.4] Superblock을 0번 페이지에 기록 (page_count 최신화 포함)
+
+        Returns:
+            [Step 5.21] WAL 모드면 Commit Frame의 LSN
+        """
+        self.superblock.page_count = self.page_count
+        data = self.superblock.serialize()
+        if self.wal is not None:
+            # [Step 5.21] Superblock Frame이 Commit 표시 (root_page_id 등도 같은 Commit)
+            return self.wal.append([(Superblock.PAGE_ID, data)], commit=True)
+        self._pwrite(data, Superblock.PAGE_ID * self.page_size)
+        return None
+
+    def _make_room(self) -> Optional[List[Tuple[int, Frame]]]:
+        """
+        Pool이 가득 찼으면 LRU Frame부터 떼어내 자리를 만듭니다. (mapping lock 안에서 호출)
+
+        [Step 5.25] I/O는 하지 않습니다. dirty Frame은 exclusive latch를 잡은 채
+        _evicting에 옮기고 반환하며, 호출한 쪽이 lock 밖에서 _write_back합니다.
+        pin되었거나 latch가 잡힌 Frame(읽는 중 / latched 사용 중)은 건너뜁니다.
+
+        Returns:
+            떼어낸 dirty Frame 목록, 다른 스레드가 잠시 쓰는 Frame이 풀리길 기다렸으면 None
+            (그 사이 Pool이 바뀌었으므로 호출한 쪽은 처음부터 다시 확인)
+
+        Raises:
+            RuntimeError: 모든 Frame이 pin 상태여서 내보낼 수 없을 때
+        """
+        victims: List[Tuple[int, Frame]] = []
+        while len(self.frames) >= self.pool_size:
+            for victim_index, frame in self.frames.items():
+                if frame.pin_count == 0 and frame.latch.acquire_exclusive(blocking=False):
+                    break
+            else:
+                # 이미 떼어낸 Frame은 그대로 되돌림
+                for pid, frame in victims:
+                    del self._evicting[pid]
+                    self.frames[pid] = frame
+                    frame.latch.release_exclusive()
+                if self._flushing == 0 and not any(
+                    frame.loading for frame in self.frames.values()
+                ):
+                    raise RuntimeError(
+                        f"Buffer pool exhausted: all {self.pool_size} frames are pinned"
+                    )
+                self._frame_released.wait()
+                return None
+
+            del self.frames[victim_index]
+            if frame.is_dirty:
+                self._evicting[victim_index] = frame
+                victims.append((victim_index, frame))
+            else:
+                frame.latch.release_exclusive()
+        return victims
+
+    def _write_back(self, victims: List[Tuple[int, Frame]]):
+        """
+        [Step 5.25] _make_room이 떼어낸 dirty Frame들을 lock 밖에서 기록
+
+        기록이 끝나면 _evicting에서 빼고 latch를 놓아, 기다리던 스레드가 디스크에서 다시 읽습니다.
+        기록에 실패한 Frame은 dirty 상태로 Pool에 되돌립니다.
+        """
+        for index, (pid, frame) in enumerate(victims):
+            self._io_gate.acquire_shared()
+            try:
+                self._write_to_disk(pid, frame.page)
+            except BaseException:
+                with self._lock:
+                    for failed_pid, failed in victims[index:]:
+                        del self._evicting[failed_pid]
+                        self.frames[failed_pid] = failed
+                for _, failed in victims[index:]:
+                    failed.latch.release_exclusive()
+                raise
+            finally:
+                self._io_gate.release_shared()
+
+            with self._lock:
+                del self._evicting[pid]
+            frame.latch.release_exclusive()
+
+    def _read_from_disk(self, page_index: int) -> Page:
+        # [Step 5.21] 로그에 더 새 이미지가 있으면 그것을 사용
+        if self.wal is not None:
+            logged = self.wal.read(page_index)
+            if logged is not None:
+                return self.page_from_bytes(logged)
+
+        buffered_data: bytes = os.pread(
+            self.fd, self.page_size, page_index * self.page_size
+        )
+
+        if buffered_data:
+            return self.page_from_bytes(buffered_data)
+        else:
+            return self.new_page()
+
+    def _write_to_disk(self, page_index: int, page: Page):
+        if self.wal is not None:
+            self.wal.append([(page_index, page.data)])
+            return
+        self._pwrite(page.data, page_index * self.page_size)
 
     def close(self):
-        if self.file:
-            self.file.close()
+        with self._sync_lock:
+            if self.file and not self.file.closed:
+                # [Step 5.22] 끝나지 않은 트랜잭션은 버림
+                if self.in_transaction:
+                    self.rollback()
+                self.sync()
+                if self.wal is not None:
+                    self.wal.checkpoint(self.file)
+                    self.wal.close()
+                self.file.close()
@@ -1,5 +1,5 @@
 import struct
-from typing import ClassVar
+from typing import ClassVar, Tuple
 
 
 class Row:
@@ -17,10 +17,25 @@ class Row:
     USERNAME_SIZE: ClassVar[int] = 10
     EMAIL_SIZE: ClassVar[int] = 30
 
+    # [Step 5.19] 컬럼 이름 (Projection에서 사용, 직렬화 순서와 같음)
+    FIELDS: ClassVar[Tuple[str, ...]] = ("user_id", "username", "email")
+    # [Step 5.20] STRUCT_FORMAT과 같은 배치의 NumPy structured dtype 필드 (패딩 없음)
+    NUMPY_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("user_id", "<i4"),
+        ("username", f"S{USERNAME_SIZE}"),
+        ("email", f"S{EMAIL_SIZE}"),
+    )
+
     # Format: Little-endian (<), int, 10s, 30s
     STRUCT_FORMAT: ClassVar[str] = f"<i{USERNAME_SIZE}s{EMAIL_SIZE}s"
     _struct: ClassVar[struct.Struct] = struct.Struct(STRUCT_FORMAT)
 
+    # [Step 5.17] 가변 길이 인코딩 (Slotted Leaf용): id, username 길이, email 길이 + 본문
+    VAR_HEADER_FORMAT: ClassVar[str] = "<iBB"
+    _var_header: ClassVar[struct.Struct] = struct.Struct(VAR_HEADER_FORMAT)
+    VAR_FIELD_MAX: ClassVar[int] = 255
+    VAR_MAX_SIZE: ClassVar[int] = _var_header.size + 2 * VAR_FIELD_MAX
+
     __slots__ = ("user_id", "username", "email")
 
     def __init__(self, user_id: int, username: str, email: str):
@@ -64,6 +79,56 @@ class Row:
 
         return cls(user_id=unpacked[0], username=username, email=email)
 
+    @classmethod
+    def deserialize_from(cls, buffer, offset: int = 0) -> "Row":
+        """
+        [Step 5.3] buffer의 offset 위치에서 바로 Row를 복원 (중간 슬라이스 복사 없음)
+        """
+        unpacked = cls._struct.unpack_from(buffer, offset)
+        username = unpacked[1].rstrip(b"\x00").decode("utf-8")
+        email = unpacked[2].rstrip(b"\x00").decode("utf-8")
+
+        return cls(user_id=unpacked[0], username=username, email=email)
+
+    def serialize_var(self) -> bytes:
+        """
+        [Step 5.17] 가변 길이 직렬화 (패딩 없음, 필드당 최대 VAR_FIELD_MAX bytes)
+
+        Layout: [user_id (4B)][len(username) (1B)][len(email) (1B)][username][email]
+        """
+        username_bytes = self.username.encode("utf-8")
+        email_bytes = self.email.encode("utf-8")
+
+        if not isinstance(self.user_id, int):
+            raise ValueError("id must be integer")
+
+        if len(username_bytes) > self.VAR_FIELD_MAX:
+            raise ValueError(
+                f"Username too long: {len(username_bytes)} bytes (Max {self.VAR_FIELD_MAX})"
+            )
+
+        if len(email_bytes) > self.VAR_FIELD_MAX:
+            raise ValueError(
+                f"Email too long: {len(email_bytes)} bytes (Max {self.VAR_FIELD_MAX})"
+            )
+
+        return (
+            self._var_header.pack(self.user_id, len(username_bytes), len(email_bytes))
+            + username_bytes
+            + email_bytes
+        )
+
+    @classmethod
+    def deserialize_var_from(cls, buffer, offset: int = 0) -> "Row":
+        """[Step 5.17] serialize_var로 기록한 Row를 buffer의 offset 위치에서 복원"""
+        user_id, username_len, email_len = cls._var_header.unpack_from(buffer, offset)
+        start = offset + cls._var_header.size
+        mid = start + username_len
+        username = bytes(buffer[start:mid]).decode("utf-8")
+        email = bytes(buffer[mid : mid + email_len]).decode("utf-8")
+
+        return cls(user_id=user_id, username=username, email=email)
+
     @property
     def size(self):
         return self._struct.size
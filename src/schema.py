@@ -0,0 +1,541 @@
+"""
+Step 5.18: Table Schema와 Record Codec
+
+Row는 (user_id, username, email) 한 가지 모양으로 고정되어 있습니다.
+Schema는 컬럼 이름 / 타입 / NULL 허용 여부를 정의하고, compile()로
+그 모양 전용 encoder/decoder(RecordCodec)를 테이블 생성(열기) 시 한 번 만듭니다.
+Row마다 "이 컬럼의 타입이 뭐였지?"를 확인하는 일반 루프를 돌지 않도록,
+컬럼 목록을 풀어 쓴 함수 소스를 생성해 exec합니다. (collections.namedtuple과 같은 방식)
+
+Record Layout (Little-endian):
+┌──────────┬─────────────┬──────────────────┬─────────────────────┬────────────────┐
+│ key (4B) │ null bitmap │ 고정 길이 컬럼들    │ 가변 컬럼 길이 (2B씩) │ 가변 컬럼 본문   │
+└──────────┴─────────────┴──────────────────┴─────────────────────┴────────────────┘
+- key: 첫 컬럼 (INT32, NOT NULL) → Page.key_struct("<i")가 Record 앞 4바이트에서 그대로 읽음
+- null bitmap: NULL 허용 컬럼이 있을 때만 (컬럼 i → bit i)
+- 앞부분 전체는 미리 만든 struct.Struct 하나로 pack / unpack_from
+- 고정 길이 컬럼은 Record 시작 기준 offset이 항상 같음 (RecordCodec.offsets, Projection용)
+
+Record가 가변 길이이므로 Schema 테이블은 LeafFormat.SLOTTED Leaf에 저장됩니다.
+Schema 없는 파일(기본 Row 테이블)은 ROW_CODEC을 사용합니다.
+"""
+
+import struct
+from enum import IntEnum
+from operator import attrgetter, itemgetter
+from typing import Callable, ClassVar, Dict, Optional, Sequence, Tuple
+
+from src.row import Row
+
+
+class ColumnType(IntEnum):
+    """[Step 5.18] 컬럼 타입"""
+
+    INT32 = 1  # "<i"
+    INT64 = 2  # "<q"
+    FLOAT64 = 3  # "<d"
+    FIXED = 4  # 고정 길이 문자열 (size bytes, NUL 패딩) - Row.username과 같은 방식
+    VARCHAR = 5  # 가변 길이 문자열 (최대 size bytes)
+    BLOB = 6  # 가변 길이 bytes (최대 size bytes)
+
+
+class Column:
+    """
+    [Step 5.18] 컬럼 정의
+
+    Attributes:
+        name: 컬럼 이름
+        type: ColumnType
+        size: FIXED는 고정 길이, VARCHAR / BLOB은 최대 길이 (bytes)
+        nullable: NULL(None) 허용 여부
+    """
+
+    # 가변 컬럼 길이는 2바이트("H")로 기록
+    MAX_VAR_SIZE: ClassVar[int] = 0xFFFF
+    DEFAULT_VAR_SIZE: ClassVar[int] = 255
+
+    # check()가 받는 Python 타입과 정수 범위
+    _value_types: ClassVar[Dict[ColumnType, tuple]] = {
+        ColumnType.INT32: (int,),
+        ColumnType.INT64: (int,),
+        ColumnType.FLOAT64: (int, float),
+        ColumnType.FIXED: (str,),
+        ColumnType.VARCHAR: (str,),
+        ColumnType.BLOB: (bytes, bytearray, memoryview),
+    }
+    _int_bits: ClassVar[Dict[ColumnType, int]] = {ColumnType.INT32: 32, ColumnType.INT64: 64}
+
+    __slots__ = ("name", "type", "size", "nullable")
+
+    def __init__(
+        self, name: str, type: ColumnType, size: int = 0, nullable: bool = False
+    ):
+        self.name: str = name
+        self.type: ColumnType = ColumnType(type)
+        self.nullable: bool = nullable
+
+        if self.type == ColumnType.FIXED and size <= 0:
+            raise ValueError(f"FIXED column {name!r} needs a positive size")
+        if self.is_variable:
+            size = size or self.DEFAULT_VAR_SIZE
+            if not 0 < size <= self.MAX_VAR_SIZE:
+                raise ValueError(
+                    f"Column {name!r} size must be in (0, {self.MAX_VAR_SIZE}], got {size}"
+                )
+        self.size: int = size
+
+    @property
+    def is_variable(self) -> bool:
+        return self.type in (ColumnType.VARCHAR, ColumnType.BLOB)
+
+    @property
+    def struct_code(self) -> str:
+        """고정 부분 struct 포맷 코드 (가변 컬럼은 길이 "H")"""
+        if self.type == ColumnType.INT32:
+            return "i"
+        if self.type == ColumnType.INT64:
+            return "q"
+        if self.type == ColumnType.FLOAT64:
+            return "d"
+        if self.type == ColumnType.FIXED:
+            return f"{self.size}s"
+        return "H"
+
+    def check(self, value):
+        """
+        [Step 5.18] 값이 이 컬럼에 들어갈 수 있는지 확인 (길이 초과는 encode에서 확인)
+
+        Raises:
+            ValueError: NOT NULL 컬럼의 None, 타입이 맞지 않거나 정수 범위 밖의 값
+        """
+        if value is None:
+            if not self.nullable:
+                raise ValueError(f"{self.name} cannot be NULL")
+            return
+        if not isinstance(value, self._value_types[self.type]):
+            raise ValueError(
+                f"{self.name} expects {self.type.name}, got {type(value).__name__} {value!r}"
+            )
+        bits = self._int_bits.get(self.type)
+        if bits is not None and not -(1 << (bits - 1)) <= value < 1 << (bits - 1):
+            raise ValueError(f"{self.name} out of {self.type.name} range: {value}")
+
+    def parse(self, text: str):
+        """[Step 5.18] REPL 입력 문자열 → 컬럼 값 ("NULL"은 None)"""
+        if self.nullable and text.upper() == "NULL":
+            return None
+        if self.type in (ColumnType.INT32, ColumnType.INT64):
+            return int(text)
+        if self.type == ColumnType.FLOAT64:
+            return float(text)
+        if self.type == ColumnType.BLOB:
+            return text.encode("utf-8")
+        return text
+
+    def __eq__(self, other):
+        return isinstance(other, Column) and (
+            self.name,
+            self.type,
+            self.size,
+            self.nullable,
+        ) == (other.name, other.type, other.size, other.nullable)
+
+    def __repr__(self):
+        size = f"({self.size})" if self.size else ""
+        null = "" if self.nullable else " NOT NULL"
+        return f"{self.name} {self.type.name}{size}{null}"
+
+
+class Schema:
+    """
+    [Step 5.18] 테이블 모양 (컬럼 목록)
+
+    첫 컬럼이 Primary Key이며 B+Tree 키로 쓰이므로 INT32, NOT NULL이어야 합니다.
+    Record 값은 컬럼 순서의 tuple입니다.
+
+    Example:
+        >>> schema = Schema([
+        ...     Column("id", ColumnType.INT32),
+        ...     Column("name", ColumnType.VARCHAR, 100),
+        ...     Column("score", ColumnType.FLOAT64, nullable=True),
+        ... ])
+        >>> codec = schema.compile()
+        >>> codec.decode_from(codec.encode((1, "alice", None)))
+        (1, 'alice', None)
+    """
+
+    # null bitmap은 정수 하나 (최대 "Q" = 64 bits)
+    MAX_COLUMNS: ClassVar[int] = 64
+
+    # 직렬화: 컬럼 수(2B) + 컬럼마다 [type(1B), nullable(1B), size(2B), name 길이(1B), name]
+    _count_struct: ClassVar[struct.Struct] = struct.Struct("<H")
+    _column_struct: ClassVar[struct.Struct] = struct.Struct("<BBHB")
+
+    __slots__ = ("columns", "_codec")
+
+    def __init__(self, columns: Sequence[Column]):
+        if not columns:
+            raise ValueError("Schema needs at least one column")
+        if len(columns) > self.MAX_COLUMNS:
+            raise ValueError(f"Too many columns: {len(columns)} (Max {self.MAX_COLUMNS})")
+        key = columns[0]
+        if key.type != ColumnType.INT32 or key.nullable:
+            raise ValueError(f"Key column {key.name!r} must be INT32 NOT NULL")
+        names = [column.name for column in columns]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate column names in {names}")
+
+        self.columns: Tuple[Column, ...] = tuple(columns)
+        self._codec: Optional[RecordCodec] = None
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return tuple(column.name for column in self.columns)
+
+    def compile(self) -> "RecordCodec":
+        """[Step 5.18] 이 Schema 전용 RecordCodec (한 번만 만들고 재사용)"""
+        if self._codec is None:
+            self._codec = RecordCodec(self)
+        return self._codec
+
+    def make(self, values: Sequence) -> tuple:
+        """
+        [Step 5.18] 컬럼 순서의 값들 → Record (개수 / NULL / 타입 확인, 길이는 encode 시 확인)
+
+        Raises:
+            ValueError: 값 개수가 다르거나 Column.check를 통과하지 못한 값
+        """
+        if len(values) != len(self.columns):
+            raise ValueError(
+                f"Expected {len(self.columns)} values {self.names}, got {len(values)}"
+            )
+        for column, value in zip(self.columns, values):
+            column.check(value)
+        return tuple(values)
+
+    def parse(self, texts: Sequence[str]) -> tuple:
+        """[Step 5.18] REPL 입력 문자열들 → Record"""
+        if len(texts) != len(self.columns):
+            raise ValueError(
+                f"Expected {len(self.columns)} values {self.names}, got {len(texts)}"
+            )
+        return tuple(column.parse(text) for column, text in zip(self.columns, texts))
+
+    def serialize(self) -> bytes:
+        """Schema → bytes (Superblock 뒤에 기록)"""
+        parts = [self._count_struct.pack(len(self.columns))]
+        for column in self.columns:
+            name = column.name.encode("utf-8")
+            parts.append(
+                self._column_struct.pack(
+                    column.type, column.nullable, column.size, len(name)
+                )
+            )
+            parts.append(name)
+        return b"".join(parts)
+
+    @classmethod
+    def deserialize(cls, data, offset: int = 0) -> Optional["Schema"]:
+        """bytes → Schema (컬럼 수가 0이면 Schema 없음 → None)"""
+        (count,) = cls._count_struct.unpack_from(data, offset)
+        if count == 0:
+            return None
+
+        offset += cls._count_struct.size
+        columns = []
+        for _ in range(count):
+            type_, nullable, size, name_len = cls._column_struct.unpack_from(data, offset)
+            offset += cls._column_struct.size
+            name = bytes(data[offset : offset + name_len]).decode("utf-8")
+            offset += name_len
+            columns.append(Column(name, ColumnType(type_), size, bool(nullable)))
+        return cls(columns)
+
+    def __eq__(self, other):
+        return isinstance(other, Schema) and self.columns == other.columns
+
+    def __repr__(self):
+        return f"Schema({', '.join(repr(column) for column in self.columns)})"
+
+
+class RecordCodec:
+    """
+    [Step 5.18] Schema 전용으로 생성된 Record encoder / decoder
+
+    Attributes:
+        schema: 원본 Schema
+        fixed_struct: Record 앞부분(key, null bitmap, 고정 컬럼, 가변 길이) 전체의 Struct
+        offsets: 고정 길이 컬럼 이름 → Record 시작 기준 offset
+        max_size: Record의 최대 크기 (bytes)
+        encode: record(tuple) → bytes
+        decode_from: (buffer, offset) → record(tuple)
+        key: record → 키 (첫 컬럼)
+        projector(names): [Step 5.19] 일부 컬럼만 읽는 (buffer, offset) → tuple
+    """
+
+    key: Callable = staticmethod(itemgetter(0))
+
+    def __init__(self, schema: Schema):
+        self.schema: Schema = schema
+        columns = schema.columns
+        self._nullable = [i for i, c in enumerate(columns) if c.nullable]
+        self._fixed = [
+            i for i, c in enumerate(columns) if i > 0 and not c.is_variable
+        ]
+        self._variable = [i for i, c in enumerate(columns) if c.is_variable]
+
+        fmt = "<i"
+        if self._nullable:
+            fmt += self._bitmap_code(len(columns))
+        self.offsets: Dict[str, int] = {columns[0].name: 0}
+        for i in self._fixed:
+            self.offsets[columns[i].name] = struct.calcsize(fmt)
+            fmt += columns[i].struct_code
+        fmt += "H" * len(self._variable)
+
+        self.fixed_struct: struct.Struct = struct.Struct(fmt)
+        # null bitmap은 key 바로 뒤 (NULL 허용 컬럼이 없으면 None)
+        self.bitmap_offset: Optional[int] = (
+            struct.calcsize("<i") if self._nullable else None
+        )
+        self.max_size: int = self.fixed_struct.size + sum(
+            columns[i].size for i in self._variable
+        )
+        self.encode, self.decode_from = self._compile()
+        self._projectors: Dict[Tuple[str, ...], Callable[..., tuple]] = {}
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return self.schema.names
+
+    def projector(self, names: Sequence[str]) -> Callable[..., tuple]:
+        """
+        [Step 5.19] names 컬럼만 읽는 함수 (buffer, offset) → tuple
+
+        고정 길이 컬럼은 offsets 위치에서 unpack_from 한 번으로 읽고,
+        가변 컬럼은 요청한 것만 잘라 decode합니다. (컬럼 조합마다 한 번 생성 후 재사용)
+
+        Raises:
+            ValueError: Schema에 없는 컬럼 이름
+        """
+        names = tuple(names)
+        project = self._projectors.get(names)
+        if project is None:
+            project = self._projectors[names] = self._compile_projector(names)
+        return project
+
+    def _invalid(self, record: tuple, error: Exception):
+        """
+        encode가 struct.error 등으로 실패했을 때 호출: 문제의 컬럼을 찾아 ValueError
+        (정상 경로에는 검사를 넣지 않고, 실패했을 때만 컬럼별로 확인)
+        """
+        for column, value in zip(self.schema.columns, record):
+            column.check(value)
+        raise ValueError(f"Cannot encode record {record!r}: {error}") from error
+
+    def _too_long(self, index: int, length: int):
+        """encode에서 길이 초과 시 호출 (컬럼 이름은 생성 소스에 넣지 않음)"""
+        column = self.schema.columns[index]
+        raise ValueError(
+            f"{column.name} too long: {length} bytes (Max {column.size})"
+        )
+
+    @staticmethod
+    def _bitmap_code(count: int) -> str:
+        """컬럼 수에 맞는 null bitmap 정수 타입"""
+        for code, bits in (("B", 8), ("H", 16), ("I", 32)):
+            if count <= bits:
+                return code
+        return "Q"
+
+    def _compile(self) -> Tuple[Callable[[tuple], bytes], Callable[..., tuple]]:
+        """컬럼 목록을 풀어 쓴 encode / decode_from 소스를 만들어 exec"""
+        columns = self.schema.columns
+        names = [f"c{i}" for i in range(len(columns))]
+        packed = ["c0"]
+        unpacked = ["c0"]
+        if self._nullable:
+            packed.append("nulls")
+            unpacked.append("nulls")
+
+        body = [f"{', '.join(names)}, = record"]
+        if self._nullable:
+            body.append("nulls = 0")
+        for i in self._nullable:
+            empty = {
+                ColumnType.INT32: "0",
+                ColumnType.INT64: "0",
+                ColumnType.FLOAT64: "0.0",
+                ColumnType.BLOB: "b''",
+            }.get(columns[i].type, "''")
+            body += [
+                f"if c{i} is None:",
+                f"    nulls |= {1 << i}",
+                f"    c{i} = {empty}",
+            ]
+        for i, column in enumerate(columns):
+            if column.type in (ColumnType.FIXED, ColumnType.VARCHAR):
+                body.append(f"c{i} = c{i}.encode('utf-8')")
+            elif column.type == ColumnType.BLOB:
+                body += [
+                    f"if isinstance(c{i}, int):",  # bytes(n)은 n바이트의 0이 되므로 거부
+                    "    raise TypeError('BLOB value is an int')",
+                    f"c{i} = bytes(c{i})",
+                ]
+            else:
+                continue
+            body += [
+                f"if len(c{i}) > {column.size}:",
+                f"    too_long({i}, len(c{i}))",
+            ]
+        packed += [f"c{i}" for i in self._fixed]
+        packed += [f"len(c{i})" for i in self._variable]
+        tail = "".join(f" + c{i}" for i in self._variable)
+        body.append(f"return pack({', '.join(packed)}){tail}")
+
+        # 잘못된 값(None / 타입)은 정상 경로에서 검사하지 않고, 실패하면 invalid가 컬럼을 찾음
+        encode = [
+            "def encode(record):",
+            f"    if len(record) != {len(columns)}:",
+            f"        raise ValueError(f'Expected {len(columns)} values, got {{len(record)}}')",
+            "    try:",
+            *(f"        {line}" for line in body),
+            "    except (struct_error, TypeError, AttributeError) as error:",
+            "        invalid(record, error)",
+        ]
+
+        unpacked += [f"c{i}" for i in self._fixed]
+        unpacked += [f"n{i}" for i in self._variable]
+        decode = [
+            "def decode_from(buffer, offset=0):",
+            f"    {', '.join(unpacked)}, = unpack_from(buffer, offset)",
+        ]
+        for i in self._fixed:
+            if columns[i].type == ColumnType.FIXED:
+                decode.append(f"    c{i} = c{i}.rstrip(b'\\x00').decode('utf-8')")
+        if self._variable:
+            decode.append(f"    p = offset + {self.fixed_struct.size}")
+        for i in self._variable:
+            value = f"bytes(buffer[p : p + n{i}])"
+            if columns[i].type == ColumnType.VARCHAR:
+                value += ".decode('utf-8')"
+            decode += [f"    c{i} = {value}", f"    p += n{i}"]
+        for i in self._nullable:
+            decode += [f"    if nulls & {1 << i}:", f"        c{i} = None"]
+        decode.append(f"    return ({', '.join(names)},)")
+
+        namespace = {
+            "pack": self.fixed_struct.pack,
+            "unpack_from": self.fixed_struct.unpack_from,
+            "too_long": self._too_long,
+            "invalid": self._invalid,
+            "struct_error": struct.error,
+        }
+        exec("\n".join(encode) + "\n\n" + "\n".join(decode), namespace)
+        return namespace["encode"], namespace["decode_from"]
+
+    def _compile_projector(self, names: Tuple[str, ...]) -> Callable[..., tuple]:
+        """[Step 5.19] 요청한 컬럼만 담은 Struct(사이는 pad "x")와 project 소스 생성"""
+        columns = self.schema.columns
+        index = {column.name: i for i, column in enumerate(columns)}
+        unknown = [name for name in names if name not in index]
+        if unknown:
+            raise ValueError(f"Unknown columns {unknown} (columns: {self.names})")
+
+        wanted = sorted({index[name] for name in names})
+        variable = [i for i in self._variable if i in wanted]
+
+        # (Record 안 offset, struct 코드, 변수 이름)
+        items = [
+            (self.offsets[columns[i].name], columns[i].struct_code, f"c{i}")
+            for i in wanted
+            if not columns[i].is_variable
+        ]
+        if any(columns[i].nullable for i in wanted):
+            items.append((self.bitmap_offset, self._bitmap_code(len(columns)), "nulls"))
+        # 가변 컬럼 위치는 앞선 가변 컬럼 길이의 합 → 마지막 요청 컬럼까지의 길이만 읽음
+        preceding = [i for i in self._variable if variable and i <= variable[-1]]
+        lengths = self.fixed_struct.size - 2 * len(self._variable)
+        items += [(lengths + 2 * k, "H", f"n{i}") for k, i in enumerate(preceding)]
+        items.sort()
+
+        fmt, pos = "<", 0
+        for offset, code, _ in items:
+            if offset > pos:
+                fmt += f"{offset - pos}x"
+            fmt += code
+            pos = offset + struct.calcsize("<" + code)
+
+        lines = [
+            "def project(buffer, offset=0):",
+            f"    {', '.join(var for _, _, var in items)}, = unpack_from(buffer, offset)",
+        ]
+        for i in wanted:
+            if columns[i].type == ColumnType.FIXED:
+                lines.append(f"    c{i} = c{i}.rstrip(b'\\x00').decode('utf-8')")
+        if preceding:
+            lines.append(f"    p = offset + {self.fixed_struct.size}")
+        for i in preceding:
+            if i in variable:
+                value = f"bytes(buffer[p : p + n{i}])"
+                if columns[i].type == ColumnType.VARCHAR:
+                    value += ".decode('utf-8')"
+                lines.append(f"    c{i} = {value}")
+            lines.append(f"    p += n{i}")
+        for i in wanted:
+            if columns[i].nullable:
+                lines += [f"    if nulls & {1 << i}:", f"        c{i} = None"]
+        lines.append(f"    return ({', '.join(f'c{index[name]}' for name in names)},)")
+
+        namespace = {"unpack_from": struct.Struct(fmt).unpack_from}
+        exec("\n".join(lines), namespace)
+        return namespace["project"]
+
+
+class RowCodec:
+    """
+    [Step 5.18] Schema 없는 파일(기본 Row 테이블)의 codec
+
+    RecordCodec과 같은 인터페이스로 Row.serialize_var / deserialize_var_from을 감쌉니다.
+    """
+
+    schema = None
+    names: Tuple[str, ...] = Row.FIELDS
+    max_size: int = Row.VAR_MAX_SIZE
+    key: Callable = staticmethod(attrgetter("user_id"))
+    encode: Callable = staticmethod(Row.serialize_var)
+    decode_from: Callable = staticmethod(Row.deserialize_var_from)
+
+    # [Step 5.19] 필드별 getter: (buffer, 본문 시작, (user_id, username 길이, email 길이))
+    _getters: ClassVar[Dict[str, Callable]] = {
+        "user_id": lambda buffer, start, head: head[0],
+        "username": lambda buffer, start, head: bytes(
+            buffer[start : start + head[1]]
+        ).decode("utf-8"),
+        "email": lambda buffer, start, head: bytes(
+            buffer[start + head[1] : start + head[1] + head[2]]
+        ).decode("utf-8"),
+    }
+
+    def projector(self, names: Sequence[str]) -> Callable[..., tuple]:
+        """
+        [Step 5.19] serialize_var Record에서 names 필드만 읽는 함수 (buffer, offset) → tuple
+
+        Raises:
+            ValueError: Row에 없는 필드 이름
+        """
+        unknown = [name for name in names if name not in self._getters]
+        if unknown:
+            raise ValueError(f"Unknown columns {unknown} (columns: {self.names})")
+        getters = tuple(self._getters[name] for name in names)
+        header = Row._var_header
+
+        def project(buffer, offset=0):
+            head = header.unpack_from(buffer, offset)
+            start = offset + header.size
+            return tuple(get(buffer, start, head) for get in getters)
+
+        return project
+
+
+ROW_CODEC = RowCodec()
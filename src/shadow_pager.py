@@ -0,0 +1,396 @@
+"""
+Step 5.23: Shadow Paging (Copy-on-Write) Pager
+
+WAL 대신 Commit을 원자적으로 만드는 방법입니다. (LMDB / System R Shadow Paging)
+B+Tree는 논리 PID로 페이지를 가리키고, 파일 안의 실제 위치(물리 PID)는 Page Map이 정합니다.
+    - 이미 Commit된 페이지를 다시 기록할 때는 제자리가 아니라 새 물리 페이지에 씀 (CoW)
+      (한 Commit 구간 안에서 두 번째 기록부터는 그 새 페이지를 덮어씀)
+    - Commit: 바뀐 Page Map 페이지와 디렉터리도 새 물리 페이지에 쓰고 fsync한 뒤,
+      Superblock의 page_map_root를 새 디렉터리로 바꾸고 fsync → 이 한 번의 기록이 Commit
+    - 크래시: Superblock이 가리키는 Page Map은 항상 마지막 Commit 상태 그대로
+      (Commit 뒤에 쓴 물리 페이지는 열 때 참조되지 않는 페이지로 회수)
+
+B+Tree의 Leaf는 sibling pointer로 연결되어 있어, 바뀐 Leaf와 조상 노드만 새 PID로 복사하는
+경로 복사(path copying)를 하면 왼쪽 Leaf들의 pointer까지 줄줄이 복사해야 합니다.
+그래서 CoW는 트리 아래의 Page Map에서 하고, "바뀐 페이지 + 그 조상(Map 페이지, 디렉터리)"을
+새로 쓴 뒤 루트(page_map_root)를 교체합니다. BTreeManager는 그대로 사용합니다.
+
+Page Map (PageType.PAGE_MAP, 페이지마다 E = (page_size - Header) // 4 개의 "<I"):
+    Superblock.page_map_root → 디렉터리 [Map 페이지 물리 PID...]
+                                  → Map 페이지 k: 논리 PID k*E .. (k+1)*E-1 의 물리 PID (0 = 없음)
+
+Snapshot:
+    snapshot()은 마지막 Commit의 Superblock(root_page_id 포함)과 Page Map을 고정한 읽기 전용 뷰입니다.
+    그 Commit의 물리 페이지는 Snapshot이 닫힐 때까지 재사용되지 않으므로,
+    Reader는 Writer와 lock 없이 os.pread로 읽습니다. (등록/해제만 짧은 lock)
+"""
+
+import os
+import struct
+import threading
+from typing import ClassVar, Dict, List, Optional, Tuple
+
+from src.page import INVALID_PAGE_ID, LeafFormat, Page, PageType
+from src.pager import Pager, SyncPolicy
+from src.schema import Schema
+from src.superblock import Superblock
+
+
+class PageSnapshot:
+    """
+    [Step 5.23] 한 Commit 시점의 읽기 전용 페이지 뷰
+
+    Attributes:
+        superblock: 그 Commit의 Superblock (root_page_id, tree_height, row_count ...)
+        generation: Commit 번호
+    """
+
+    def __init__(self, pager: "ShadowPager", superblock: Superblock):
+        self.pager = pager
+        self.superblock: Superblock = superblock
+        self.generation: int = superblock.generation
+        self._map_pids: Optional[Tuple[int, ...]] = None
+        self._map_pages: Dict[int, Tuple[int, ...]] = {}
+        # [Step 5.24] Internal 노드는 탐색마다 다시 읽으므로 Snapshot 안에서 재사용
+        self._internal_pages: Dict[int, Page] = {}
+        self.closed: bool = False
+
+    @property
+    def root_page_id(self) -> int:
+        return self.superblock.root_page_id
+
+    @property
+    def page_size(self) -> int:
+        return self.pager.page_size
+
+    @property
+    def codec(self):
+        """[Step 5.24] BTreeManager가 Record 디코딩에 쓰는 codec (Pager와 같음)"""
+        return self.pager.codec
+
+    @property
+    def key_limit(self) -> Optional[int]:
+        """[Step 5.7] BTreeManager.max_keys가 보는 Internal 용량 축소 (Pager와 같음)"""
+        return self.pager.key_limit
+
+    def physical(self, page_index: int) -> int:
+        """논리 PID → 이 Snapshot의 물리 PID (Map 페이지는 처음 필요할 때 읽어 둠)"""
+        if self._map_pids is None:
+            self._map_pids = self.pager.read_map_page(self.superblock.page_map_root)
+        k, i = divmod(page_index, self.pager.entries_per_map_page)
+        if k >= len(self._map_pids) or self._map_pids[k] == INVALID_PAGE_ID:
+            return INVALID_PAGE_ID
+        entries = self._map_pages.get(k)
+        if entries is None:
+            entries = self._map_pages[k] = self.pager.read_map_page(self._map_pids[k])
+        return entries[i]
+
+    def read_page(self, page_index: int) -> Page:
+        """Commit 시점의 페이지 (Buffer Pool을 거치지 않음, Leaf는 매번 새 Page)"""
+        if self.closed:
+            raise RuntimeError("Snapshot is closed")
+        page = self._internal_pages.get(page_index)
+        if page is not None:
+            return page
+        physical = self.physical(page_index)
+        if physical == INVALID_PAGE_ID:
+            return self.pager.new_page()
+        page = self.pager.page_from_bytes(self.pager.read_physical(physical))
+        if page.page_type == PageType.INTERNAL:
+            self._internal_pages[page_index] = page
+        return page
+
+    def close(self):
+        """Snapshot 해제 (이후 Commit에서 이 Snapshot만 쓰던 물리 페이지를 재사용)"""
+        if not self.closed:
+            self.closed = True
+            self._internal_pages.clear()
+            self.pager._release_snapshot(self.generation)
+
+    def __enter__(self) -> "PageSnapshot":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ShadowPager(Pager):
+    """
+    [Step 5.23] Copy-on-Write Pager
+
+    Buffer Pool / SyncPolicy / Free-list / 트랜잭션은 Pager와 같고,
+    디스크 기록(_write_run / _write_to_disk)과 확정(_commit)만 CoW로 바꿉니다.
+    Free-list는 논리 PID를 관리하고, 물리 페이지는 Commit과 Snapshot에 맞춰 이 클래스가 관리합니다.
+    """
+
+    SUPPORTS_PAGE_MAP: ClassVar[bool] = True
+    ATOMIC_COMMIT: ClassVar[bool] = True
+    _entry: ClassVar[struct.Struct] = struct.Struct("<I")
+
+    def __init__(
+        self,
+        filename: str,
+        pool_size: int = Pager.DEFAULT_POOL_SIZE,
+        sync_policy: SyncPolicy = SyncPolicy.BATCH,
+        sync_interval_ms: int = Pager.DEFAULT_SYNC_INTERVAL_MS,
+        page_size: int = Page.PAGE_SIZE,
+        leaf_format: LeafFormat = LeafFormat.ROWS,
+        schema: Optional[Schema] = None,
+        row_limit: Optional[int] = None,
+        key_limit: Optional[int] = None,
+    ):
+        super().__init__(
+            filename,
+            pool_size=pool_size,
+            sync_policy=sync_policy,
+            sync_interval_ms=sync_interval_ms,
+            page_size=page_size,
+            leaf_format=leaf_format,
+            schema=schema,
+            row_limit=row_limit,
+            key_limit=key_limit,
+        )
+        self.entries_per_map_page: int = (
+            self.page_size - Page.HEADER_SIZE
+        ) // self._entry.size
+
+        # 마지막 Commit의 Page Map (Writer용 사본)
+        self._map: List[int] = []
+        self._map_pids: List[int] = []
+        self._map_root: int = INVALID_PAGE_ID
+        # 이번 Commit 구간: 논리 PID → 새 물리 PID, 대체된(Commit된) 물리 PID
+        self._overlay: Dict[int, int] = {}
+        self._superseded: List[int] = []
+        # [Step 5.25] 여러 스레드의 Write-back이 물리 페이지를 동시에 할당할 때
+        self._map_lock = threading.Lock()
+
+        # 물리 페이지: 바로 재사용 가능 / Snapshot이 끝나길 기다리는 (generation, PIDs)
+        self._free_physical: List[int] = []
+        self._pending_free: List[Tuple[int, List[int]]] = []
+        self.physical_count: int = 1
+
+        # Snapshot: generation → 열려 있는 개수
+        self._snapshot_lock = threading.Lock()
+        self._snapshots: Dict[int, int] = {}
+        self._committed: Optional[bytes] = None
+
+        self._load_page_map()
+
+    @classmethod
+    def is_shadow_file(cls, filename) -> bool:
+        """[Step 5.23] Copy-on-Write로 만든 DB 파일인지 (Superblock의 page_map_root)"""
+        if not os.path.exists(filename):
+            return False
+        with open(filename, "rb") as f:
+            head = f.read(Superblock.SIZE)
+        return (
+            len(head) == Superblock.SIZE
+            and Superblock.is_superblock(head)
+            and Superblock.deserialize(head).page_map_root != INVALID_PAGE_ID
+        )
+
+    # ------------------------------------------------------------
+    # 물리 페이지 I/O
+    # ------------------------------------------------------------
+
+    def read_physical(self, physical: int) -> bytes:
+        return os.pread(self.fd, self.page_size, physical * self.page_size)
+
+    def read_map_page(self, physical: int) -> Tuple[int, ...]:
+        """Page Map 페이지(디렉터리 포함)의 항목들"""
+        data = self.read_physical(physical)
+        count = Page(data).row_count
+        return struct.unpack_from(f"<{count}I", data, Page.HEADER_SIZE)
+
+    def _write_physical(self, physical: int, data):
+        self._pwrite(data, physical * self.page_size)
+
+    def _allocate_physical(self) -> int:
+        if self._free_physical:
+            return self._free_physical.pop()
+        physical = self.physical_count
+        self.physical_count += 1
+        return physical
+
+    def _load_page_map(self):
+        """
+        Superblock의 Page Map을 읽고, 어디에서도 참조하지 않는 물리 페이지를 회수
+
+        (마지막 Commit 뒤에 쓰였던 페이지 = 크래시로 버려진 변경)
+        """
+        file_pages = max(1, os.fstat(self.fd).st_size // self.page_size)
+        used = {Superblock.PAGE_ID}
+        if self.superblock is not None:
+            self._map_root = self.superblock.page_map_root
+        if self._map_root != INVALID_PAGE_ID:
+            self._map_pids = list(self.read_map_page(self._map_root))
+            for physical in self._map_pids:
+                self._map.extend(self.read_map_page(physical))
+            used.add(self._map_root)
+            used.update(self._map_pids)
+            used.update(self._map)
+            used.discard(INVALID_PAGE_ID)
+            used.add(Superblock.PAGE_ID)
+
+        self.physical_count = max(file_pages, max(used) + 1)
+        self._free_physical = sorted(
+            set(range(1, self.physical_count)) - used, reverse=True
+        )
+        if self.superblock is not None:
+            self._committed = self.superblock.serialize()
+
+    def _physical(self, page_index: int) -> int:
+        physical = self._overlay.get(page_index)
+        if physical is not None:
+            return physical
+        if page_index < len(self._map):
+            return self._map[page_index]
+        return INVALID_PAGE_ID
+
+    # ------------------------------------------------------------
+    # Pager 기록 / 읽기 대체
+    # ------------------------------------------------------------
+
+    def _read_from_disk(self, page_index: int) -> Page:
+        physical = self._physical(page_index)
+        if physical == INVALID_PAGE_ID:
+            return self.new_page()
+        return self.page_from_bytes(self.read_physical(physical))
+
+    def _write_to_disk(self, page_index: int, page: Page):
+        self._write_run(page_index, [page])
+
+    def _write_run(self, start_pid: int, pages: List[Page]):
+        """
+        Commit된 페이지는 새 물리 페이지에, 이번 구간에 이미 옮긴 페이지는 그 자리에 기록
+
+        Raises:
+            ValueError: Page Map이 담을 수 있는 논리 PID를 넘을 때
+        """
+        limit = self.entries_per_map_page * self.entries_per_map_page
+        for i, page in enumerate(pages):
+            pid = start_pid + i
+            if pid >= limit:
+                raise ValueError(f"Page map is full ({limit} pages)")
+            with self._map_lock:
+                physical = self._overlay.get(pid)
+                if physical is None:
+                    physical = self._allocate_physical()
+                    old = self._physical(pid)
+                    if old != INVALID_PAGE_ID:
+                        self._superseded.append(old)
+                    self._overlay[pid] = physical
+            self._write_physical(physical, page.data)
+
+    def _write_superblock(self):
+        self.superblock.page_count = self.page_count
+        self._write_physical(Superblock.PAGE_ID, self.superblock.serialize())
+
+    def _commit(self):
+        """
+        CoW Commit
+
+        동작:
+            1. 이번 구간의 매핑을 Page Map에 반영, 바뀐 Map 페이지와 디렉터리를 새 물리 페이지에 기록
+            2. fsync (데이터 + Map이 디스크에 있어야 루트를 바꿀 수 있음)
+            3. Superblock(page_map_root, generation + 1) 기록 + fsync → Commit 지점
+            4. 대체된 물리 페이지는 더 오래된 Snapshot이 없을 때 재사용
+        """
+        if self.superblock is None:
+            os.fsync(self.fd)
+            return
+
+        entries = self.entries_per_map_page
+        changed = sorted({pid // entries for pid in self._overlay})
+        if self._overlay:
+            needed = max(self._overlay) + 1
+            if needed > len(self._map):
+                self._map.extend([INVALID_PAGE_ID] * (needed - len(self._map)))
+            for pid, physical in self._overlay.items():
+                self._map[pid] = physical
+
+        superseded = self._superseded
+        map_pids = list(self._map_pids)
+        if changed and changed[-1] >= len(map_pids):
+            map_pids.extend([INVALID_PAGE_ID] * (changed[-1] + 1 - len(map_pids)))
+        for k in changed:
+            physical = self._allocate_physical()
+            self._write_physical(physical, self._map_page(self._map[k * entries : (k + 1) * entries]))
+            if map_pids[k] != INVALID_PAGE_ID:
+                superseded.append(map_pids[k])
+            map_pids[k] = physical
+
+        root = self._map_root
+        if changed or root == INVALID_PAGE_ID:
+            root = self._allocate_physical()
+            self._write_physical(root, self._map_page(map_pids))
+            if self._map_root != INVALID_PAGE_ID:
+                superseded.append(self._map_root)
+        os.fsync(self.fd)
+
+        self.superblock.page_map_root = root
+        self.superblock.generation += 1
+        self._write_superblock()
+        os.fsync(self.fd)
+
+        self._map_pids, self._map_root = map_pids, root
+        self._overlay = {}
+        self._superseded = []
+        with self._snapshot_lock:
+            self._committed = self.superblock.serialize()
+        if superseded:
+            self._pending_free.append((self.superblock.generation, superseded))
+        self._reclaim()
+
+    def _map_page(self, entries: List[int]) -> bytearray:
+        page = Page(page_type=PageType.PAGE_MAP, page_size=self.page_size)
+        struct.pack_into(f"<{len(entries)}I", page.data, Page.HEADER_SIZE, *entries)
+        page.row_count = len(entries)
+        page._update_header()
+        return page.data
+
+    def rollback(self):
+        """[Step 5.22] 트랜잭션 중 새로 쓴 물리 페이지는 Commit된 적이 없으므로 바로 재사용"""
+        with self._sync_lock:
+            super().rollback()
+            with self._map_lock:
+                self._free_physical.extend(self._overlay.values())
+                self._overlay = {}
+                self._superseded = []
+
+    # ------------------------------------------------------------
+    # Snapshot
+    # ------------------------------------------------------------
+
+    def snapshot(self) -> PageSnapshot:
+        """
+        마지막 Commit 시점의 읽기 전용 뷰 (Commit되지 않은 변경은 보이지 않음)
+
+        Raises:
+            RuntimeError: 아직 Commit이 한 번도 없을 때
+        """
+        with self._snapshot_lock:
+            if self._committed is None:
+                raise RuntimeError("Nothing committed yet")
+            superblock = Superblock.deserialize(self._committed)
+            generation = superblock.generation
+            self._snapshots[generation] = self._snapshots.get(generation, 0) + 1
+        return PageSnapshot(self, superblock)
+
+    def _release_snapshot(self, generation: int):
+        with self._snapshot_lock:
+            self._snapshots[generation] -= 1
+            if self._snapshots[generation] == 0:
+                del self._snapshots[generation]
+
+    def _reclaim(self):
+        """Commit g에서 대체된 페이지는 g보다 오래된 Snapshot이 모두 닫힌 뒤 재사용"""
+        with self._snapshot_lock:
+            oldest = min(self._snapshots) if self._snapshots else None
+        waiting = []
+        for generation, pids in self._pending_free:
+            if oldest is None or oldest >= generation:
+                self._free_physical.extend(pids)
+            else:
+                waiting.append((generation, pids))
+        self._pending_free = waiting
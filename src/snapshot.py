@@ -0,0 +1,116 @@
+"""
+Step 5.24: MVCC Snapshot Read (Reader 여러 개 + Writer 하나)
+
+Table과 BTreeManager는 Pager 하나를 공유하므로, Writer가 Split으로 sibling pointer를
+바꾸는 동안 같은 Pager로 scan()하면 Row가 빠지거나 두 번 보일 수 있습니다.
+
+TableSnapshot은 Copy-on-Write 테이블([Step 5.23] ShadowPager)의 마지막 Commit을 고정한
+읽기 전용 Table입니다.
+    - Root PID / 높이 / row_count: 그 Commit의 Superblock
+    - 페이지: 그 Commit의 Page Map으로 읽음 (이후 Commit이 새 물리 페이지에 쓰므로 변하지 않음)
+    - BTreeManager / Cursor를 그대로 사용 (읽기 메서드만)
+
+Writer는 Snapshot을 기다리지 않고, Reader도 Writer의 lock을 잡지 않습니다.
+Reader 스레드마다 자기 Snapshot을 열어 쓰고, 다 읽으면 닫습니다.
+(열려 있는 동안 그 Commit의 페이지는 재사용되지 않아 파일이 커질 수 있음)
+
+사용 예:
+    with table.snapshot() as view:
+        total = sum(1 for _ in view.scan(0, 10**6))
+        assert total <= view.row_count
+"""
+
+from typing import TYPE_CHECKING, Iterator, Optional, Sequence
+
+from src.btree import BTreeManager
+from src.cursor import Cursor
+from src.row import Row
+from src.schema import Schema
+from src.shadow_pager import PageSnapshot, ShadowPager
+from src.superblock import Superblock
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from src.table import Table
+
+
+class TableSnapshot:
+    """
+    [Step 5.24] 한 Commit 시점의 읽기 전용 Table
+
+    Attributes:
+        pager: 이 Snapshot의 페이지 뷰 (PageSnapshot)
+        btree: 읽기용 BTreeManager (scan / get)
+    """
+
+    def __init__(self, table: "Table"):
+        """
+        Raises:
+            RuntimeError: Copy-on-Write 테이블이 아니거나 아직 Commit이 없을 때
+        """
+        if not isinstance(table.pager, ShadowPager):
+            raise RuntimeError("Snapshots require a copy-on-write table (copy_on_write=True)")
+        self.pager: PageSnapshot = table.pager.snapshot()
+        self._schema: Optional[Schema] = table.schema
+        self.btree = BTreeManager(self)
+
+    @property
+    def superblock(self) -> Superblock:
+        return self.pager.superblock
+
+    @property
+    def root_page_id(self) -> int:
+        return self.pager.superblock.root_page_id
+
+    @property
+    def row_count(self) -> int:
+        return self.pager.superblock.row_count
+
+    @property
+    def tree_height(self) -> int:
+        return self.pager.superblock.tree_height
+
+    @property
+    def schema(self) -> Optional[Schema]:
+        return self._schema
+
+    @property
+    def generation(self) -> int:
+        """Snapshot이 가리키는 Commit 번호"""
+        return self.pager.generation
+
+    def table_start(self, columns: Optional[Sequence[str]] = None) -> Cursor:
+        """Snapshot의 첫 번째 Row를 가리키는 Cursor (Table.table_start와 같음)"""
+        pid = self.root_page_id
+        page = self.pager.read_page(pid)
+        while not page.is_leaf:
+            _, pids = page.internal_node()
+            pid = pids[0]
+            page = self.pager.read_page(pid)
+
+        return Cursor(self, page_num=pid, cell_num=0, columns=columns)
+
+    def execute_find(self, id: int) -> Optional[Row]:
+        """Primary Key로 Row 하나 조회 (BTreeManager.get)"""
+        return self.btree.get(id)
+
+    def scan(
+        self, start_key: int, end_key: int, columns: Optional[Sequence[str]] = None
+    ) -> Iterator[Row]:
+        """범위 조회 (BTreeManager.scan, [Step 5.19] columns로 Projection)"""
+        return self.btree.scan(start_key, end_key, columns)
+
+    def scan_batches(self, start_key: int, end_key: int) -> Iterator["np.ndarray"]:
+        """[Step 5.20] Leaf마다 NumPy structured array 하나씩 (BTreeManager.scan_batches)"""
+        return self.btree.scan_batches(start_key, end_key)
+
+    def close(self):
+        """Snapshot 해제 (다음 Commit부터 이 Snapshot의 옛 페이지를 재사용)"""
+        self.pager.close()
+
+    def __enter__(self) -> "TableSnapshot":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,217 @@
+"""
+Step 5.4: Superblock (DB 파일 헤더)
+
+파일의 0번 페이지에 DB 전체 메타데이터를 고정 위치로 저장합니다.
+파일을 열 때 이 페이지 하나만 읽으면 되므로, 파일 크기와 무관하게 O(1)로 열립니다.
+
+Layout (<8sHIQIHIIB, Little-endian):
+┌───────┬─────────┬──────────┬───────────┬────────────┬────────┬───────────┬───────────┬─────────────┐
+│ magic │ version │ root_pid │ row_count │ page_count │ height │ free_head │ page_size │ leaf_format │
+│ (8B)  │  (2B)   │   (4B)   │   (8B)    │    (4B)    │  (2B)  │   (4B)    │   (4B)    │    (1B)     │
+└───────┴─────────┴──────────┴───────────┴────────────┴────────┴───────────┴───────────┴─────────────┘
+[Step 5.23] 그 뒤에 (<IQ) page_map_root | generation (Copy-on-Write 파일만, 아니면 0)
+[Step 5.18] 그 뒤에 테이블 Schema (Schema.serialize, 컬럼 수 0 = 기본 Row 테이블)
+나머지 영역은 0으로 채워 page_size를 맞춥니다.
+Superblock 자체는 항상 파일의 0번 오프셋에 있으므로, page_size를 모르는 상태에서도
+앞부분만 읽어 page_size를 알아낼 수 있습니다.
+
+0번 페이지가 Superblock이 되므로, B+Tree 노드는 PID 1부터 시작합니다.
+덕분에 INVALID_PAGE_ID(0)가 실제 노드와 절대 겹치지 않습니다.
+
+Format Version 이력:
+    1: Superblock 도입 (Leaf 10 Rows / Internal 10 Keys 고정)
+    2: [Step 5.6] 용량을 Page 크기에서 유도 (Leaf 92 Rows / Internal 510 Keys)
+       → v1 노드는 v2 용량 안에 그대로 들어가므로 헤더 버전만 올리면 됨
+       → 반대로 v2 파일을 v1 코드가 열면 넘친 노드를 읽게 되므로 거부해야 함
+    3: [Step 5.7] page_size 필드 추가 (4K/8K/16K/32K/64K)
+       → v2 이하 파일은 4096으로 간주
+    4: [Step 5.16] leaf_format 필드 추가 (LeafFormat.ROWS / KEY_DIRECTORY)
+       → v3 이하 파일은 ROWS로 간주
+       [Step 5.17] leaf_format 값 SLOTTED(2) 추가 (필드는 그대로, 모르는 값은 열 때 거부)
+    5: [Step 5.18] 고정 필드 뒤에 Schema 추가
+       → v4 이하 파일은 그 영역이 0이므로 Schema 없음(기본 Row 테이블)으로 간주
+    6: [Step 5.23] 고정 필드와 Schema 사이에 page_map_root, generation 추가
+       → v5 파일은 Schema가 바로 고정 필드 뒤에 있고, page_map_root = 0 (제자리 갱신 파일)
+"""
+
+import struct
+from typing import ClassVar, Optional
+
+from src.page import INVALID_PAGE_ID, LeafFormat, Page
+from src.schema import Schema
+
+
+class Superblock:
+    """
+    DB 파일 헤더 (0번 페이지)
+
+    Attributes:
+        format_version: 파일 포맷 버전
+        root_page_id: B+Tree Root PID
+        row_count: 전체 Row 개수
+        page_count: 할당된 페이지 개수 (Superblock 포함)
+        tree_height: B+Tree 높이 (Leaf만 있으면 1)
+        free_list_head: 재사용 가능한 첫 페이지 (없으면 INVALID_PAGE_ID)
+        page_size: 이 파일의 페이지 크기 (생성 시 결정, 이후 변경 불가)
+        leaf_format: Leaf 본문 배치 (생성 시 결정, 이후 변경 불가)
+        schema: 테이블 Schema (None이면 기본 Row 테이블, 생성 시 결정)
+        page_map_root: [Step 5.23] Copy-on-Write 파일의 Page Map 디렉터리 (물리 PID, 0이면 미사용)
+        generation: [Step 5.23] Commit 번호 (Copy-on-Write 파일에서 Commit마다 1 증가)
+    """
+
+    MAGIC: ClassVar[bytes] = b"PYMINIDB"
+    FORMAT_VERSION: ClassVar[int] = 6
+    PAGE_ID: ClassVar[int] = 0
+
+    STRUCT_FORMAT: ClassVar[str] = "<8sHIQIHIIB"
+    _struct: ClassVar[struct.Struct] = struct.Struct(STRUCT_FORMAT)
+    # [Step 5.23] v6 필드 (page_map_root, generation)
+    _shadow_struct: ClassVar[struct.Struct] = struct.Struct("<IQ")
+    SIZE: ClassVar[int] = _struct.size + _shadow_struct.size
+
+    __slots__ = (
+        "format_version",
+        "root_page_id",
+        "row_count",
+        "page_count",
+        "tree_height",
+        "free_list_head",
+        "page_size",
+        "leaf_format",
+        "schema",
+        "page_map_root",
+        "generation",
+    )
+
+    def __init__(
+        self,
+        root_page_id: int = INVALID_PAGE_ID,
+        row_count: int = 0,
+        page_count: int = 1,
+        tree_height: int = 0,
+        free_list_head: int = INVALID_PAGE_ID,
+        format_version: int = FORMAT_VERSION,
+        page_size: int = Page.PAGE_SIZE,
+        leaf_format: LeafFormat = LeafFormat.ROWS,
+        schema: Optional[Schema] = None,
+        page_map_root: int = INVALID_PAGE_ID,
+        generation: int = 0,
+    ):
+        self.format_version: int = format_version
+        self.root_page_id: int = root_page_id
+        self.row_count: int = row_count
+        self.page_count: int = page_count
+        self.tree_height: int = tree_height
+        self.free_list_head: int = free_list_head
+        self.page_size: int = page_size
+        self.leaf_format: LeafFormat = leaf_format
+        self.schema: Optional[Schema] = schema
+        self.page_map_root: int = page_map_root
+        self.generation: int = generation
+
+    @classmethod
+    def is_superblock(cls, data: bytes) -> bool:
+        """data가 Superblock으로 시작하는지 (magic 비교)"""
+        return bytes(data[: len(cls.MAGIC)]) == cls.MAGIC
+
+    @classmethod
+    def peek_page_size(cls, head: bytes) -> int:
+        """[Step 5.18] 앞부분(SIZE bytes)만으로 page_size 확인 (0번 페이지 전체를 읽기 전)"""
+        values = cls._struct.unpack_from(head, 0)
+        return values[7] if values[1] >= 3 else Page.PAGE_SIZE
+
+    def serialize(self) -> bytes:
+        """
+        Superblock → page_size 길이의 바이트 (남는 영역은 0)
+
+        Raises:
+            ValueError: [Step 5.18] Schema가 0번 페이지에 들어가지 않을 때
+        """
+        body = self._struct.pack(
+            self.MAGIC,
+            self.format_version,
+            self.root_page_id,
+            self.row_count,
+            self.page_count,
+            self.tree_height,
+            self.free_list_head,
+            self.page_size,
+            self.leaf_format,
+        ) + self._shadow_struct.pack(self.page_map_root, self.generation)
+        if self.schema is not None:
+            body += self.schema.serialize()
+        if len(body) > self.page_size:
+            raise ValueError(
+                f"Schema does not fit in the superblock page ({len(body)} > {self.page_size})"
+            )
+        return body + bytes(self.page_size - len(body))
+
+    @classmethod
+    def deserialize(cls, data: bytes) -> "Superblock":
+        """
+        바이트 → Superblock
+
+        [Step 5.18] Schema는 고정 필드 뒤에 있으므로 0번 페이지 전체를 넘겨야 읽힘
+        (앞부분 SIZE bytes만 넘기면 schema=None)
+
+        Raises:
+            ValueError: magic이 맞지 않거나, 지원하지 않는 버전일 때
+        """
+        (
+            magic,
+            format_version,
+            root_page_id,
+            row_count,
+            page_count,
+            tree_height,
+            free_list_head,
+            page_size,
+            leaf_format,
+        ) = cls._struct.unpack_from(data, 0)
+
+        if magic != cls.MAGIC:
+            raise ValueError(f"Not a PyMiniDB file (magic={magic!r})")
+        if format_version > cls.FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported format version {format_version} "
+                f"(this build supports <= {cls.FORMAT_VERSION})"
+            )
+        if format_version < 3:
+            page_size = Page.PAGE_SIZE
+        if format_version < 4:
+            leaf_format = LeafFormat.ROWS
+        page_map_root, generation = INVALID_PAGE_ID, 0
+        schema_offset = cls._struct.size
+        if format_version >= 6:
+            schema_offset = cls.SIZE
+            if len(data) >= cls.SIZE:
+                page_map_root, generation = cls._shadow_struct.unpack_from(
+                    data, cls._struct.size
+                )
+        schema = None
+        if format_version >= 5 and len(data) > schema_offset:
+            schema = Schema.deserialize(data, schema_offset)
+
+        return cls(
+            root_page_id=root_page_id,
+            row_count=row_count,
+            page_count=page_count,
+            tree_height=tree_height,
+            free_list_head=free_list_head,
+            format_version=format_version,
+            page_size=page_size,
+            leaf_format=LeafFormat(leaf_format),
+            schema=schema,
+            page_map_root=page_map_root,
+            generation=generation,
+        )
+
+    def __repr__(self):
+        return (
+            f"Superblock(v{self.format_version}, root={self.root_page_id}, "
+            f"rows={self.row_count}, pages={self.page_count}, "
+            f"height={self.tree_height}, free={self.free_list_head}, "
+            f"page_size={self.page_size}, leaf_format={self.leaf_format.name}, "
+            f"schema={self.schema}, page_map_root={self.page_map_root}, "
+            f"generation={self.generation})"
+        )
@@ -1,8 +1,16 @@
-from src.pager import Pager
-from src.page import Page, PageType
+from src.pager import Pager, SyncPolicy
+from src.mmap_pager import MmapPager
+from src.shadow_pager import ShadowPager
+from src.snapshot import TableSnapshot
+from src.page import LeafFormat, Page, PageType
 from src.row import Row
+from src.schema import Schema
 from src.cursor import Cursor
 from src.node import BTreeNode
+from src.superblock import Superblock
+from src.btree import BTreeManager
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional, Sequence
 import os
 import bisect
 
@@ -12,56 +20,268 @@ class Table:
     Table: 논리적 데이터베이스 조율자 (Coordinator)
 
     책임:
-    1. 메타데이터 관리 (전체 Row 개수)
+    1. 메타데이터 관리 (Superblock: Root PID, 전체 Row 개수, 트리 높이)
     2. Cursor 생성 (Factory)
     3. 고수준 연산 제공 (insert, select)
 
     중요:
     - Table은 Page를 직접 다루지 않음
-    - 모든 물리적 작업은 Cursor에게 위임
+    - 삽입은 BTreeManager, 순회는 Cursor에게 위임
     """
 
-    def __init__(self, filename: str = "mydb.db"):
+    def __init__(
+        self,
+        filename: str = "mydb.db",
+        pool_size: int = Pager.DEFAULT_POOL_SIZE,
+        sync_policy: SyncPolicy = SyncPolicy.BATCH,
+        sync_interval_ms: int = Pager.DEFAULT_SYNC_INTERVAL_MS,
+        use_mmap: bool = False,
+        page_size: int = Page.PAGE_SIZE,
+        leaf_format: LeafFormat = LeafFormat.ROWS,
+        schema: Optional[Schema] = None,
+        wal: bool = False,
+        copy_on_write: bool = False,
+        row_limit: Optional[int] = None,
+        key_limit: Optional[int] = None,
+    ):
         """
         Table 생성자
 
         Args:
             filename: 데이터베이스 파일 경로
+            pool_size: Buffer Pool Frame 개수
+            sync_policy: Durability 정책 (SyncPolicy 참고)
+            sync_interval_ms: SyncPolicy.INTERVAL일 때 Checkpoint 주기
+            use_mmap: True면 Buffer Pool 대신 MmapPager 사용 (읽기 위주 환경)
+            page_size: [Step 5.7] 새 파일의 페이지 크기 (기존 파일은 헤더 값 사용)
+            leaf_format: [Step 5.16] 새 파일의 Leaf 배치 (기존 파일은 헤더 값 사용)
+            schema: [Step 5.18] 새 파일의 테이블 Schema (기존 파일은 헤더 값 사용)
+                    None이면 기본 Row 테이블, 지정하면 Leaf는 항상 SLOTTED
+            wal: [Step 5.21] Write-Ahead Log 사용 (sync()가 Commit, 크래시 후 열면 Redo)
+                 mmap은 페이지를 제자리에서 수정하므로 함께 쓸 수 없음
+            copy_on_write: [Step 5.23] 새 파일을 ShadowPager(Copy-on-Write)로 생성
+                           (기존 파일은 헤더 값 사용, WAL / mmap과 함께 쓸 수 없음)
+            row_limit / key_limit: [Step 5.7] Leaf / Internal 용량 축소 (Pager 참고)
+                                   작은 트리로 Split / Merge를 시험할 때, 파일 배치는 그대로
 
         동작:
             1. Pager 생성
-            2. 파일 크기를 기반으로 row_count 복구
-                - 파일이 없으면 row_count = 0
-                - 파일이 있으면:
-                  a. page_count = file_size // PAGE_SIZE
-                  b. 마지막 페이지 로드
-                  c. row_count = (page_count - 1) * MAX_ROWS + last_page.row_count
+            2. [Step 5.4] Superblock(0번 페이지)에서 메타데이터 복구 - O(1)
+                - 빈 파일이면 Superblock + 빈 Root Leaf(PID 1) 생성
+                - Superblock 없는 구버전 파일이면 1회 업그레이드
 
         주의:
             - 파일이 없으면 Pager가 자동으로 생성
-            - row_count는 항상 정확해야 함 (Cursor가 의존)
+            - root_page_id, row_count, tree_height는 Superblock에 보관되어
+              sync()/close() 시 함께 디스크에 기록됨
         """
-        self.pager = Pager(filename)
+        if schema is not None:
+            # Schema Record는 가변 길이이므로 Slotted Leaf에 저장
+            leaf_format = LeafFormat.SLOTTED
+
+        if use_mmap and wal:
+            raise ValueError("WAL mode requires the buffer-pool Pager (use_mmap=False)")
+
+        if os.path.exists(filename) and os.path.getsize(filename) > 0:
+            copy_on_write = ShadowPager.is_shadow_file(filename)
+        if copy_on_write and (use_mmap or wal):
+            raise ValueError("Copy-on-write mode cannot be combined with WAL or mmap")
+
+        if copy_on_write:
+            self.pager = ShadowPager(
+                filename,
+                pool_size=pool_size,
+                sync_policy=sync_policy,
+                sync_interval_ms=sync_interval_ms,
+                page_size=page_size,
+                leaf_format=leaf_format,
+                schema=schema,
+                row_limit=row_limit,
+                key_limit=key_limit,
+            )
+        elif use_mmap:
+            self.pager = MmapPager(
+                filename,
+                sync_policy=sync_policy,
+                sync_interval_ms=sync_interval_ms,
+                page_size=page_size,
+                leaf_format=leaf_format,
+                schema=schema,
+                row_limit=row_limit,
+                key_limit=key_limit,
+            )
+        else:
+            self.pager = Pager(
+                filename,
+                pool_size=pool_size,
+                sync_policy=sync_policy,
+                sync_interval_ms=sync_interval_ms,
+                page_size=page_size,
+                leaf_format=leaf_format,
+                schema=schema,
+                wal=wal,
+                row_limit=row_limit,
+                key_limit=key_limit,
+            )
+
+        if self.pager.superblock is None:
+            if self.pager.page_count == 0:
+                self._create_database()
+            else:
+                self._upgrade_legacy_file()
+        elif self.superblock.format_version < Superblock.FORMAT_VERSION:
+            self._migrate_format()
+
+        self.btree = BTreeManager(self)
+
+    # ------------------------------------------------------------
+    # [Step 5.4] Superblock 위임 속성
+    # ------------------------------------------------------------
+
+    @property
+    def superblock(self) -> Superblock:
+        return self.pager.superblock
+
+    @property
+    def root_page_id(self) -> int:
+        """B+Tree Root PID (Superblock에 저장)"""
+        return self.pager.superblock.root_page_id
+
+    @root_page_id.setter
+    def root_page_id(self, pid: int):
+        self.pager.superblock.root_page_id = pid
+
+    @property
+    def row_count(self) -> int:
+        """전체 Row 개수 (Superblock에 저장)"""
+        return self.pager.superblock.row_count
+
+    @row_count.setter
+    def row_count(self, count: int):
+        self.pager.superblock.row_count = count
+
+    @property
+    def schema(self) -> Optional[Schema]:
+        """[Step 5.18] 테이블 Schema (None이면 기본 Row 테이블)"""
+        return self.pager.schema
+
+    @property
+    def tree_height(self) -> int:
+        """B+Tree 높이 (Root가 Leaf면 1)"""
+        return self.pager.superblock.tree_height
+
+    @tree_height.setter
+    def tree_height(self, height: int):
+        self.pager.superblock.tree_height = height
+
+    def _create_database(self):
+        """빈 파일 초기화: Superblock(PID 0) + 빈 Root Leaf(PID 1)"""
+        superblock = self.pager.init_superblock()
+        root_pid = self.pager.get_new_page_id()
+        self.pager.write_page(root_pid, self.pager.new_page(PageType.LEAF))
+
+        superblock.root_page_id = root_pid
+        superblock.tree_height = 1
+
+        if isinstance(self.pager, ShadowPager):
+            # [Step 5.23] 첫 Commit으로 page_map_root를 기록해야
+            # 다시 열 때 Superblock 없는 구버전 파일로 오인되지 않음
+            self.pager.sync()
+
+    def _upgrade_legacy_file(self):
+        """
+        Superblock이 없는 구버전 파일(0번 페이지 = 최초 Root Leaf)을 업그레이드
+
+        동작 (1회성, O(N)):
+            1. 0번 페이지를 파일 끝(PID N)으로 복사
+            2. Internal 노드의 자식 PID 0 → N으로 교체
+            3. 어떤 Internal에서도 참조되지 않는 Internal = Root
+               (Internal이 없으면 옮긴 Leaf N이 Root)
+            4. 0번 자리에 Superblock 생성
+            5. Leaf chain을 따라 row_count, 높이 계산
+
+        Note:
+            구버전 Leaf chain에서는 0번이 항상 가장 왼쪽 Leaf이므로
+            sibling pointer가 0을 가리키는 경우는 없습니다.
+        """
+        # 구버전 Leaf는 항상 ROWS 배치
+        self.pager.leaf_format = LeafFormat.ROWS
+        old_count = self.pager.page_count
+        moved_pid = old_count
+        old_root = self.pager.page_from_bytes(bytes(self.pager.read_page(0).data))
+        self.pager.write_page(moved_pid, old_root)
+
+        referenced = set()
+        internal_pids = []
+        for pid in range(1, old_count):
+            page = self.pager.read_page(pid)
+            if page.is_leaf:
+                continue
+            keys, pids = page.read_internal_node()
+            if 0 in pids:
+                pids = [moved_pid if child == 0 else child for child in pids]
+                page.write_internal_node(keys, pids)
+                self.pager.write_page(pid, page)
+            internal_pids.append(pid)
+            referenced.update(pids)
+
+        roots = [pid for pid in internal_pids if pid not in referenced]
+        root_pid = max(roots) if roots else moved_pid
+
+        superblock = self.pager.init_superblock()
+        superblock.root_page_id = root_pid
+
+        height = 1
+        page = self.pager.read_page(root_pid)
+        while not page.is_leaf:
+            _, pids = page.internal_node()
+            page = self.pager.read_page(pids[0])
+            height += 1
+        superblock.tree_height = height
 
-        # [Step 4.2] B+Tree Root Page ID (기본값: 0)
-        self.root_page_id = 0
+        row_count = page.row_count
+        while page.has_next_sibling:
+            page = self.pager.read_page(page.next_sibling_id)
+            row_count += page.row_count
+        superblock.row_count = row_count
 
-        if self.pager.page_count == 0:
-            self.last_page_index = 0
-            self.row_count = 0
-        else:
-            self.last_page_index = self.pager.page_count - 1
-            # 테이블에 존재하는 모든 row의 총 개수
-            self.row_count = (
-                (self.pager.page_count - 1) * Page.MAX_ROWS
-            ) + self.pager.read_page(self.last_page_index).row_count
+        self.pager.sync()
 
-    def table_start(self) -> Cursor:
+    def _migrate_format(self):
         """
-        테이블의 첫 번째 Row를 가리키는 Cursor 반환
+        [Step 5.6] 구버전 포맷을 현재 포맷으로 올림
 
-        Returns:
-            Cursor: row_index=0인 Cursor
+        v1 → v2: v1 노드(10 Rows / 10 Keys)는 v2 용량(92 / 510) 안에 그대로 유효하므로
+                 페이지는 건드리지 않고 버전만 갱신합니다. 기존 노드는 이후 삽입되는
+                 Row로 새 용량까지 채워집니다.
+        """
+        superblock = self.superblock
+        if superblock.format_version == 1:
+            superblock.format_version = 2
+        if superblock.format_version == 2:
+            # v2 → v3: page_size 필드 추가 (v2 파일은 항상 4096)
+            superblock.format_version = 3
+        if superblock.format_version == 3:
+            # v3 → v4: leaf_format 필드 추가 (v3 파일은 항상 ROWS)
+            superblock.format_version = 4
+        if superblock.format_version == 4:
+            # v4 → v5: Schema 영역 추가 (v4 파일은 그 영역이 0 → 기본 Row 테이블)
+            superblock.format_version = 5
+        if superblock.format_version == 5:
+            # v5 → v6: page_map_root / generation 추가 (v5 파일은 제자리 갱신 → 0)
+            superblock.format_version = 6
+
+        self.pager.sync()
+
+    # ------------------------------------------------------------
+    # Cursor Factory
+    # ------------------------------------------------------------
+
+    def table_start(self, columns: Optional[Sequence[str]] = None) -> Cursor:
+        """
+        테이블의 첫 번째 Row(가장 왼쪽 Leaf의 0번 셀)를 가리키는 Cursor 반환
+
+        [Step 5.19] columns를 주면 current_cell()이 해당 컬럼만 담은 tuple을 반환
 
         사용 예:
             cursor = table.table_start()
@@ -69,24 +289,30 @@ class Table:
                 print(cursor.current_cell())
                 cursor.advance()
         """
-        return Cursor(self, row_index=0)
+        pid = self.root_page_id
+        page = self.pager.read_page(pid)
+        while not page.is_leaf:
+            _, pids = page.internal_node()
+            pid = pids[0]
+            page = self.pager.read_page(pid)
+
+        return Cursor(self, page_num=pid, cell_num=0, columns=columns)
 
     def table_end(self) -> Cursor:
         """
-        테이블의 끝(삽입 위치)을 가리키는 Cursor 반환
-
-        Returns:
-            Cursor: row_index=self.row_count인 Cursor
-
-        사용 예:
-            cursor = table.table_end()
-            cursor.save(Row(1, "alice", "alice@test.com"))
+        테이블의 끝(가장 오른쪽 Leaf의 마지막 셀 다음)을 가리키는 Cursor 반환
 
         주의:
             - 이 Cursor는 end_of_table=True 상태
-            - save() 호출 후 table.row_count를 증가시켜야 함
         """
-        return Cursor(self, row_index=self.row_count)
+        pid = self.root_page_id
+        page = self.pager.read_page(pid)
+        while not page.is_leaf:
+            _, pids = page.internal_node()
+            pid = pids[-1]
+            page = self.pager.read_page(pid)
+
+        return Cursor(self, page_num=pid, cell_num=page.row_count)
 
     def find_leaf(self, key: int) -> int:
         """
@@ -101,7 +327,7 @@ class Table:
         알고리즘:
             1. Root Page 로드 (self.root_page_id)
             2. while page.is_leaf == False:
-                a. keys, pids = page.read_internal_node()
+                a. keys, pids = page.internal_node()
                 b. bisect.bisect_right(keys, key)로 구간 찾기
                 c. pids[index] 페이지로 이동
             3. leaf page id 반환
@@ -109,54 +335,121 @@ class Table:
         page = self.pager.read_page(self.root_page_id)
         pid = self.root_page_id
         while not page.is_leaf:
-            keys, childs = page.read_internal_node()
+            keys, childs = page.internal_node()
             idx = bisect.bisect_right(keys, key)
             pid = childs[idx]
             page = self.pager.read_page(pid)
 
         return pid
 
-    def execute_insert(self, id: int, username: str, email: str) -> bool:
+    def _record(self, values: Sequence):
+        """
+        [Step 5.18] 컬럼 순서의 값들 → 이 테이블의 Record
+
+        기본 테이블은 Row(id, username, email), Schema 테이블은 tuple입니다.
+        """
+        if self.schema is None:
+            return Row(*values)
+        return self.schema.make(values)
+
+    def execute_insert(self, *values) -> bool:
         """
         Row 삽입 연산
 
         Args:
-            id: Primary Key (정수)
-            username: 사용자 이름
-            email: 이메일
+            values: [Step 5.18] 컬럼 순서의 값
+                    (기본 테이블: id, username, email / Schema 테이블: Schema 컬럼 순서)
 
         Returns:
             bool: 삽입 성공 여부
 
         동작:
-            1. Row 객체 생성
-            2. table_end()로 삽입 위치 Cursor 생성
-            3. cursor.save(row)로 저장
-            4. self.row_count += 1 (메타데이터 갱신)
-
-        중요:
-            - Page 전환 로직은 Cursor가 처리
-            - Table은 row_count만 관리
+            1. Row 객체 생성 ([Step 5.18] Schema 테이블이면 tuple Record)
+            2. [Step 5.4] BTreeManager.insert로 정렬된 위치에 삽입
+               (row_count는 BTreeManager가 갱신)
 
         예시:
             table.execute_insert(1, "alice", "alice@test.com")
-            # → Cursor가 알아서 올바른 Page에 저장
         """
-        # 🔧 Row 객체 생성
-        row = Row(id, username, email)
+        inserted = self.btree.insert(self._record(values))
+        self.pager.sync_if_due()
+        return inserted
+
+    def execute_find(self, id: int) -> Optional[Row]:
+        """
+        [Step 5.8] Primary Key로 Row 하나 조회 (BTreeManager.get 위임)
+
+        Args:
+            id: 찾을 Primary Key
+
+        Returns:
+            Optional[Row]: 찾은 Row (없으면 None, [Step 5.18] Schema 테이블이면 tuple)
+
+        예시:
+            table.execute_find(1)
+            # → Row(id=1, username='alice', email='alice@test.com')
+        """
+        return self.btree.get(id)
 
-        # 끝 위치 Cursor 생성
-        end_cell = self.table_end()
+    def execute_update(self, *values) -> bool:
+        """
+        [Step 5.11] 기존 Row 수정 (BTreeManager.update 위임)
 
-        # Row 저장 (Cursor.save가 row_count 증가 처리)
-        end_cell.save(row)
+        Args:
+            values: execute_insert와 같음 (첫 값이 수정할 키)
 
-        return True
+        Returns:
+            bool: 수정했으면 True, 없는 키면 False
+        """
+        updated = self.btree.update(values[0], self._record(values))
+        self.pager.sync_if_due()
+        return updated
 
-    def execute_select(self):
+    def execute_upsert(self, *values) -> bool:
+        """
+        [Step 5.11] 있으면 수정, 없으면 삽입 (BTreeManager.upsert 위임)
+
+        Returns:
+            bool: 새로 삽입했으면 True, 기존 Row를 수정했으면 False
+        """
+        inserted = self.btree.upsert(self._record(values))
+        self.pager.sync_if_due()
+        return inserted
+
+    def execute_insert_many(self, rows: Iterable[Sequence]) -> int:
+        """
+        [Step 5.14] 여러 Row를 한 번에 삽입 (BTreeManager.insert_many 위임)
+
+        Args:
+            rows: 컬럼 순서의 값 튜플들 (기본 테이블: (id, username, email))
+
+        Returns:
+            int: 삽입한 Row 개수
+
+        예시:
+            table.execute_insert_many([(1, "alice", "a@t.com"), (2, "bob", "b@t.com")])
+        """
+        count = self.btree.insert_many(self._record(fields) for fields in rows)
+        self.pager.sync_if_due()
+        return count
+
+    def execute_delete(self, id: int) -> bool:
+        """
+        [Step 5.10] Primary Key로 Row 삭제 (BTreeManager.delete 위임)
+
+        Returns:
+            bool: 삭제했으면 True, 없는 키면 False
+        """
+        deleted = self.btree.delete(id)
+        self.pager.sync_if_due()
+        return deleted
+
+    def execute_select(self, columns: Optional[Sequence[str]] = None):
         """
         전체 Row 조회 연산
 
+        [Step 5.19] columns를 주면 해당 컬럼만 출력 (Projection)
+
         동작:
             1. table_start()로 시작 Cursor 생성
             2. while not cursor.end_of_table:
@@ -164,23 +457,102 @@ class Table:
                 b. cursor.advance()
 
         중요:
-            - Page 전환은 Cursor.current_cell()이 자동 처리
+            - Leaf 간 이동은 Cursor.advance()가 sibling pointer로 처리
             - Table은 반복문만 관리
 
         예시:
             table.execute_select()
-            # → 모든 Row 출력 (여러 Page 자동 순회)
+            # → 모든 Row를 key 순서로 출력
         """
-        cur = self.table_start()
+        cur = self.table_start(columns)
         while not cur.end_of_table:
             print(cur.current_cell())
             cur.advance()
 
+    def sync(self):
+        """
+        [Step 5.2] 지금까지의 변경을 디스크에 확정 (Pager.sync 위임)
+
+        [Step 5.22] 트랜잭션 중에는 commit()까지 미뤄짐
+        """
+        self.pager.sync()
+
+    # ------------------------------------------------------------
+    # [Step 5.22] Transaction
+    # ------------------------------------------------------------
+
+    @property
+    def in_transaction(self) -> bool:
+        return self.pager.in_transaction
+
+    def begin(self):
+        """
+        [Step 5.22] 명시적 트랜잭션 시작 (Pager.begin 위임)
+
+        commit()까지의 변경은 DB 파일에 쓰이지 않고, commit() 때 sync 한 번으로 확정됩니다.
+        Commit이 원자적인 WAL 모드(wal=True) 또는 copy_on_write 테이블에서만 사용할 수 있습니다.
+
+        Raises:
+            RuntimeError: WAL / Copy-on-Write가 아닌 테이블
+        """
+        self.pager.begin()
+
+    def commit(self):
+        """[Step 5.22] 트랜잭션 확정"""
+        self.pager.commit()
+
+    def rollback(self):
+        """[Step 5.22] 트랜잭션 취소 (B+Tree 경로 캐시도 무효화)"""
+        self.pager.rollback()
+        self.btree._rightmost_path = None
+
+    @contextmanager
+    def transaction(self) -> Iterator["Table"]:
+        """
+        [Step 5.22] with 블록을 하나의 트랜잭션으로 실행 (예외가 나면 rollback)
+
+        예시:
+            with table.transaction():
+                for i in range(10_000):
+                    table.execute_insert(i, f"user{i}", f"{i}@t.com")
+        """
+        self.begin()
+        try:
+            yield self
+        except BaseException:
+            self.rollback()
+            raise
+        self.commit()
+
+    def snapshot(self) -> TableSnapshot:
+        """
+        [Step 5.24] 마지막 Commit 시점의 읽기 전용 뷰 (Copy-on-Write 테이블만)
+
+        다른 스레드의 Writer가 계속 insert / sync해도 Snapshot의 scan / find 결과는
+        변하지 않습니다. Commit(sync) 전의 변경은 보이지 않습니다.
+
+        예시:
+            with table.snapshot() as view:
+                rows = list(view.scan(0, 100))
+
+        Raises:
+            RuntimeError: copy_on_write 테이블이 아닐 때
+        """
+        return TableSnapshot(self)
+
+    def checkpoint(self):
+        """
+        [Step 5.21] Commit 후 WAL 내용을 DB 파일에 반영 (Pager.checkpoint 위임)
+
+        [Step 5.22] 트랜잭션 중에는 RuntimeError (commit / rollback 후 호출)
+        """
+        self.pager.checkpoint()
+
     def close(self):
         """
         데이터베이스 연결 종료
 
         동작:
-            - Pager.close() 호출하여 파일 핸들 닫기
+            - Pager.close() 호출하여 dirty 페이지 기록 후 파일 핸들 닫기
         """
         self.pager.close()
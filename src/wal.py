@@ -0,0 +1,261 @@
+"""
+Step 5.21: Write-Ahead Log (WAL)
+
+WAL 모드에서는 페이지를 DB 파일에 바로 덮어쓰지 않고, 페이지 이미지(Frame)를
+"<DB 파일>-wal" 로그 끝에 덧붙입니다. (SQLite WAL과 같은 물리 로그)
+    - Eviction / write_pages / sync가 기록하는 페이지 → Frame 추가 (DB 파일은 그대로)
+    - sync() = Commit: dirty 페이지 Frame들 + Superblock Frame(commit 표시) + fsync 한 번
+    - 읽기: 로그에 더 새 이미지가 있으면 그것을 읽음 (pid → 마지막 Frame 위치 index)
+    - Checkpoint: 커밋된 최신 이미지를 DB 파일에 반영하고 로그를 비움
+    - Recovery (열 때): 마지막 commit Frame까지만 DB 파일에 다시 적용(Redo), 그 뒤는 버림
+
+Split 도중(자식은 기록, 부모는 아직) 크래시가 나도 commit Frame이 없으므로 반영되지 않고,
+root_page_id 등 메타데이터는 Superblock Frame으로 같은 Commit에 묶입니다.
+
+File Layout (Little-endian):
+    Header (<8sHII): magic | version | page_size | salt
+    Frame  (<IIBI + page_size bytes): salt | pid | commit | crc32 | page image
+- salt: Checkpoint마다 바뀜 → 잘림(truncate)이 디스크에 반영되기 전 크래시로 남은
+  옛 Frame을 새 Frame과 구분
+- crc32: salt / pid / commit + page image (찢어진 마지막 Frame 감지)
+
+Group Commit:
+    commit()을 동시에 부른 스레드 중 하나(leader)만 fsync하고, 그동안 도착한
+    Commit들은 leader의 fsync가 끝나면 함께 durable이 됩니다. (Frame 기록은 lock 안에서 순서대로)
+    append가 돌려주는 위치(LSN)는 Checkpoint로 로그를 비워도 줄어들지 않으므로,
+    Checkpoint 전에 받은 LSN으로 나중에 commit(lsn)을 불러도 됩니다. (이미 DB 파일에 반영됨)
+"""
+
+import os
+import struct
+import threading
+import zlib
+from typing import BinaryIO, ClassVar, Dict, Iterable, Optional, Tuple
+
+
+class WriteAheadLog:
+    """
+    [Step 5.21] 페이지 이미지 WAL
+
+    Attributes:
+        path: 로그 파일 경로
+        page_size: Frame 하나의 페이지 크기
+        frame_count: 마지막 Checkpoint 이후 기록된 Frame 수
+        fsync_count: 로그 fsync 횟수 (Group Commit 효과 측정용)
+    """
+
+    MAGIC: ClassVar[bytes] = b"PYMDBWAL"
+    VERSION: ClassVar[int] = 1
+    SUFFIX: ClassVar[str] = "-wal"
+
+    _header_struct: ClassVar[struct.Struct] = struct.Struct("<8sHII")
+    _frame_struct: ClassVar[struct.Struct] = struct.Struct("<IIBI")
+    # crc 계산 대상 (salt, pid, commit)
+    _prefix_struct: ClassVar[struct.Struct] = struct.Struct("<IIB")
+    HEADER_SIZE: ClassVar[int] = _header_struct.size
+    FRAME_HEADER_SIZE: ClassVar[int] = _frame_struct.size
+
+    def __init__(self, path: str, page_size: int):
+        """
+        새 (빈) 로그 생성. 기존 로그가 있으면 먼저 recover()로 반영한 뒤 호출해야 합니다.
+        """
+        self.path: str = path
+        self.page_size: int = page_size
+        self.fd: int = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        self.salt: int = int.from_bytes(os.urandom(4), "little")
+        self.index: Dict[int, int] = {}
+        self.frame_count: int = 0
+        self.fsync_count: int = 0
+
+        # Group Commit 상태: _end까지 기록됨, _durable까지 fsync됨 (둘 다 LSN)
+        # 파일 위치 = LSN - _base (Checkpoint마다 _base가 늘어 LSN은 계속 증가)
+        self._cond = threading.Condition()
+        self._syncing: bool = False
+        self._base: int = 0
+        self._end: int = self.HEADER_SIZE
+        self._durable: int = self.HEADER_SIZE
+        self._reset()
+
+    @classmethod
+    def path_for(cls, db_path) -> str:
+        """DB 파일 경로 → 로그 파일 경로"""
+        return f"{db_path}{cls.SUFFIX}"
+
+    @property
+    def frame_size(self) -> int:
+        return self.FRAME_HEADER_SIZE + self.page_size
+
+    def append(self, frames: Iterable[Tuple[int, bytes]], commit: bool = False) -> int:
+        """
+        Frame들을 로그 끝에 한 번의 write로 추가 (fsync는 commit()에서)
+
+        Args:
+            frames: (pid, page image) 목록
+            commit: True면 마지막 Frame에 commit 표시 (여기까지가 한 트랜잭션)
+
+        Returns:
+            int: 기록 후 로그 끝 위치 LSN (commit(lsn)에 전달)
+        """
+        frames = list(frames)
+        with self._cond:
+            chunks = []
+            for i, (pid, data) in enumerate(frames):
+                is_commit = commit and i == len(frames) - 1
+                chunks.append(self._encode_frame(pid, bytes(data), is_commit))
+            offset = self._end - self._base
+            os.pwrite(self.fd, b"".join(chunks), offset)
+            for pid, _ in frames:
+                self.index[pid] = offset + self.FRAME_HEADER_SIZE
+                offset += self.frame_size
+            self._end += len(frames) * self.frame_size
+            self.frame_count += len(frames)
+            return self._end
+
+    def commit(self, lsn: Optional[int] = None):
+        """
+        lsn(기본: 현재 로그 끝)까지 디스크에 확정 (Group Commit)
+
+        이미 다른 스레드가 fsync 중이면 기다렸다가, 그 fsync가 내 Frame까지
+        포함하지 않았을 때만 다음 leader가 되어 fsync합니다.
+        """
+        with self._cond:
+            target = self._end if lsn is None else lsn
+            while self._durable < target:
+                if self._syncing:
+                    self._cond.wait()
+                    continue
+                self._syncing = True
+                end = self._end
+                self._cond.release()
+                try:
+                    os.fsync(self.fd)
+                finally:
+                    self._cond.acquire()
+                    self._syncing = False
+                    self._cond.notify_all()
+                self._durable = max(self._durable, end)
+                self.fsync_count += 1
+
+    def mark(self) -> Tuple[int, int, Dict[int, int], int]:
+        """[Step 5.22] 현재 로그 끝 위치 (트랜잭션 시작 시 저장, rollback_to에 전달)"""
+        with self._cond:
+            return self.salt, self._end, dict(self.index), self.frame_count
+
+    def rollback_to(self, mark: Tuple[int, int, Dict[int, int], int]):
+        """
+        [Step 5.22] mark 이후 Frame을 잘라냄 (커밋되지 않은 트랜잭션 Frame 폐기)
+
+        남겨두면 다음 commit Frame이 이 Frame들까지 커밋된 것으로 만들기 때문에
+        Recovery 전에 반드시 지워야 합니다.
+
+        Raises:
+            RuntimeError: mark 이후 Checkpoint로 로그가 비워졌을 때 (salt가 다름)
+        """
+        with self._cond:
+            salt, end, index, frame_count = mark
+            if salt != self.salt:
+                raise RuntimeError("WAL mark is older than the last checkpoint")
+            self._end, self.frame_count = end, frame_count
+            self.index = dict(index)
+            os.ftruncate(self.fd, self._end - self._base)
+            self._durable = min(self._durable, self._end)
+
+    def read(self, pid: int) -> Optional[bytes]:
+        """pid의 가장 최근 이미지 (로그에 없으면 None → DB 파일에서 읽음)"""
+        with self._cond:
+            offset = self.index.get(pid)
+            if offset is None:
+                return None
+            return os.pread(self.fd, self.page_size, offset)
+
+    def checkpoint(self, file: BinaryIO):
+        """
+        로그의 최신 이미지들을 DB 파일에 기록 + fsync 후 로그를 비움
+
+        커밋되지 않은 Frame이 없을 때(sync 직후)만 호출해야 합니다.
+        """
+        with self._cond:
+            if self.frame_count == 0:
+                return
+            fd = file.fileno()
+            for pid in sorted(self.index):
+                image = os.pread(self.fd, self.page_size, self.index[pid])
+                os.pwrite(fd, image, pid * self.page_size)
+            os.fsync(fd)
+
+            self.salt = (self.salt + 1) & 0xFFFFFFFF
+            self._reset()
+
+    def close(self):
+        """로그 닫기 (checkpoint 후 비어 있으면 파일도 삭제)"""
+        if self.fd < 0:
+            return
+        os.close(self.fd)
+        self.fd = -1
+        if self.frame_count == 0:
+            os.remove(self.path)
+
+    @classmethod
+    def recover(cls, path: str, file: BinaryIO) -> int:
+        """
+        크래시로 남은 로그를 DB 파일에 반영(Redo)하고 로그 파일 삭제
+
+        마지막 commit Frame까지의 페이지만 적용합니다. (같은 pid는 마지막 이미지)
+        반영 후 fsync하므로, 반영 도중 다시 크래시가 나도 다음에 같은 결과로 재실행됩니다.
+
+        Returns:
+            int: DB 파일에 기록한 페이지 수 (로그가 없으면 0)
+
+        Raises:
+            ValueError: WAL 파일이 아닐 때
+        """
+        if not os.path.exists(path):
+            return 0
+        with open(path, "rb") as log:
+            data = log.read()
+
+        committed: Dict[int, bytes] = {}
+        if len(data) >= cls.HEADER_SIZE:
+            magic, _, page_size, salt = cls._header_struct.unpack_from(data, 0)
+            if magic != cls.MAGIC:
+                raise ValueError(f"Not a PyMiniDB WAL file: {path}")
+
+            pending: Dict[int, bytes] = {}
+            offset = cls.HEADER_SIZE
+            while offset + cls.FRAME_HEADER_SIZE + page_size <= len(data):
+                frame_salt, pid, commit, crc = cls._frame_struct.unpack_from(data, offset)
+                start = offset + cls.FRAME_HEADER_SIZE
+                image = data[start : start + page_size]
+                prefix = cls._prefix_struct.pack(frame_salt, pid, commit)
+                if frame_salt != salt or zlib.crc32(image, zlib.crc32(prefix)) != crc:
+                    break
+                pending[pid] = image
+                if commit:
+                    committed.update(pending)
+                    pending.clear()
+                offset = start + page_size
+
+            fd = file.fileno()
+            for pid in sorted(committed):
+                os.pwrite(fd, committed[pid], pid * page_size)
+            os.fsync(fd)
+
+        os.remove(path)
+        return len(committed)
+
+    def _encode_frame(self, pid: int, data: bytes, commit: bool) -> bytes:
+        prefix = self._prefix_struct.pack(self.salt, pid, commit)
+        crc = zlib.crc32(data, zlib.crc32(prefix))
+        return self._frame_struct.pack(self.salt, pid, commit, crc) + data
+
+    def _reset(self):
+        """로그를 Header만 남기고 비움 (새 salt 기록)"""
+        header = self._header_struct.pack(self.MAGIC, self.VERSION, self.page_size, self.salt)
+        os.pwrite(self.fd, header, 0)
+        os.ftruncate(self.fd, self.HEADER_SIZE)
+        os.fsync(self.fd)
+        self.index.clear()
+        self.frame_count = 0
+        # 지금까지의 Frame은 DB 파일에 반영되었으므로 모두 durable
+        self._base = self._end - self.HEADER_SIZE
+        self._durable = self._end
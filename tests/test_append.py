@@ -0,0 +1,73 @@
+"""
+Step 5.12 검증: 순차 증가 키 Append Fast Path (오른쪽 끝 경로 캐시)
+"""
+
+import sys
+import os
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.table import Table
+
+
+class TestAppendFastPath(unittest.TestCase):
+    def setUp(self):
+        self.test_db = "test_append.db"
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+        self.table = Table(self.test_db, row_limit=10, key_limit=4)
+
+    def tearDown(self):
+        self.table.close()
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def _ids(self):
+        return [row.user_id for row in self.table.btree.scan(-1000, 100000)]
+
+    def test_sequential_inserts_skip_descent(self):
+        for key in range(1000):
+            self.table.execute_insert(key, "u", "u@t.com")
+
+        btree = self.table.btree
+        # Leaf Split 때와 그 직후에만 탐색, 나머지는 캐시된 경로로 Append
+        self.assertGreater(btree.append_hits, 700)
+        self.assertEqual(self._ids(), list(range(1000)))
+
+    def test_sequential_inserts_keep_left_leaves_full(self):
+        for key in range(1000):
+            self.table.execute_insert(key, "u", "u@t.com")
+
+        cursor = self.table.table_start()
+        counts = []
+        page = self.table.pager.read_page(cursor.page_num)
+        while True:
+            counts.append(page.row_count)
+            if not page.has_next_sibling:
+                break
+            page = self.table.pager.read_page(page.next_sibling_id)
+
+        # 마지막 Leaf를 제외하면 FILL_FACTOR(90%)만큼 채워짐
+        self.assertTrue(all(c == 9 for c in counts[:-1]))
+
+    def test_cache_stays_correct_with_mixed_operations(self):
+        for key in range(0, 600, 2):
+            self.table.execute_insert(key, "u", "u@t.com")
+        for key in range(1, 200, 2):
+            self.table.execute_insert(key, "u", "u@t.com")
+        for key in range(400, 600, 2):
+            self.table.execute_delete(key)
+        for key in range(600, 700):
+            self.table.execute_insert(key, "u", "u@t.com")
+
+        expected = sorted(
+            set(range(0, 400, 2)) | set(range(1, 200, 2)) | set(range(600, 700))
+        )
+        self.assertEqual(self._ids(), expected)
+        self.assertEqual(self.table.row_count, len(expected))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
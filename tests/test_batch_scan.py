@@ -0,0 +1,81 @@
+"""
+Step 5.20 검증: NumPy structured array 배치 Scan (scan_batches)
+"""
+
+import sys
+import os
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.btree import BTreeManager
+from src.page import LeafFormat, Page, PageType
+from src.row import Row
+from src.table import Table
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@unittest.skipUnless(np is not None, "numpy not installed")
+class TestBatchScan(unittest.TestCase):
+    def setUp(self):
+        self.test_db = "test_batch_scan.db"
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def tearDown(self):
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def test_dtype_matches_row_layout(self):
+        self.assertEqual(np.dtype(list(Row.NUMPY_FIELDS)).itemsize, Page.ROW_SIZE)
+
+    def test_batches_match_scan(self):
+        for leaf_format in (LeafFormat.ROWS, LeafFormat.KEY_DIRECTORY):
+            with self.subTest(leaf_format=leaf_format.name):
+                table = Table(self.test_db, leaf_format=leaf_format)
+                table.execute_insert_many((i, f"n{i}", f"{i}@t.com") for i in range(0, 1000, 2))
+                btree = BTreeManager(table)
+
+                batches = list(btree.scan_batches(101, 799))
+                self.assertGreater(len(batches), 1)
+                merged = np.concatenate(batches)
+                rows = list(btree.scan(101, 799))
+                self.assertEqual(merged["user_id"].tolist(), [row.user_id for row in rows])
+                self.assertEqual(merged["username"][0], b"n102")
+                self.assertEqual(merged["email"][-1], b"798@t.com")
+
+                # 전체 범위 / 빈 범위
+                everything = np.concatenate(list(btree.scan_batches(-(2**31), 2**40)))
+                self.assertEqual(len(everything), 500)
+                self.assertEqual(list(btree.scan_batches(3, 3)), [])
+                table.close()
+                os.remove(self.test_db)
+
+    def test_batch_is_a_copy(self):
+        page = Page(page_type=PageType.LEAF)
+        for i in range(3):
+            page.append(Row(i, "u", "e"))
+        batch = page.to_array(0, 10)
+        page.write_at(0, Row(0, "changed", "e"))
+        self.assertEqual(batch["username"][0], b"u")
+
+
+class TestBatchScanUnsupported(unittest.TestCase):
+    def test_slotted_leaf_rejected(self):
+        page = Page(page_type=PageType.LEAF, leaf_format=LeafFormat.SLOTTED)
+        with self.assertRaises(ValueError):
+            page.to_array(0, 10)
+
+    def test_missing_numpy_reports_import_error(self):
+        with mock.patch.dict(sys.modules, {"numpy": None}):
+            with self.assertRaises(ImportError):
+                Page(page_type=PageType.LEAF).to_array(0, 10)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -32,7 +32,6 @@ from src.btree import BTreeManager
 from src.table import Table
 from src.page import Page, PageType
 from src.row import Row
-from src.node import BTreeNode
 
 
 # ============================================================
@@ -52,11 +51,6 @@ class BTreeTestBase(unittest.TestCase):
         self.table = Table(self.test_db)
         self.btree = BTreeManager(self.table)
 
-        # 초기 Root Leaf 생성
-        root = Page(page_type=PageType.LEAF)
-        root._update_header()
-        self.table.pager.write_page(0, root)
-
     def tearDown(self):
         """각 테스트 후: DB 정리"""
         self.table.close()
@@ -218,36 +212,18 @@ class TestRangeScan(BTreeTestBase):
 class TestStressLargeScale(unittest.TestCase):
     """대량 데이터 스트레스 테스트
 
-    MAX_ROWS=3, MAX_KEYS=3로 강제 설정하여
+    row_limit=3, key_limit=3으로 용량을 줄여 열어서
     빠르게 트리 높이를 증가시킵니다.
     """
 
-    @classmethod
-    def setUpClass(cls):
-        """MAX_ROWS, MAX_KEYS 축소"""
-        cls.original_max_rows = Page.MAX_ROWS
-        cls.original_max_keys = BTreeNode.MAX_KEYS
-        Page.MAX_ROWS = 3
-        BTreeNode.MAX_KEYS = 3
-
-    @classmethod
-    def tearDownClass(cls):
-        """복원"""
-        Page.MAX_ROWS = cls.original_max_rows
-        BTreeNode.MAX_KEYS = cls.original_max_keys
-
     def setUp(self):
         self.test_db = "test_stress.db"
         if os.path.exists(self.test_db):
             os.remove(self.test_db)
 
-        self.table = Table(self.test_db)
+        self.table = Table(self.test_db, row_limit=3, key_limit=3)
         self.btree = BTreeManager(self.table)
 
-        root = Page(page_type=PageType.LEAF)
-        root._update_header()
-        self.table.pager.write_page(0, root)
-
     def tearDown(self):
         self.table.close()
         if os.path.exists(self.test_db):
@@ -0,0 +1,97 @@
+"""
+Step 5.1 검증: Pager Buffer Pool (LRU + Pin + Dirty)
+"""
+
+import sys
+import os
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.pager import Pager
+from src.page import Page, PageType
+from src.row import Row
+
+
+class TestBufferPool(unittest.TestCase):
+    def setUp(self):
+        self.test_db = "test_buffer_pool.db"
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+        self.pager = Pager(self.test_db, pool_size=3)
+
+    def tearDown(self):
+        self.pager.close()
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def _leaf_with(self, user_id: int) -> Page:
+        page = Page(page_type=PageType.LEAF)
+        page.append(Row(user_id, f"u{user_id}", f"u{user_id}@t.com"))
+        return page
+
+    def test_repeated_read_hits_pool(self):
+        """같은 페이지 반복 읽기 → 디스크 I/O는 최초 1번"""
+        self.pager.write_page(0, self._leaf_with(1))
+        self.pager.sync()
+        self.pager.frames.clear()
+
+        for _ in range(10):
+            self.pager.read_page(0)
+
+        self.assertEqual(self.pager.miss_count, 1)
+        self.assertEqual(self.pager.hit_count, 9)
+
+    def test_write_is_deferred_until_close(self):
+        """write_page는 dirty 표시만, close() 시 Write-back"""
+        self.pager.write_page(0, self._leaf_with(7))
+        self.assertEqual(os.path.getsize(self.test_db), 0)
+
+        self.pager.close()
+        self.assertEqual(os.path.getsize(self.test_db), Page.PAGE_SIZE)
+
+        self.pager = Pager(self.test_db)
+        self.assertEqual(self.pager.read_page(0).read_at(0).user_id, 7)
+
+    def test_lru_eviction_writes_back_dirty(self):
+        """Pool이 가득 차면 LRU Frame이 디스크로 내려감"""
+        for pid in range(4):
+            self.pager.write_page(pid, self._leaf_with(pid))
+
+        self.assertEqual(len(self.pager.frames), 3)
+        self.assertNotIn(0, self.pager.frames)
+
+        # Eviction된 페이지는 디스크에서 다시 읽힘
+        self.assertEqual(self.pager.read_page(0).read_at(0).user_id, 0)
+
+    def test_pinned_frame_is_not_evicted(self):
+        """pin된 Frame은 LRU 순서와 관계없이 유지"""
+        self.pager.write_page(0, self._leaf_with(0))
+        page = self.pager.pin(0)
+
+        for pid in range(1, 5):
+            self.pager.write_page(pid, self._leaf_with(pid))
+
+        self.assertIn(0, self.pager.frames)
+        self.assertIs(self.pager.read_page(0), page)
+        self.pager.unpin(0)
+
+    def test_all_pinned_raises(self):
+        """모든 Frame이 pin 상태면 새 페이지를 올릴 수 없음"""
+        for pid in range(3):
+            self.pager.write_page(pid, self._leaf_with(pid))
+            self.pager.pin(pid)
+
+        with self.assertRaises(RuntimeError):
+            self.pager.write_page(3, self._leaf_with(3))
+
+        for pid in range(3):
+            self.pager.unpin(pid)
+
+    def test_unpin_without_pin_raises(self):
+        with self.assertRaises(RuntimeError):
+            self.pager.unpin(0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
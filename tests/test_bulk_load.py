@@ -0,0 +1,104 @@
+"""
+Step 5.9 검증: Bulk Load (정렬 후 Bottom-up B+Tree 생성)
+"""
+
+import sys
+import os
+import random
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.btree import BTreeManager
+from src.row import Row
+from src.table import Table
+
+
+class TestBulkLoad(unittest.TestCase):
+    def setUp(self):
+        self.test_db = "test_bulk_load.db"
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+        self.original_run_rows = BTreeManager.SORT_RUN_ROWS
+        self.table = Table(self.test_db, row_limit=4, key_limit=3)
+
+    def tearDown(self):
+        self.table.close()
+        BTreeManager.SORT_RUN_ROWS = self.original_run_rows
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def _rows(self, keys):
+        return [Row(k, f"u{k}", f"u{k}@t.com") for k in keys]
+
+    def test_bulk_load_builds_searchable_tree(self):
+        keys = list(range(500))
+        random.Random(7).shuffle(keys)
+        self.assertEqual(self.table.btree.bulk_load(self._rows(keys), 1.0), 500)
+
+        self.assertEqual(self.table.row_count, 500)
+        self.assertGreaterEqual(self.table.tree_height, 4)
+        ids = [row.user_id for row in self.table.btree.scan(0, 10000)]
+        self.assertEqual(ids, list(range(500)))
+        for key in (0, 250, 499):
+            self.assertEqual(self.table.execute_find(key).user_id, key)
+
+    def test_external_sort_with_small_runs(self):
+        """SORT_RUN_ROWS보다 입력이 크면 임시 파일 run을 merge"""
+        BTreeManager.SORT_RUN_ROWS = 16
+        keys = list(range(0, 600, 2))
+        random.Random(3).shuffle(keys)
+        self.table.btree.bulk_load(self._rows(keys))
+
+        cursor = self.table.table_start()
+        ids = []
+        while not cursor.end_of_table:
+            ids.append(cursor.current_cell().user_id)
+            cursor.advance()
+        self.assertEqual(ids, list(range(0, 600, 2)))
+
+    def test_inserts_after_bulk_load_and_reopen(self):
+        self.table.btree.bulk_load(self._rows(range(0, 200, 2)), fill_factor=0.5)
+        for key in range(1, 200, 2):
+            self.table.execute_insert(key, f"u{key}", f"u{key}@t.com")
+        self.table.close()
+
+        self.table = Table(self.test_db, row_limit=4, key_limit=3)
+        self.assertEqual(self.table.row_count, 200)
+        ids = [row.user_id for row in self.table.btree.scan(0, 10000)]
+        self.assertEqual(ids, list(range(200)))
+
+    def test_rejects_non_empty_table_and_duplicates(self):
+        with self.assertRaises(ValueError):
+            self.table.btree.bulk_load(self._rows([1, 2, 2]))
+
+        self.table.execute_insert(1, "a", "a@t.com")
+        with self.assertRaises(ValueError):
+            self.table.btree.bulk_load(self._rows([5]))
+
+    def test_duplicate_leaves_file_untouched(self):
+        """중복 키는 페이지를 할당하기 전에 검사 (run 여러 개의 merge에서도)"""
+        for run_rows in (self.original_run_rows, 64):
+            with self.subTest(run_rows=run_rows):
+                BTreeManager.SORT_RUN_ROWS = run_rows
+                page_count = self.table.pager.page_count
+                with self.assertRaises(ValueError):
+                    self.table.btree.bulk_load(self._rows(list(range(5000)) + [4321]))
+                self.assertEqual(self.table.pager.page_count, page_count)
+
+        self.table.close()
+        self.table = Table(self.test_db, row_limit=4, key_limit=3)
+        self.assertEqual(self.table.pager.page_count, page_count)
+        self.assertEqual(self.table.row_count, 0)
+        self.assertEqual(self.table.btree.bulk_load(self._rows(range(10))), 10)
+
+    def test_empty_input_keeps_table(self):
+        self.assertEqual(self.table.btree.bulk_load([]), 0)
+        self.assertEqual(self.table.tree_height, 1)
+        self.table.execute_insert(1, "a", "a@t.com")
+        self.assertEqual(self.table.execute_find(1).user_id, 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
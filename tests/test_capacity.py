@@ -0,0 +1,143 @@
+"""
+Step 5.6 검증: Page 크기에서 유도한 용량 + FILL_FACTOR Split + 포맷 마이그레이션
+"""
+
+import sys
+import os
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.btree import BTreeManager
+from src.node import BTreeNode
+from src.page import LeafFormat, Page, PageType
+from src.row import Row
+from src.superblock import Superblock
+from src.table import Table
+
+
+class TestDerivedCapacity(unittest.TestCase):
+    def test_capacities_fill_the_page(self):
+        self.assertEqual(Page.MAX_ROWS, (Page.PAGE_SIZE - Page.HEADER_SIZE) // Page.ROW_SIZE)
+        self.assertEqual(Page.MAX_ROWS, 92)
+        self.assertEqual(BTreeNode.MAX_KEYS, 510)
+
+        # MAX_KEYS개의 키를 가진 Internal 노드가 페이지 안에 정확히 들어감
+        page = Page(page_type=PageType.INTERNAL)
+        keys = list(range(BTreeNode.MAX_KEYS))
+        page.write_internal_node(keys, list(range(BTreeNode.MAX_KEYS + 1)))
+        self.assertEqual(len(page.data), Page.PAGE_SIZE)
+        self.assertEqual(page.read_internal_node()[0], keys)
+
+    def test_row_limit_keeps_layout(self):
+        """[Step 5.7] 용량 축소(row_limit)는 가득 참 판단만 바꾸고, 파일 배치는 page_size로만 정해짐"""
+        pages = []
+        for row_limit in (None, 4):
+            page = Page(leaf_format=LeafFormat.KEY_DIRECTORY, row_limit=row_limit)
+            for i in range(3):
+                page.append(Row(i, f"u{i}", "e"))
+            pages.append(page)
+        self.assertEqual(pages[0].max_rows, Page.MAX_ROWS)
+        self.assertEqual(pages[1].max_rows, 4)
+        self.assertEqual(bytes(pages[0].data), bytes(pages[1].data))
+        self.assertEqual(Page.max_rows_for(Page.PAGE_SIZE), 92)
+
+    def test_limits_are_validated(self):
+        test_db = "test_capacity_limits.db"
+        try:
+            for limits in ({"row_limit": 1}, {"row_limit": 93}, {"key_limit": 511}):
+                with self.subTest(**limits):
+                    with self.assertRaises(ValueError):
+                        Table(test_db, **limits)
+        finally:
+            if os.path.exists(test_db):
+                os.remove(test_db)
+
+    def test_split_point(self):
+        self.assertEqual(BTreeNode.split_point(10), 5)
+        self.assertEqual(BTreeNode.split_point(10, rightmost=True), 9)
+        # 오른쪽에 최소 항목 보장
+        self.assertEqual(BTreeNode.split_point(4, rightmost=True, min_right=2), 2)
+
+
+class TestFillFactorSplit(unittest.TestCase):
+    def setUp(self):
+        self.test_db = "test_capacity.db"
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+        self.table = Table(self.test_db, row_limit=10, key_limit=10)
+        self.btree = BTreeManager(self.table)
+
+    def tearDown(self):
+        self.table.close()
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def _leaf_row_counts(self) -> list:
+        cursor = self.table.table_start()
+        counts = []
+        page = self.table.pager.read_page(cursor.page_num)
+        while True:
+            counts.append(page.row_count)
+            if not page.has_next_sibling:
+                return counts
+            page = self.table.pager.read_page(page.next_sibling_id)
+
+    def test_sequential_insert_keeps_left_leaves_full(self):
+        for i in range(200):
+            self.btree.insert(Row(i, f"u{i}", f"u{i}@t.com"))
+
+        counts = self._leaf_row_counts()
+        self.assertEqual(sum(counts), 200)
+        # 마지막 Leaf를 제외하면 모두 FILL_FACTOR(90%)만큼 채워짐
+        self.assertTrue(all(c == 9 for c in counts[:-1]), counts)
+
+        ids = [row.user_id for row in self.btree.scan(0, 1000)]
+        self.assertEqual(ids, list(range(200)))
+
+    def test_middle_split_preserves_sibling_chain(self):
+        for i in range(0, 200, 2):
+            self.btree.insert(Row(i, f"u{i}", f"u{i}@t.com"))
+        for i in range(1, 200, 2):
+            self.btree.insert(Row(i, f"u{i}", f"u{i}@t.com"))
+
+        ids = [row.user_id for row in self.btree.scan(0, 1000)]
+        self.assertEqual(ids, list(range(200)))
+        self.assertEqual(self.table.row_count, 200)
+
+
+class TestFormatMigration(unittest.TestCase):
+    def setUp(self):
+        self.test_db = "test_migration.db"
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def tearDown(self):
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def test_v1_file_is_migrated(self):
+        table = Table(self.test_db)
+        for i in range(30):
+            table.execute_insert(i, f"u{i}", f"u{i}@t.com")
+        table.superblock.format_version = 1
+        table.close()
+
+        table = Table(self.test_db)
+        self.assertEqual(table.superblock.format_version, Superblock.FORMAT_VERSION)
+        self.assertEqual(table.row_count, 30)
+        ids = [row.user_id for row in table.btree.scan(0, 100)]
+        self.assertEqual(ids, list(range(30)))
+        table.close()
+
+    def test_newer_version_is_rejected(self):
+        table = Table(self.test_db)
+        table.superblock.format_version = Superblock.FORMAT_VERSION + 1
+        table.close()
+
+        with self.assertRaises(ValueError):
+            Table(self.test_db)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,143 @@
+"""
+Step 5.25 검증: Thread-safe Pager (pread / pwrite, Frame latch, mapping lock)
+"""
+
+import sys
+import os
+import random
+import threading
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.page import Page, PageType
+from src.pager import Pager
+from src.row import Row
+
+
+def run_threads(target, count, *args):
+    errors = []
+
+    def wrapper(index):
+        try:
+            target(index, *args)
+        except Exception as exc:  # pragma: no cover - 실패 시 메시지 확인용
+            errors.append(exc)
+
+    threads = [threading.Thread(target=wrapper, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+class TestConcurrentPager(unittest.TestCase):
+    PAGES = 64
+
+    def setUp(self):
+        self.test_db = "test_concurrent_pager.db"
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+        self.pager = Pager(self.test_db, pool_size=8)
+        for pid in range(self.PAGES):
+            self.pager.write_page(pid, self._leaf_with(pid, 0))
+        self.pager.sync()
+
+    def tearDown(self):
+        self.pager.close()
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def _leaf_with(self, pid: int, version: int) -> Page:
+        page = Page(page_type=PageType.LEAF)
+        page.append(Row(pid, f"v{version}", "e"))
+        return page
+
+    def _slow_pread(self, delay: float):
+        real_pread = os.pread
+
+        def slow_pread(fd, size, offset):
+            time.sleep(delay)
+            return real_pread(fd, size, offset)
+
+        return mock.patch("src.pager.os.pread", slow_pread)
+
+    def test_concurrent_readers_see_correct_pages(self):
+        reads_per_thread = 500
+
+        def reader(index):
+            rnd = random.Random(index)
+            for _ in range(reads_per_thread):
+                pid = rnd.randrange(self.PAGES)
+                self.assertEqual(self.pager.read_page(pid).read_at(0).user_id, pid)
+
+        self.assertEqual(run_threads(reader, 8), [])
+        self.assertEqual(self.pager.hit_count + self.pager.miss_count, 8 * reads_per_thread)
+        self.assertLessEqual(len(self.pager.frames), self.pager.pool_size)
+
+    def test_faults_overlap_on_disk(self):
+        """서로 다른 페이지의 디스크 읽기는 mapping lock 밖에서 동시에 진행"""
+        self.pager.frames.clear()
+        delay = 0.05
+
+        def reader(index):
+            self.pager.read_page(index)
+
+        with self._slow_pread(delay):
+            started = time.monotonic()
+            self.assertEqual(run_threads(reader, 8), [])
+            elapsed = time.monotonic() - started
+        self.assertEqual(self.pager.miss_count, 8)
+        self.assertLess(elapsed, 8 * delay / 2)
+
+    def test_same_page_is_read_once(self):
+        """같은 페이지를 동시에 읽으면 한 스레드만 디스크에서 읽고 나머지는 기다렸다가 공유"""
+        self.pager.frames.clear()
+        pages = []
+
+        def reader(index):
+            pages.append(self.pager.read_page(5))
+
+        with self._slow_pread(0.05):
+            self.assertEqual(run_threads(reader, 8), [])
+        self.assertEqual(self.pager.miss_count, 1)
+        self.assertTrue(all(page is pages[0] for page in pages))
+
+    def test_concurrent_writers_with_eviction(self):
+        """스레드마다 자기 페이지들을 고치며 Eviction / Write-back이 동시에 일어남"""
+
+        def writer(index):
+            for version in range(1, 21):
+                for pid in range(index, self.PAGES, 4):
+                    self.pager.write_page(pid, self._leaf_with(pid, version))
+                    page = self.pager.read_page(pid)
+                    self.assertEqual(page.read_at(0).username, f"v{version}")
+
+        self.assertEqual(run_threads(writer, 4), [])
+        self.pager.close()
+
+        self.pager = Pager(self.test_db)
+        for pid in range(self.PAGES):
+            self.assertEqual(self.pager.read_page(pid).read_at(0).username, "v20")
+
+    def test_exclusive_latch_serializes_updates(self):
+        increments = 200
+
+        def incrementer(index):
+            for _ in range(increments):
+                with self.pager.latched(3, exclusive=True) as page:
+                    row = page.read_at(0)
+                    page.write_at(0, Row(row.user_id + 1, row.username, row.email))
+
+        self.assertEqual(run_threads(incrementer, 4), [])
+        with self.pager.latched(3) as page:
+            self.assertEqual(page.read_at(0).user_id, 3 + 4 * increments)
+        self.assertTrue(self.pager.frames[3].is_dirty)
+        self.assertEqual(self.pager.frames[3].pin_count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
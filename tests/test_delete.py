@@ -0,0 +1,92 @@
+"""
+Step 5.10 검증: Delete (Merge / Redistribution / Root Collapse)
+"""
+
+import sys
+import os
+import random
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.table import Table
+
+
+class TestDelete(unittest.TestCase):
+    def setUp(self):
+        self.test_db = "test_delete.db"
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+        self.table = Table(self.test_db, row_limit=4, key_limit=3, pool_size=8)
+
+    def tearDown(self):
+        self.table.close()
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def _ids(self):
+        return [row.user_id for row in self.table.btree.scan(-1000, 100000)]
+
+    def test_delete_missing_key(self):
+        self.table.execute_insert(1, "a", "a@t.com")
+        self.assertFalse(self.table.execute_delete(2))
+        self.assertEqual(self.table.row_count, 1)
+
+    def test_delete_all_collapses_tree_and_frees_pages(self):
+        keys = list(range(200))
+        for key in keys:
+            self.table.execute_insert(key, f"u{key}", f"u{key}@t.com")
+        self.assertGreaterEqual(self.table.tree_height, 3)
+
+        random.Random(1).shuffle(keys)
+        for i, key in enumerate(keys):
+            self.assertTrue(self.table.execute_delete(key))
+            if i % 25 == 0:
+                self.assertEqual(self._ids(), sorted(keys[i + 1 :]))
+
+        self.assertEqual(self._ids(), [])
+        self.assertEqual(self.table.row_count, 0)
+        self.assertEqual(self.table.tree_height, 1)
+        # Superblock과 Root Leaf를 제외한 모든 페이지가 Free-list로 반납됨
+        pager = self.table.pager
+        self.assertEqual(pager.free_page_count(), pager.page_count - 2)
+
+    def test_freed_pages_are_reused_by_inserts(self):
+        for key in range(100):
+            self.table.execute_insert(key, "u", "u@t.com")
+        for key in range(100):
+            self.table.execute_delete(key)
+        page_count = self.table.pager.page_count
+
+        for key in range(100):
+            self.table.execute_insert(key, "u", "u@t.com")
+        self.assertEqual(self.table.pager.page_count, page_count)
+        self.assertEqual(self._ids(), list(range(100)))
+
+    def test_mixed_workload_survives_reopen(self):
+        rnd = random.Random(42)
+        model = set()
+        for _ in range(2000):
+            key = rnd.randrange(400)
+            if key in model:
+                self.table.execute_delete(key)
+                model.discard(key)
+            else:
+                self.table.execute_insert(key, "u", "u@t.com")
+                model.add(key)
+        self.table.close()
+
+        self.table = Table(self.test_db, row_limit=4, key_limit=3, pool_size=8)
+        self.assertEqual(self.table.row_count, len(model))
+        self.assertEqual(self._ids(), sorted(model))
+        cursor = self.table.table_start()
+        walked = []
+        while not cursor.end_of_table:
+            walked.append(cursor.current_cell().user_id)
+            cursor.advance()
+        self.assertEqual(walked, sorted(model))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
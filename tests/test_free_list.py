@@ -0,0 +1,84 @@
+"""
+Step 5.5 검증: Free-list (페이지 반납과 재사용)
+"""
+
+import sys
+import os
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.page import INVALID_PAGE_ID, Page, PageType
+from src.pager import Pager
+from src.table import Table
+
+
+class TestFreeList(unittest.TestCase):
+    def setUp(self):
+        self.test_db = "test_free_list.db"
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+        self.table = Table(self.test_db)
+        self.pager = self.table.pager
+
+    def tearDown(self):
+        self.table.close()
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def _allocate(self, n: int) -> list:
+        pids = []
+        for _ in range(n):
+            pid = self.pager.get_new_page_id()
+            self.pager.write_page(pid, Page(page_type=PageType.LEAF))
+            pids.append(pid)
+        return pids
+
+    def test_freed_pages_are_reused_before_growing(self):
+        pids = self._allocate(5)
+        page_count = self.pager.page_count
+
+        for pid in pids:
+            self.pager.free_page(pid)
+        self.assertEqual(self.pager.free_page_count(), 5)
+
+        reused = {self.pager.get_new_page_id() for _ in range(5)}
+        self.assertEqual(reused, set(pids))
+        self.assertEqual(self.pager.page_count, page_count)
+        self.assertEqual(self.table.superblock.free_list_head, INVALID_PAGE_ID)
+
+        # Free-list가 비면 다시 파일 끝에서 할당
+        self.assertEqual(self.pager.get_new_page_id(), page_count)
+
+    def test_trunk_overflow_chains_new_trunk(self):
+        """Trunk가 가득 차면 반납된 페이지가 새 Trunk가 됨"""
+        capacity = self.pager.free_trunk_capacity
+        pids = self._allocate(capacity + 3)
+        for pid in pids:
+            self.pager.free_page(pid)
+
+        self.assertEqual(self.pager.free_page_count(), capacity + 3)
+        head = self.pager.read_page(self.table.superblock.free_list_head)
+        self.assertEqual(head.page_type, PageType.FREE_TRUNK)
+        self.assertTrue(head.has_next_sibling)
+
+    def test_free_list_survives_reopen(self):
+        pids = self._allocate(3)
+        for pid in pids:
+            self.pager.free_page(pid)
+        self.table.close()
+
+        self.table = Table(self.test_db)
+        self.pager = self.table.pager
+        self.assertEqual(self.pager.free_page_count(), 3)
+        self.assertIn(self.pager.get_new_page_id(), pids)
+
+    def test_invalid_free_raises(self):
+        with self.assertRaises(ValueError):
+            self.pager.free_page(0)
+        with self.assertRaises(ValueError):
+            self.pager.free_page(self.pager.page_count + 10)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
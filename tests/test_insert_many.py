@@ -0,0 +1,92 @@
+"""
+Step 5.14 검증: 배치 삽입 (insert_many / execute_insert_many)
+"""
+
+import sys
+import os
+import random
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.row import Row
+from src.table import Table
+
+
+class TestInsertMany(unittest.TestCase):
+    def setUp(self):
+        self.test_db = "test_insert_many.db"
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+        self.table = Table(self.test_db, row_limit=4, key_limit=3, pool_size=8)
+
+    def tearDown(self):
+        self.table.close()
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def _ids(self):
+        return [row.user_id for row in self.table.btree.scan(-1000, 100000)]
+
+    def test_insert_many_into_empty_table(self):
+        keys = list(range(300))
+        random.Random(5).shuffle(keys)
+        count = self.table.execute_insert_many(
+            (k, f"u{k}", f"u{k}@t.com") for k in keys
+        )
+
+        self.assertEqual(count, 300)
+        self.assertEqual(self.table.row_count, 300)
+        self.assertEqual(self._ids(), list(range(300)))
+        self.assertEqual(self.table.execute_find(123).email, "u123@t.com")
+
+    def test_batches_interleave_with_existing_rows(self):
+        for key in range(0, 400, 4):
+            self.table.execute_insert(key, "u", "u@t.com")
+
+        rnd = random.Random(9)
+        expected = set(range(0, 400, 4))
+        for _ in range(5):
+            batch = rnd.sample([k for k in range(400) if k not in expected], 40)
+            self.table.btree.insert_many([Row(k, "b", "b@t.com") for k in batch])
+            expected.update(batch)
+            self.assertEqual(self._ids(), sorted(expected))
+
+        self.table.close()
+        self.table = Table(self.test_db, row_limit=4, key_limit=3, pool_size=8)
+        self.assertEqual(self.table.row_count, len(expected))
+        self.assertEqual(self._ids(), sorted(expected))
+
+    def test_each_leaf_written_once_per_batch(self):
+        """같은 Leaf로 가는 Row들은 한 번의 write_page로 처리"""
+        self.table.close()
+        os.remove(self.test_db)
+        self.table = Table(self.test_db, row_limit=50, key_limit=3, pool_size=8)
+        for key in range(0, 1000, 10):
+            self.table.execute_insert(key, "u", "u@t.com")
+
+        pager = self.table.pager
+        with mock.patch.object(pager, "write_page", wraps=pager.write_page) as write:
+            self.table.execute_insert_many((k, "b", "b@t.com") for k in range(1, 10, 2))
+        self.assertEqual(write.call_count, 1)
+
+    def test_row_count_matches_written_rows_on_encode_error(self):
+        """뒤쪽 Leaf의 Row가 encode에 실패해도 앞서 기록한 Leaf의 Row는 row_count에 반영"""
+        self.table.execute_insert_many((k, "u", "u@t.com") for k in range(0, 40, 2))
+
+        rows = [Row(k, "b", "b@t.com") for k in range(1, 20, 2)]
+        rows.append(Row(39, "x" * 100, "x@t.com"))
+        with self.assertRaises(ValueError):
+            self.table.btree.insert_many(rows)
+
+        self.assertGreater(len(self._ids()), 20)
+        self.assertEqual(self.table.row_count, len(self._ids()))
+        self.table.close()
+        self.table = Table(self.test_db, row_limit=4, key_limit=3, pool_size=8)
+        self.assertEqual(self.table.row_count, len(self._ids()))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
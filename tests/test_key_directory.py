@@ -0,0 +1,92 @@
+"""
+Step 5.16 검증: Leaf Key Directory 배치 (LeafFormat.KEY_DIRECTORY)
+"""
+
+import sys
+import os
+import random
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.node import BTreeNode
+from src.page import LeafFormat, Page, PageType
+from src.row import Row
+from src.superblock import Superblock
+from src.table import Table
+
+
+class TestKeyDirectoryPage(unittest.TestCase):
+    def _page(self, keys):
+        page = Page(page_type=PageType.LEAF, leaf_format=LeafFormat.KEY_DIRECTORY)
+        for key in keys:
+            page.append(Row(key, f"u{key}", f"u{key}@t.com"))
+        return page
+
+    def test_keys_are_contiguous_after_header(self):
+        page = self._page([3, 1, 2])
+        self.assertEqual(page.max_rows, Page.MAX_ROWS)
+        self.assertEqual(
+            bytes(page.data[Page.HEADER_SIZE : Page.HEADER_SIZE + 12]),
+            b"\x03\x00\x00\x00\x01\x00\x00\x00\x02\x00\x00\x00",
+        )
+        self.assertEqual(page.keys(), (3, 1, 2))
+        self.assertEqual(page.read_at(1).email, "u1@t.com")
+
+    def test_search_does_not_decode_rows(self):
+        page = self._page(range(0, 2 * Page.MAX_ROWS, 2))
+        with mock.patch.object(Row, "deserialize") as decode:
+            self.assertEqual(page.search(10), (5, True))
+            self.assertEqual(page.search(11), (6, False))
+            self.assertEqual(page.search(-1), (0, False))
+            self.assertEqual(page.search(10000), (Page.MAX_ROWS, False))
+        decode.assert_not_called()
+
+    def test_mutations_keep_keys_and_payloads_aligned(self):
+        page = self._page([10, 20, 30, 40])
+        page.insert_at(2, Row(25, "x", "x@t.com"))
+        page.remove_at(0)
+        dest = Page(page_type=PageType.LEAF, leaf_format=LeafFormat.KEY_DIRECTORY)
+        page.split_at(2, dest)
+
+        self.assertEqual(page.keys(), (20, 25))
+        self.assertEqual(page.read_at(1).username, "x")
+        self.assertEqual(dest.keys(), (30, 40))
+        self.assertEqual([dest.read_at(i).username for i in range(2)], ["u30", "u40"])
+
+
+class TestKeyDirectoryTable(unittest.TestCase):
+    def setUp(self):
+        self.test_db = "test_key_directory.db"
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def tearDown(self):
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def test_format_recorded_and_used_after_reopen(self):
+        table = Table(self.test_db, leaf_format=LeafFormat.KEY_DIRECTORY)
+        keys = list(range(500))
+        random.Random(11).shuffle(keys)
+        for key in keys:
+            table.execute_insert(key, f"u{key}", f"u{key}@t.com")
+        for key in range(0, 500, 3):
+            table.execute_delete(key)
+        table.close()
+
+        with open(self.test_db, "rb") as f:
+            superblock = Superblock.deserialize(f.read(Superblock.SIZE))
+        self.assertEqual(superblock.leaf_format, LeafFormat.KEY_DIRECTORY)
+
+        # 인자와 관계없이 파일의 배치를 따름
+        table = Table(self.test_db, leaf_format=LeafFormat.ROWS)
+        expected = [k for k in range(500) if k % 3]
+        self.assertEqual([r.user_id for r in table.btree.scan(0, 1000)], expected)
+        self.assertEqual(table.execute_find(500 - 1).email, "u499@t.com")
+        table.close()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,72 @@
+"""
+Step 5.15 검증: Leaf 변경 Primitive (insert_at / remove_at / split_at)
+"""
+
+import sys
+import os
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.page import Page, PageType
+from src.row import Row
+
+
+class TestLeafOps(unittest.TestCase):
+    def _page(self, keys):
+        page = Page(page_type=PageType.LEAF)
+        for key in keys:
+            page.append(Row(key, f"u{key}", f"u{key}@t.com"))
+        return page
+
+    def _keys(self, page):
+        return [page.key_at(i) for i in range(page.row_count)]
+
+    def test_insert_at_shifts_without_decoding(self):
+        page = self._page([10, 20, 30, 40])
+        with mock.patch.object(Row, "deserialize_from") as decode:
+            page.insert_at(1, Row(15, "n", "n@t.com"))
+            page.insert_at(5, Row(50, "e", "e@t.com"))
+            page.insert_at(0, Row(5, "s", "s@t.com"))
+        decode.assert_not_called()
+
+        self.assertEqual(self._keys(page), [5, 10, 15, 20, 30, 40, 50])
+        self.assertEqual(page.read_at(3).email, "u20@t.com")
+        # Header도 갱신됨
+        self.assertEqual(Page(bytes(page.data)).row_count, 7)
+
+    def test_insert_at_bounds(self):
+        page = self._page([1, 2])
+        with self.assertRaises(IndexError):
+            page.insert_at(3, Row(9, "x", "x@t.com"))
+
+        full = self._page(range(page.max_rows))
+        with self.assertRaises(OverflowError):
+            full.insert_at(0, Row(-1, "x", "x@t.com"))
+
+    def test_remove_at_clears_last_slot(self):
+        page = self._page([10, 20, 30])
+        page.remove_at(0)
+        self.assertEqual(self._keys(page), [20, 30])
+
+        end = Page.HEADER_SIZE + 3 * Page.ROW_SIZE
+        last_slot = page.data[end - Page.ROW_SIZE : end]
+        self.assertEqual(bytes(last_slot), bytes(Page.ROW_SIZE))
+        with self.assertRaises(IndexError):
+            page.remove_at(2)
+
+    def test_split_at_moves_tail(self):
+        page = self._page([1, 2, 3, 4, 5])
+        dest = Page(page_type=PageType.LEAF)
+        page.split_at(2, dest)
+
+        self.assertEqual(self._keys(page), [1, 2])
+        self.assertEqual(self._keys(dest), [3, 4, 5])
+        self.assertEqual(dest.read_at(0).username, "u3")
+        with self.assertRaises(ValueError):
+            self._page([7, 8]).split_at(1, dest)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
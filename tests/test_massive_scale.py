@@ -8,37 +8,24 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 
 from src.btree import BTreeManager
 from src.table import Table
-from src.page import Page, PageType
+from src.page import PageType
 from src.row import Row
-from src.node import BTreeNode
 
 
 class TestMassiveScale(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        cls.original_max_rows = Page.MAX_ROWS
-        cls.original_max_keys = BTreeNode.MAX_KEYS
-        Page.MAX_ROWS = 3
-        BTreeNode.MAX_KEYS = 3
         print(f"\n{'=' * 70}")
         print(f"🚀 MASSIVE SCALE: 500 ROWS!")
-        print(f"MAX_ROWS=3, MAX_KEYS=3")
+        print(f"row_limit=3, key_limit=3")
         print(f"{'=' * 70}\n")
 
-    @classmethod
-    def tearDownClass(cls):
-        Page.MAX_ROWS = cls.original_max_rows
-        BTreeNode.MAX_KEYS = cls.original_max_keys
-
     def setUp(self):
         self.test_db = "test_massive.db"
         if os.path.exists(self.test_db):
             os.remove(self.test_db)
-        self.table = Table(self.test_db)
+        self.table = Table(self.test_db, row_limit=3, key_limit=3)
         self.btree = BTreeManager(self.table)
-        root = Page(page_type=PageType.LEAF)
-        root._update_header()
-        self.table.pager.write_page(0, root)
 
     def tearDown(self):
         self.table.close()
@@ -0,0 +1,120 @@
+"""
+Step 5.3 검증: MmapPager (Zero-copy Page View)
+"""
+
+import sys
+import os
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.btree import BTreeManager
+from src.mmap_pager import MmapPager
+from src.page import Page, PageType
+from src.row import Row
+from src.table import Table
+
+
+class TestMmapPager(unittest.TestCase):
+    def setUp(self):
+        self.test_db = "test_mmap_pager.db"
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+        self.pager = MmapPager(self.test_db)
+
+    def tearDown(self):
+        self.pager.close()
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def test_read_page_is_view_of_mapping(self):
+        """read_page가 반환한 Page는 매핑과 메모리를 공유"""
+        pid = self.pager.get_new_page_id()
+        page = Page(page_type=PageType.LEAF)
+        page.append(Row(1, "a", "a@t.com"))
+        self.pager.write_page(pid, page)
+
+        view_page = self.pager.read_page(pid)
+        self.assertIsInstance(view_page.data, memoryview)
+
+        # 제자리 수정 → 다시 읽어도 같은 내용
+        view_page.append(Row(2, "b", "b@t.com"))
+        self.pager.write_page(pid, view_page)
+        self.assertIs(self.pager.read_page(pid), view_page)
+        self.assertEqual(self.pager.read_page(pid).read_at(1).user_id, 2)
+
+    def test_mapping_grows_past_initial_length(self):
+        """get_new_page_id가 매핑 범위를 넘으면 확장"""
+        count = MmapPager.GROW_PAGES + 5
+        first_view = None
+        for i in range(count):
+            pid = self.pager.get_new_page_id()
+            page = Page(page_type=PageType.LEAF)
+            page.append(Row(i, f"u{i}", f"u{i}@t.com"))
+            self.pager.write_page(pid, page)
+            if i == 0:
+                first_view = self.pager.read_page(pid)
+
+        self.assertGreaterEqual(self.pager.mapped_pages, count)
+        # 확장 전에 받은 view도 여전히 유효
+        self.assertEqual(first_view.read_at(0).user_id, 0)
+        self.assertEqual(self.pager.read_page(count - 1).read_at(0).user_id, count - 1)
+
+    def test_close_truncates_to_page_count(self):
+        for _ in range(3):
+            pid = self.pager.get_new_page_id()
+            self.pager.write_page(pid, Page(page_type=PageType.LEAF))
+        self.pager.close()
+
+        self.assertEqual(os.path.getsize(self.test_db), 3 * Page.PAGE_SIZE)
+        self.pager = MmapPager(self.test_db)
+        self.assertEqual(self.pager.page_count, 3)
+
+    def test_btree_on_mmap_table(self):
+        """Table(use_mmap=True) 위에서 B+Tree 삽입/조회"""
+        self.pager.close()
+        os.remove(self.test_db)
+
+        table = Table(self.test_db, use_mmap=True)
+        self.pager = table.pager
+        btree = BTreeManager(table)
+        for i in range(50):
+            btree.insert(Row(i, f"u{i}", f"u{i}@t.com"))
+
+        results = [row.user_id for row in btree.scan(0, 1000)]
+        self.assertEqual(results, list(range(50)))
+
+    def test_latched_uses_mapping(self):
+        """[Step 5.25] latched / flush_page는 별도 사본 없이 매핑 페이지를 사용"""
+        self.pager.close()
+        os.remove(self.test_db)
+
+        table = Table(self.test_db, use_mmap=True)
+        self.pager = table.pager
+        table.execute_insert_many((i, f"u{i}", "e") for i in range(10))
+        root = table.root_page_id
+        with self.pager.latched(root) as page:
+            self.assertEqual(page.row_count, 10)
+
+        table.execute_insert(10, "u10", "e")
+        with self.pager.latched(root) as page:
+            self.assertIs(page, self.pager.read_page(root))
+            self.assertEqual(page.row_count, 11)
+
+        with self.pager.latched(root, exclusive=True) as page:
+            page.write_at(0, Row(0, "changed", "e"))
+        self.pager.flush_page(root)
+        self.assertEqual(table.execute_find(0).username, "changed")
+        self.assertEqual(table.execute_find(10).username, "u10")
+        with self.assertRaises(TypeError):
+            self.pager._fetch(root, pin=True)
+        table.close()
+
+        table = Table(self.test_db, use_mmap=True)
+        self.pager = table.pager
+        self.assertEqual(table.row_count, 11)
+        self.assertEqual(table.execute_find(0).username, "changed")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
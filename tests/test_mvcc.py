@@ -0,0 +1,119 @@
+"""
+Step 5.24 검증: MVCC Snapshot Read (Reader 스레드 여러 개 + Writer 하나)
+"""
+
+import sys
+import os
+import random
+import threading
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.page import LeafFormat
+from src.table import Table
+
+
+class TestSnapshotRead(unittest.TestCase):
+    def setUp(self):
+        self.test_db = "test_mvcc.db"
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def tearDown(self):
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def test_snapshot_is_stable_across_writes(self):
+        for leaf_format in LeafFormat:
+            with self.subTest(leaf_format=leaf_format.name):
+                table = Table(self.test_db, pool_size=8, leaf_format=leaf_format, copy_on_write=True)
+                table.execute_insert_many((i, f"a{i}", "e") for i in range(0, 1000, 2))
+                table.sync()
+
+                with table.snapshot() as view:
+                    table.execute_insert_many((i, f"b{i}", "e") for i in range(1, 1000, 2))
+                    table.execute_update(10, "changed", "e")
+                    table.execute_delete(20)
+                    table.sync()
+                    table.execute_delete(30)  # Commit 전 변경
+
+                    self.assertEqual(view.row_count, 500)
+                    self.assertEqual([row.user_id for row in view.scan(0, 999)], list(range(0, 1000, 2)))
+                    self.assertEqual(view.execute_find(10).username, "a10")
+                    self.assertIsNotNone(view.execute_find(20))
+                    self.assertIsNone(view.execute_find(11))
+                    self.assertEqual(list(view.scan(0, 4, columns=["user_id"])), [(0,), (2,), (4,)])
+
+                    cursor = view.table_start()
+                    count = 0
+                    while not cursor.end_of_table:
+                        count += 1
+                        cursor.advance()
+                    self.assertEqual(count, 500)
+
+                with table.snapshot() as latest:
+                    self.assertEqual(latest.row_count, 999)
+                    self.assertEqual(latest.execute_find(10).username, "changed")
+                    self.assertIsNotNone(latest.execute_find(30))
+                self.assertIsNone(table.execute_find(30))
+                table.close()
+                os.remove(self.test_db)
+
+    def test_readers_never_see_partial_commits(self):
+        """Writer는 100개씩 넣고 Commit, Reader는 항상 100의 배수 개의 정렬된 고유 키를 봄"""
+        table = Table(self.test_db, pool_size=16, copy_on_write=True)
+        keys = list(range(10_000))
+        random.Random(7).shuffle(keys)
+        done = threading.Event()
+        errors = []
+        snapshots_read = [0]
+
+        def reader():
+            try:
+                while not done.is_set():
+                    with table.snapshot() as view:
+                        seen = [row.user_id for row in view.scan(0, 2**31 - 1)]
+                        if len(seen) != view.row_count or len(seen) % 100:
+                            errors.append(("count", len(seen), view.row_count))
+                        if seen != sorted(set(seen)):
+                            errors.append(("order", view.generation))
+                    snapshots_read[0] += 1
+            except Exception as exc:  # pragma: no cover - 실패 시 메시지 확인용
+                errors.append(exc)
+
+        readers = [threading.Thread(target=reader) for _ in range(4)]
+        for thread in readers:
+            thread.start()
+        try:
+            for start in range(0, 2000, 100):
+                table.execute_insert_many((k, "u", "e") for k in keys[start : start + 100])
+                table.sync()
+        finally:
+            done.set()
+            for thread in readers:
+                thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertGreater(snapshots_read[0], 0)
+        with table.snapshot() as view:
+            self.assertEqual(view.row_count, 2000)
+        table.close()
+
+    def test_requires_copy_on_write(self):
+        table = Table(self.test_db)
+        with self.assertRaises(RuntimeError):
+            table.snapshot()
+        table.close()
+
+    def test_closed_snapshot_rejects_reads(self):
+        table = Table(self.test_db, copy_on_write=True)
+        view = table.snapshot()
+        view.close()
+        with self.assertRaises(RuntimeError):
+            view.execute_find(1)
+        table.close()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,72 @@
+"""
+Step 5.13 검증: 디코딩된 Internal 노드 캐시
+"""
+
+import sys
+import os
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.node import BTreeNode
+from src.page import Page, PageType
+from src.table import Table
+
+
+class TestNodeCache(unittest.TestCase):
+    def test_decode_matches_deserialize(self):
+        body = BTreeNode.serialize_internal([10, 20, 4000000000], [1, 2, 3, 4])
+        keys, pids = BTreeNode.decode_internal(body)
+        self.assertEqual((list(keys), list(pids)), BTreeNode.deserialize_internal(body))
+
+    def test_cache_reused_until_write(self):
+        page = Page(page_type=PageType.INTERNAL)
+        page.write_internal_node([100], [1, 2])
+
+        first = page.internal_node()
+        self.assertIs(page.internal_node(), first)
+
+        page.write_internal_node([100, 200], [1, 2, 3])
+        keys, pids = page.internal_node()
+        self.assertIsNot((keys, pids), first)
+        self.assertEqual(list(keys), [100, 200])
+        self.assertEqual(list(pids), [1, 2, 3])
+
+    def test_leaf_has_no_internal_node(self):
+        with self.assertRaises(TypeError):
+            Page(page_type=PageType.LEAF).internal_node()
+
+    def test_descent_decodes_upper_levels_once(self):
+        test_db = "test_node_cache.db"
+        if os.path.exists(test_db):
+            os.remove(test_db)
+        try:
+            table = Table(test_db, row_limit=4, key_limit=3)
+            for key in range(200):
+                table.execute_insert(key, "u", "u@t.com")
+
+            with mock.patch.object(
+                BTreeNode, "decode_internal", wraps=BTreeNode.decode_internal
+            ) as decode:
+                for key in range(200):
+                    self.assertEqual(table.execute_find(key).user_id, key)
+                    self.assertEqual(
+                        table.find_leaf(key), table.btree._find_path_to_leaf(key)[-1]
+                    )
+
+            # Internal 노드 수만큼만 디코딩 (조회 횟수와 무관)
+            internal_pages = sum(
+                1
+                for pid in range(1, table.pager.page_count)
+                if table.pager.read_page(pid).page_type == PageType.INTERNAL
+            )
+            self.assertLessEqual(decode.call_count, internal_pages)
+            table.close()
+        finally:
+            if os.path.exists(test_db):
+                os.remove(test_db)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
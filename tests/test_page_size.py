@@ -0,0 +1,73 @@
+"""
+Step 5.7 검증: 파일별 Page 크기 (4K/8K/16K/32K/64K)
+"""
+
+import sys
+import os
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.btree import BTreeManager
+from src.node import BTreeNode
+from src.page import Page
+from src.pager import Pager
+from src.superblock import Superblock
+from src.table import Table
+
+
+class TestPageSize(unittest.TestCase):
+    def setUp(self):
+        self.test_db = "test_page_size.db"
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def tearDown(self):
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def test_capacity_scales_with_page_size(self):
+        self.assertEqual(Page.max_rows_for(4096), Page.MAX_ROWS)
+        self.assertEqual(Page.max_rows_for(8192), (8192 - Page.HEADER_SIZE) // Page.ROW_SIZE)
+        self.assertEqual(Page(page_size=16384).max_rows, Page.max_rows_for(16384))
+        self.assertGreater(
+            BTreeNode.max_keys_for(65536 - Page.HEADER_SIZE), BTreeNode.MAX_KEYS
+        )
+
+    def test_large_page_table_roundtrip(self):
+        """16K 파일: 삽입 → 재시작 → 전체 조회"""
+        table = Table(self.test_db, page_size=16384)
+        for i in range(1000):
+            table.execute_insert(i, f"u{i}", f"u{i}@t.com")
+        self.assertEqual(table.tree_height, 2)
+        table.close()
+
+        self.assertEqual(os.path.getsize(self.test_db) % 16384, 0)
+        with open(self.test_db, "rb") as f:
+            self.assertEqual(Superblock.deserialize(f.read(16384)).page_size, 16384)
+
+        table = Table(self.test_db)
+        self.assertEqual(table.pager.page_size, 16384)
+        self.assertEqual(table.row_count, 1000)
+        ids = [row.user_id for row in BTreeManager(table).scan(0, 10000)]
+        self.assertEqual(ids, list(range(1000)))
+        table.close()
+
+    def test_existing_file_overrides_argument(self):
+        """이미 만든 파일은 인자와 관계없이 헤더의 page_size를 사용"""
+        table = Table(self.test_db, page_size=8192)
+        table.execute_insert(1, "a", "a@t.com")
+        table.close()
+
+        table = Table(self.test_db, page_size=65536, use_mmap=True)
+        self.assertEqual(table.pager.page_size, 8192)
+        self.assertEqual(table.table_start().current_cell().user_id, 1)
+        table.close()
+
+    def test_unsupported_page_size_rejected(self):
+        with self.assertRaises(ValueError):
+            Pager(self.test_db, page_size=5000)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,61 @@
+"""
+Step 5.8 검증: Point Lookup (BTreeManager.get / Table.execute_find)
+"""
+
+import sys
+import os
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.page import Page, PageType
+from src.row import Row
+from src.table import Table
+
+
+class TestPointLookup(unittest.TestCase):
+    def setUp(self):
+        self.test_db = "test_point_lookup.db"
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+        self.table = Table(self.test_db, row_limit=4, key_limit=3)
+
+    def tearDown(self):
+        self.table.close()
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def test_page_search_on_raw_keys(self):
+        page = Page(page_type=PageType.LEAF)
+        for key in [-5, 2, 7]:
+            page.append(Row(key, "u", "u@t.com"))
+
+        self.assertEqual(page.key_at(0), -5)
+        self.assertEqual(page.search(2), (1, True))
+        self.assertEqual(page.search(3), (2, False))
+        self.assertEqual(page.search(-10), (0, False))
+        self.assertEqual(page.search(100), (3, False))
+
+    def test_find_every_key_in_multi_level_tree(self):
+        keys = list(range(0, 300, 3))
+        for key in reversed(keys):
+            self.table.execute_insert(key, f"u{key}", f"u{key}@t.com")
+        self.assertGreaterEqual(self.table.tree_height, 3)
+
+        for key in keys:
+            row = self.table.execute_find(key)
+            self.assertEqual(row.user_id, key)
+            self.assertEqual(row.email, f"u{key}@t.com")
+
+    def test_missing_key_returns_none(self):
+        for key in [10, 20, 30, 40, 50]:
+            self.table.execute_insert(key, "u", "u@t.com")
+
+        for key in [5, 15, 45, 55]:
+            self.assertIsNone(self.table.execute_find(key))
+        self.assertIsNone(self.table.execute_find(-1))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
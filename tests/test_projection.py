@@ -0,0 +1,121 @@
+"""
+Step 5.19 검증: Projection Pushdown (scan / Cursor의 columns)
+"""
+
+import sys
+import os
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.btree import BTreeManager
+from src.page import LeafFormat, Page, PageType
+from src.row import Row
+from src.schema import ROW_CODEC, Column, ColumnType, Schema
+from src.table import Table
+
+
+def _schema():
+    return Schema(
+        [
+            Column("id", ColumnType.INT32),
+            Column("name", ColumnType.VARCHAR, 100),
+            Column("score", ColumnType.FLOAT64, nullable=True),
+            Column("code", ColumnType.FIXED, 4),
+            Column("avatar", ColumnType.BLOB, 200, nullable=True),
+            Column("visits", ColumnType.INT64),
+        ]
+    )
+
+
+class TestPageProjector(unittest.TestCase):
+    def _check_layout(self, leaf_format):
+        page = Page(page_type=PageType.LEAF, leaf_format=leaf_format)
+        for i in range(5):
+            page.append(Row(i, f"u{i}", f"u{i}@t.com"))
+
+        self.assertEqual(page.projector(["user_id"])(3), (3,))
+        self.assertEqual(page.projector(["email", "user_id"])(2), ("u2@t.com", 2))
+        self.assertEqual(page.projector(["username"])(4), ("u4",))
+        self.assertEqual(page.projector(Row.FIELDS)(1), (1, "u1", "u1@t.com"))
+        with self.assertRaises(ValueError):
+            page.projector(["age"])
+
+    def test_all_leaf_formats(self):
+        for leaf_format in LeafFormat:
+            with self.subTest(leaf_format=leaf_format.name):
+                self._check_layout(leaf_format)
+
+    def test_row_codec_projector(self):
+        blob = Row(7, "alice", "a@t.com").serialize_var()
+        project = ROW_CODEC.projector(["email", "username"])
+        self.assertEqual(project(b"x" + blob, 1), ("a@t.com", "alice"))
+
+    def test_record_codec_reads_only_requested_columns(self):
+        codec = _schema().compile()
+        record = (5, "bob", None, "ab", b"\x01\x02", 2**40)
+        blob = codec.encode(record)
+
+        self.assertEqual(codec.projector(["visits", "id"])(blob), (2**40, 5))
+        self.assertEqual(codec.projector(["avatar"])(b"pad" + blob, 3), (b"\x01\x02",))
+        self.assertEqual(codec.projector(["score", "code", "name"])(blob), (None, "ab", "bob"))
+        self.assertEqual(codec.projector(codec.names)(blob), record)
+        # 같은 컬럼 조합은 한 번만 생성
+        self.assertIs(codec.projector(["visits", "id"]), codec.projector(("visits", "id")))
+        with self.assertRaises(ValueError):
+            codec.projector(["missing"])
+
+
+class TestProjectedScan(unittest.TestCase):
+    def setUp(self):
+        self.test_db = "test_projection.db"
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def tearDown(self):
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def test_scan_columns_matches_full_rows(self):
+        for leaf_format in LeafFormat:
+            with self.subTest(leaf_format=leaf_format.name):
+                table = Table(self.test_db, leaf_format=leaf_format)
+                table.execute_insert_many((i, f"n{i}", f"{i}@t.com") for i in range(0, 600, 2))
+                btree = BTreeManager(table)
+
+                rows = list(btree.scan(101, 399))
+                self.assertEqual(
+                    list(btree.scan(101, 399, columns=["user_id", "email"])),
+                    [(row.user_id, row.email) for row in rows],
+                )
+                self.assertEqual(
+                    [key for (key,) in btree.scan(-5, 10, columns=["user_id"])],
+                    [0, 2, 4, 6, 8, 10],
+                )
+                self.assertEqual(list(btree.scan(3, 3, columns=["user_id"])), [])
+                table.close()
+                os.remove(self.test_db)
+
+    def test_cursor_and_schema_table(self):
+        table = Table(self.test_db, schema=_schema())
+        for i in range(1, 401):
+            table.execute_insert(i, f"user{i}", None if i % 3 else i * 0.5, "c", None, i)
+
+        cursor = table.table_start(columns=["visits", "score"])
+        values = []
+        while not cursor.end_of_table:
+            values.append(cursor.current_cell())
+            cursor.advance()
+        self.assertEqual(len(values), 400)
+        self.assertEqual(values[2], (3, 1.5))
+        self.assertEqual(values[3], (4, None))
+
+        btree = BTreeManager(table)
+        self.assertEqual(
+            list(btree.scan(10, 12, columns=["name"])), [("user10",), ("user11",), ("user12",)]
+        )
+        table.close()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,158 @@
+"""
+Step 5.18 검증: Table Schema와 컴파일된 Record Codec
+"""
+
+import sys
+import os
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.btree import BTreeManager
+from src.page import LeafFormat, Page
+from src.schema import Column, ColumnType, Schema
+from src.superblock import Superblock
+from src.table import Table
+
+
+def _schema():
+    return Schema(
+        [
+            Column("id", ColumnType.INT32),
+            Column("name", ColumnType.VARCHAR, 100),
+            Column("score", ColumnType.FLOAT64, nullable=True),
+            Column("code", ColumnType.FIXED, 4),
+            Column("avatar", ColumnType.BLOB, 200, nullable=True),
+            Column("visits", ColumnType.INT64),
+        ]
+    )
+
+
+class TestRecordCodec(unittest.TestCase):
+    def setUp(self):
+        self.codec = _schema().compile()
+
+    def test_round_trip_with_nulls(self):
+        for record in [
+            (1, "alice", 3.5, "ab", b"\x00\x01", 2**40),
+            (-7, "", None, "", None, -1),
+        ]:
+            blob = self.codec.encode(record)
+            self.assertEqual(self.codec.decode_from(blob), record)
+            self.assertEqual(self.codec.decode_from(b"pad" + blob, 3), record)
+
+    def test_fixed_part_uses_one_precompiled_struct(self):
+        # key, null bitmap, score, code, visits, 가변 컬럼 길이 2개
+        self.assertEqual(self.codec.fixed_struct.format, "<iBd4sqHH")
+        self.assertEqual(self.codec.offsets, {"id": 0, "score": 5, "code": 13, "visits": 17})
+        self.assertEqual(self.codec.bitmap_offset, 4)
+
+        blob = self.codec.encode((5, "bob", 1.25, "xy", None, 9))
+        self.assertEqual(Page.key_struct.unpack_from(blob, 0)[0], 5)
+        self.assertEqual(self.codec.fixed_struct.unpack_from(blob)[2], 1.25)
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            self.codec.encode((1, "a" * 101, None, "", None, 0))
+        with self.assertRaises(ValueError):
+            self.codec.encode((1, "a"))
+        with self.assertRaises(ValueError):
+            Schema([Column("name", ColumnType.VARCHAR)])
+        with self.assertRaises(ValueError):
+            Schema([Column("id", ColumnType.INT32), Column("id", ColumnType.INT64)])
+
+    def test_bad_values_name_the_column(self):
+        """NOT NULL 컬럼의 None / 타입이 다른 값은 struct.error 대신 컬럼 이름이 담긴 ValueError"""
+        schema = _schema()
+        cases = [
+            ((1, None, None, "", None, 0), "name cannot be NULL"),
+            ((1, "a", None, "", None, None), "visits cannot be NULL"),
+            (("notint", "a", None, "", None, 0), "id expects INT32"),
+            ((1, "a", "x", "", None, 0), "score expects FLOAT64"),
+            ((1, "a", None, "", 5, 0), "avatar expects BLOB"),
+            ((2**40, "a", None, "", None, 0), "id out of INT32 range"),
+        ]
+        for record, message in cases:
+            for convert in (schema.make, self.codec.encode):
+                with self.subTest(record=record, convert=convert.__name__):
+                    with self.assertRaisesRegex(ValueError, message):
+                        convert(record)
+
+    def test_schema_serialization(self):
+        schema = _schema()
+        self.assertEqual(Schema.deserialize(schema.serialize()), schema)
+        self.assertIsNone(Schema.deserialize(bytes(2)))
+
+    def test_parse_repl_text(self):
+        self.assertEqual(
+            _schema().parse(["3", "carol", "NULL", "ab", "hi", "10"]),
+            (3, "carol", None, "ab", b"hi", 10),
+        )
+
+
+class TestSchemaTable(unittest.TestCase):
+    def setUp(self):
+        self.test_db = "test_schema.db"
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def tearDown(self):
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def test_schema_table_persists_and_reopens(self):
+        table = Table(self.test_db, schema=_schema())
+        self.assertEqual(table.superblock.leaf_format, LeafFormat.SLOTTED)
+        for i in range(300, 0, -1):
+            table.execute_insert(i, f"user{i}", None if i % 2 else i / 2, "c", None, i * 10)
+        table.execute_update(7, "seven", 7.0, "d", b"img", 70)
+        table.execute_delete(8)
+        table.close()
+
+        table = Table(self.test_db)
+        self.assertEqual(table.schema, _schema())
+        self.assertEqual(table.row_count, 299)
+        self.assertEqual(table.execute_find(7), (7, "seven", 7.0, "d", b"img", 70))
+        self.assertEqual(table.execute_find(9), (9, "user9", None, "c", None, 90))
+        self.assertIsNone(table.execute_find(8))
+        keys = [record[0] for record in BTreeManager(table).scan(0, 1000)]
+        self.assertEqual(keys, [i for i in range(1, 301) if i != 8])
+        table.close()
+
+    def test_two_table_shapes(self):
+        other_db = "test_schema_other.db"
+        if os.path.exists(other_db):
+            os.remove(other_db)
+        narrow = Schema([Column("k", ColumnType.INT32), Column("v", ColumnType.INT64)])
+        try:
+            wide = Table(self.test_db, schema=_schema())
+            small = Table(other_db, schema=narrow)
+            wide.execute_insert_many([(1, "a", 1.0, "x", None, 1)])
+            small.execute_insert_many([(1, 100), (2, 200)])
+            self.assertEqual(small.execute_find(2), (2, 200))
+            self.assertEqual(wide.execute_find(1)[1], "a")
+            wide.close()
+            small.close()
+        finally:
+            if os.path.exists(other_db):
+                os.remove(other_db)
+
+    def test_default_table_still_uses_row(self):
+        table = Table(self.test_db)
+        self.assertIsNone(table.schema)
+        table.execute_insert(1, "alice", "a@t.com")
+        self.assertEqual(table.execute_find(1).username, "alice")
+        table.close()
+
+        with open(self.test_db, "rb") as f:
+            superblock = Superblock.deserialize(f.read(Page.PAGE_SIZE))
+        self.assertIsNone(superblock.schema)
+
+    def test_record_too_large_for_page_rejected(self):
+        huge = Schema([Column("id", ColumnType.INT32), Column("doc", ColumnType.BLOB, 5000)])
+        with self.assertRaises(ValueError):
+            Table(self.test_db, schema=huge)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,164 @@
+"""
+Step 5.23 검증: Copy-on-Write (Shadow Paging) Pager와 Snapshot
+"""
+
+import sys
+import os
+import shutil
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.btree import BTreeManager
+from src.page import LeafFormat
+from src.pager import Pager
+from src.shadow_pager import ShadowPager
+from src.table import Table
+
+
+def snapshot_keys(snapshot):
+    """Snapshot의 Root에서 가장 왼쪽 Leaf로 내려간 뒤 sibling chain을 따라 모든 key"""
+    pid = snapshot.root_page_id
+    for _ in range(snapshot.superblock.tree_height - 1):
+        _, pids = snapshot.read_page(pid).internal_node()
+        pid = pids[0]
+    keys = []
+    while True:
+        page = snapshot.read_page(pid)
+        keys.extend(page.keys())
+        if not page.has_next_sibling:
+            return keys
+        pid = page.next_sibling_id
+
+
+class TestShadowPager(unittest.TestCase):
+    DB_FILES = ("test_shadow.db", "test_shadow_crash.db")
+
+    def setUp(self):
+        self.test_db = self.DB_FILES[0]
+        self._cleanup()
+
+    def tearDown(self):
+        self._cleanup()
+
+    def _cleanup(self):
+        for path in self.DB_FILES:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _ids(self, table):
+        return [row.user_id for row in BTreeManager(table).scan(-(2**31), 2**31 - 1)]
+
+    def test_commit_and_reopen(self):
+        for leaf_format in LeafFormat:
+            with self.subTest(leaf_format=leaf_format.name):
+                table = Table(self.test_db, pool_size=4, leaf_format=leaf_format, copy_on_write=True)
+                table.execute_insert_many((i, f"u{i}", "e") for i in range(1000))
+                for i in range(0, 1000, 3):
+                    table.execute_delete(i)
+                table.close()
+
+                self.assertTrue(ShadowPager.is_shadow_file(self.test_db))
+                table = Table(self.test_db)  # 헤더를 보고 ShadowPager로 열림
+                self.assertIsInstance(table.pager, ShadowPager)
+                self.assertEqual(self._ids(table), [i for i in range(1000) if i % 3])
+                self.assertEqual(table.execute_find(500).username, "u500")
+                table.close()
+                self._cleanup()
+
+    def test_snapshot_survives_later_commits(self):
+        table = Table(self.test_db, pool_size=4, copy_on_write=True)
+        table.execute_insert_many((i, "a", "e") for i in range(0, 2000, 2))
+        table.sync()
+        snapshot = table.pager.snapshot()
+
+        table.execute_insert_many((i, "b", "e") for i in range(1, 2000, 2))
+        for i in range(0, 1000, 2):
+            table.execute_delete(i)
+        table.sync()
+        table.execute_insert_many((i, "c", "e") for i in range(5000, 6000))
+        table.sync()
+
+        # 옛 Root에서 본 트리는 그대로, Commit되지 않은 변경도 보이지 않음
+        self.assertEqual(snapshot_keys(snapshot), list(range(0, 2000, 2)))
+        self.assertEqual(snapshot.superblock.row_count, 1000)
+        snapshot.close()
+
+        with table.pager.snapshot() as latest:
+            self.assertEqual(snapshot_keys(latest), self._ids(table))
+        table.close()
+
+    def test_crash_keeps_last_commit(self):
+        table = Table(self.test_db, pool_size=4, copy_on_write=True)
+        table.execute_insert_many((i, "a", "e") for i in range(300))
+        table.sync()
+        # pool이 작아서 Split 도중의 페이지들이 Eviction으로 파일에 기록됨 (Commit 없음)
+        table.execute_insert_many((i, "b", "e") for i in range(300, 3000))
+        for i in range(100):
+            table.execute_delete(i)
+
+        crash_db = self.DB_FILES[1]
+        shutil.copy(self.test_db, crash_db)
+        recovered = Table(crash_db)
+        self.assertEqual(recovered.row_count, 300)
+        self.assertEqual(self._ids(recovered), list(range(300)))
+        # 마지막 Commit 뒤에 쓰인 물리 페이지는 회수되어 재사용
+        self.assertGreater(len(recovered.pager._free_physical), 0)
+        recovered.execute_insert(300, "c", "e")
+        recovered.close()
+        table.close()
+
+    def test_rollback_reuses_pages(self):
+        table = Table(self.test_db, pool_size=4, copy_on_write=True)
+        table.execute_insert_many((i, "a", "e") for i in range(500))
+        table.sync()
+        physical = table.pager.physical_count
+
+        with self.assertRaises(ValueError):
+            with table.transaction():
+                table.execute_insert_many((i, "b", "e") for i in range(500, 3000))
+                raise ValueError("abort")
+        self.assertEqual(self._ids(table), list(range(500)))
+
+        # 버려진 트랜잭션의 물리 페이지를 재사용하므로 파일이 다시 커지지 않음
+        with table.transaction():
+            table.execute_insert_many((i, "b", "e") for i in range(500, 3000))
+        self.assertLessEqual(table.pager.physical_count, 2 * physical + 60)
+        table.close()
+
+    def test_superseded_pages_wait_for_snapshots(self):
+        table = Table(self.test_db, copy_on_write=True)
+        table.execute_insert_many((i, "a", "e") for i in range(1000))
+        table.sync()
+
+        snapshot = table.pager.snapshot()
+        for round_no in range(5):
+            table.execute_update(1, f"r{round_no}", "e")
+            table.sync()
+        # Snapshot이 열려 있는 동안 옛 페이지는 재사용하지 않음
+        self.assertEqual(table.pager._free_physical, [])
+
+        snapshot.close()
+        table.execute_update(1, "x", "e")
+        table.sync()
+        self.assertGreater(len(table.pager._free_physical), 0)
+        # 이제 Commit마다 직전 Commit이 대체한 페이지를 재사용 → 파일이 더 커지지 않음
+        table.execute_update(1, "y", "e")
+        table.sync()
+        steady = table.pager.physical_count
+        for round_no in range(20):
+            table.execute_update(1, f"y{round_no}", "e")
+            table.sync()
+        self.assertEqual(table.pager.physical_count, steady)
+        table.close()
+
+    def test_plain_pager_refuses_shadow_file(self):
+        Table(self.test_db, copy_on_write=True).close()
+        with self.assertRaises(ValueError):
+            Pager(self.test_db)
+        with self.assertRaises(ValueError):
+            Table(self.test_db, wal=True)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
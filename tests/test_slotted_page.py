@@ -0,0 +1,189 @@
+"""
+Step 5.17 검증: Slotted Leaf 배치 (LeafFormat.SLOTTED, 가변 길이 Row)
+"""
+
+import sys
+import os
+import random
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.btree import BTreeManager
+from src.page import LeafFormat, Page, PageType
+from src.row import Row
+from src.table import Table
+
+
+def _page():
+    return Page(page_type=PageType.LEAF, leaf_format=LeafFormat.SLOTTED)
+
+
+class TestVarRow(unittest.TestCase):
+    def test_round_trip_without_padding(self):
+        row = Row(7, "a" * 100, "한글@t.com")
+        blob = row.serialize_var()
+        self.assertEqual(len(blob), Row._var_header.size + 100 + len("한글@t.com".encode()))
+
+        restored = Row.deserialize_var_from(b"xx" + blob, 2)
+        self.assertEqual(
+            (restored.user_id, restored.username, restored.email),
+            (7, "a" * 100, "한글@t.com"),
+        )
+
+    def test_field_limit(self):
+        with self.assertRaises(ValueError):
+            Row(1, "a" * (Row.VAR_FIELD_MAX + 1), "").serialize_var()
+
+
+class TestSlottedPage(unittest.TestCase):
+    def test_records_grow_from_page_end(self):
+        page = _page()
+        self.assertEqual(page._free_space, Page.PAGE_SIZE - Page.HEADER_SIZE)
+
+        page.append(Row(1, "alice", "a@t.com"))
+        page.insert_at(0, Row(0, "bob", "b@t.com"))
+
+        self.assertEqual(page.keys(), (0, 1))
+        first_len = len(Row(1, "alice", "a@t.com").serialize_var())
+        self.assertEqual(page._slot(1)[1], Page.PAGE_SIZE - first_len)
+        self.assertEqual(
+            page._free_space, page.capacity_bytes - page.used_bytes
+        )
+        # FreeSpace는 Header에 기록되어 다시 읽어도 유지
+        reloaded = Page(bytes(page.data), leaf_format=LeafFormat.SLOTTED)
+        self.assertEqual(reloaded._free_space, page._free_space)
+        self.assertEqual(reloaded.read_at(0).username, "bob")
+
+    def test_capacity_depends_on_record_length(self):
+        short, long = _page(), _page()
+        while short.has_room_for(Row(short.row_count, "a", "b").serialize_var()):
+            short.append(Row(short.row_count, "a", "b"))
+        while long.has_room_for(Row(long.row_count, "a" * 200, "b" * 200).serialize_var()):
+            long.append(Row(long.row_count, "a" * 200, "b" * 200))
+
+        self.assertGreater(short.row_count, Page.MAX_ROWS)
+        self.assertLess(long.row_count, 15)
+        with self.assertRaises(OverflowError):
+            long.append(Row(999, "a" * 200, "b" * 200))
+
+    def test_delete_leaves_hole_until_compaction(self):
+        page = _page()
+        for i in range(10):
+            page.append(Row(i, "u" * 50, f"u{i}@t.com"))
+
+        page.remove_at(3)
+        self.assertGreater(page.fragmented_bytes, 0)
+
+        page.compact()
+        self.assertEqual(page.fragmented_bytes, 0)
+        self.assertEqual(page.keys(), (0, 1, 2, 4, 5, 6, 7, 8, 9))
+        self.assertEqual(page.read_at(3).email, "u4@t.com")
+
+    def test_insert_compacts_when_only_fragmented_space_fits(self):
+        page = _page()
+        big = "x" * 255
+        i = 0
+        while page.has_room_for(Row(i, big, big).serialize_var()):
+            page.append(Row(i, big, big))
+            i += 1
+        page.remove_at(0)
+        self.assertLess(page._free_space, len(Row(0, big, big).serialize_var()))
+
+        page.insert_at(0, Row(-1, big, big))
+        self.assertEqual(page.keys()[0], -1)
+        self.assertEqual(page.fragmented_bytes, 0)
+
+    def test_write_at_changes_record_length(self):
+        page = _page()
+        for i in range(3):
+            page.append(Row(i, "u", "e"))
+
+        page.write_at(1, Row(1, "longer name", "longer@email.com"))
+        page.write_at(2, Row(2, "", ""))
+        self.assertEqual(page.read_at(1).username, "longer name")
+        self.assertEqual(page.read_at(2).email, "")
+        self.assertEqual(page.search(2), (2, True))
+
+    def test_split_balances_bytes(self):
+        page, dest = _page(), _page()
+        for i in range(20):
+            name = "x" * (200 if i < 5 else 10)
+            page.append(Row(i, name, name))
+
+        index = page.split_index()
+        page.split_at(index, dest)
+        self.assertLess(index, 10)
+        self.assertEqual(page.keys() + dest.keys(), tuple(range(20)))
+        self.assertLessEqual(
+            abs(page.used_bytes - dest.used_bytes), 2 * (Row.VAR_MAX_SIZE + Page.SLOT_SIZE)
+        )
+
+
+class TestSlottedTable(unittest.TestCase):
+    def setUp(self):
+        self.test_db = "test_slotted_page.db"
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+        self.table = Table(self.test_db, leaf_format=LeafFormat.SLOTTED)
+
+    def tearDown(self):
+        self.table.close()
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def _ids(self):
+        return [row.user_id for row in BTreeManager(self.table).scan(-(2**31), 2**31 - 1)]
+
+    def test_long_fields_accepted(self):
+        self.table.execute_insert(1, "a" * 100, "b" * 200 + "@t.com")
+        row = self.table.execute_find(1)
+        self.assertEqual(len(row.username), 100)
+        with self.assertRaises(ValueError):
+            self.table.execute_insert(2, "a" * 300, "b")
+
+    def test_random_workload_survives_reopen(self):
+        rnd = random.Random(17)
+        expected = {}
+        for key in rnd.sample(range(2000), 600):
+            name = "n" * rnd.randrange(0, 120)
+            self.table.execute_insert(key, name, f"{key}@t.com")
+            expected[key] = name
+        for key in rnd.sample(sorted(expected), 200):
+            self.table.execute_delete(key)
+            del expected[key]
+        for key in rnd.sample(sorted(expected), 100):
+            name = "m" * rnd.randrange(0, 250)
+            self.table.execute_update(key, name, f"{key}@t.com")
+            expected[key] = name
+
+        self.table.close()
+        self.table = Table(self.test_db)
+        self.assertEqual(self.table.superblock.leaf_format, LeafFormat.SLOTTED)
+        self.assertEqual(self._ids(), sorted(expected))
+        for key in rnd.sample(sorted(expected), 50):
+            self.assertEqual(self.table.execute_find(key).username, expected[key])
+
+    def test_bulk_load_and_insert_many(self):
+        btree = BTreeManager(self.table)
+        btree.bulk_load(Row(i, "x" * (i % 200), "e") for i in range(0, 1000, 2))
+        self.table.execute_insert_many((i, "y" * (i % 150), "e") for i in range(1, 1000, 2))
+
+        self.assertEqual(self._ids(), list(range(1000)))
+        self.assertEqual(self.table.execute_find(399).username, "y" * (399 % 150))
+
+
+class TestBulkLoadSpill(unittest.TestCase):
+    def test_spilled_runs_keep_variable_length_rows(self):
+        rows = [Row(i, "u" * (i % 255), f"{i}@t.com") for i in range(300, 0, -1)]
+        run = BTreeManager._spill_run(rows)
+        try:
+            restored = list(BTreeManager._read_run(run))
+        finally:
+            run.close()
+        self.assertEqual([r.user_id for r in restored], list(range(1, 301)))
+        self.assertEqual(restored[253].username, "u" * 254)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
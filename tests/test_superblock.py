@@ -0,0 +1,107 @@
+"""
+Step 5.4 검증: Superblock (root_page_id / row_count 영속화)
+"""
+
+import sys
+import os
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.btree import BTreeManager
+from src.page import Page, PageType
+from src.pager import Pager
+from src.row import Row
+from src.superblock import Superblock
+from src.table import Table
+
+
+class TestSuperblock(unittest.TestCase):
+    def setUp(self):
+        self.test_db = "test_superblock.db"
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def tearDown(self):
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def test_new_file_layout(self):
+        """빈 파일 → Superblock(0) + Root Leaf(1)"""
+        table = Table(self.test_db, row_limit=3, key_limit=3)
+        self.assertEqual(table.root_page_id, 1)
+        self.assertEqual(table.row_count, 0)
+        self.assertEqual(table.tree_height, 1)
+        table.close()
+
+        with open(self.test_db, "rb") as f:
+            self.assertTrue(Superblock.is_superblock(f.read(Page.PAGE_SIZE)))
+
+    def test_page_zero_is_reserved(self):
+        table = Table(self.test_db, row_limit=3, key_limit=3)
+        with self.assertRaises(ValueError):
+            table.pager.write_page(0, Page(page_type=PageType.LEAF))
+        table.close()
+
+    def test_reopen_after_root_split(self):
+        """Root Split 이후 재시작해도 트리 전체에 접근 가능"""
+        table = Table(self.test_db, row_limit=3, key_limit=3)
+        for i in range(100):
+            table.execute_insert(i, f"u{i}", f"u{i}@t.com")
+        root_pid = table.root_page_id
+        height = table.tree_height
+        self.assertGreaterEqual(height, 3)
+        table.close()
+
+        table = Table(self.test_db, row_limit=3, key_limit=3)
+        self.assertEqual(table.root_page_id, root_pid)
+        self.assertEqual(table.tree_height, height)
+        self.assertEqual(table.row_count, 100)
+        ids = [row.user_id for row in BTreeManager(table).scan(0, 1000)]
+        self.assertEqual(ids, list(range(100)))
+        table.close()
+
+    def test_cursor_walks_leaf_chain(self):
+        table = Table(self.test_db, row_limit=3, key_limit=3)
+        for i in [5, 3, 9, 1, 7, 2, 8]:
+            table.execute_insert(i, f"u{i}", f"u{i}@t.com")
+
+        cursor = table.table_start()
+        ids = []
+        while not cursor.end_of_table:
+            ids.append(cursor.current_cell().user_id)
+            cursor.advance()
+
+        self.assertEqual(ids, [1, 2, 3, 5, 7, 8, 9])
+        self.assertTrue(table.table_end().end_of_table)
+        table.close()
+
+    def test_upgrade_legacy_file(self):
+        """Superblock 없는 구버전 파일 (0번 = 최초 Root Leaf) 업그레이드"""
+        # 구버전 레이아웃 직접 구성: 0번(Leaf) → 1번(Leaf), Root = 2번(Internal)
+        pager = Pager(self.test_db)
+        left = Page(page_type=PageType.LEAF)
+        right = Page(page_type=PageType.LEAF)
+        for i in range(3):
+            left.append(Row(i, f"u{i}", f"u{i}@t.com"))
+            right.append(Row(10 + i, f"v{i}", f"v{i}@t.com"))
+        left._next_page_id = 1
+        left._update_header()
+        root = Page(page_type=PageType.INTERNAL)
+        root.write_internal_node([10], [0, 1])
+        pager.write_page(0, left)
+        pager.write_page(1, right)
+        pager.write_page(2, root)
+        pager.close()
+
+        table = Table(self.test_db, row_limit=3, key_limit=3)
+        self.assertEqual(table.root_page_id, 2)
+        self.assertEqual(table.row_count, 6)
+        self.assertEqual(table.tree_height, 2)
+        ids = [row.user_id for row in BTreeManager(table).scan(0, 100)]
+        self.assertEqual(ids, [0, 1, 2, 10, 11, 12])
+        table.close()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,170 @@
+"""
+Step 5.22 검증: Transaction (begin / commit / rollback)
+"""
+
+import sys
+import os
+import shutil
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.btree import BTreeManager
+from src.page import Page
+from src.table import Table
+from src.wal import WriteAheadLog
+
+
+class TestTransaction(unittest.TestCase):
+    DB_FILES = ("test_transaction.db", "test_transaction_crash.db")
+
+    def setUp(self):
+        self.test_db = self.DB_FILES[0]
+        self._cleanup()
+
+    def tearDown(self):
+        self._cleanup()
+
+    def _cleanup(self):
+        for path in self.DB_FILES:
+            for name in (path, WriteAheadLog.path_for(path)):
+                if os.path.exists(name):
+                    os.remove(name)
+
+    def _ids(self, table):
+        return [row.user_id for row in BTreeManager(table).scan(-(2**31), 2**31 - 1)]
+
+    def test_rollback_restores_tree_and_metadata(self):
+        for options in ({"wal": True}, {"copy_on_write": True}):
+            with self.subTest(**options):
+                table = Table(self.test_db, pool_size=4, **options)
+                table.execute_insert_many((i, "a", "e") for i in range(0, 300, 3))
+                table.sync()
+                root, height = table.root_page_id, table.tree_height
+
+                table.begin()
+                table.execute_insert_many((i, "b", "e") for i in range(1, 300, 3))
+                for i in range(0, 150, 3):
+                    table.execute_delete(i)
+                table.rollback()
+
+                self.assertFalse(table.in_transaction)
+                self.assertEqual((table.root_page_id, table.tree_height), (root, height))
+                self.assertEqual(table.row_count, 100)
+                self.assertEqual(self._ids(table), list(range(0, 300, 3)))
+
+                # rollback 후에도 정상 동작
+                table.execute_insert(1, "c", "e")
+                table.close()
+                table = Table(self.test_db)
+                self.assertEqual(table.row_count, 101)
+                self.assertEqual(table.execute_find(1).username, "c")
+                table.close()
+                self._cleanup()
+
+    def test_uncommitted_pages_stay_out_of_file(self):
+        table = Table(self.test_db, pool_size=4, wal=True)
+        table.sync()
+        table.checkpoint()
+        size = os.path.getsize(self.test_db)
+
+        table.begin()
+        table.execute_insert_many((i, "a", "e") for i in range(2000))
+        self.assertEqual(os.path.getsize(self.test_db), size)
+        self.assertEqual(table.row_count, 2000)
+        self.assertEqual(table.execute_find(1234).user_id, 1234)
+        table.commit()
+        table.checkpoint()
+
+        self.assertGreater(os.path.getsize(self.test_db), 20 * Page.PAGE_SIZE)
+        table.close()
+        table = Table(self.test_db)
+        self.assertEqual(self._ids(table), list(range(2000)))
+        table.close()
+
+    def test_commit_is_one_sync(self):
+        table = Table(self.test_db, wal=True)
+        syncs = table.pager.sync_count
+        with table.transaction():
+            for i in range(500):
+                table.execute_insert(i, "a", "e")
+            table.sync()
+        self.assertEqual(table.pager.sync_count, syncs + 2)  # begin + commit
+        table.close()
+
+    def test_context_manager_rolls_back_on_error(self):
+        table = Table(self.test_db, wal=True)
+        table.execute_insert(1, "a", "e")
+        with self.assertRaises(ValueError):
+            with table.transaction():
+                table.execute_insert(2, "b", "e")
+                table.execute_insert(3, "c" * 100, "e")
+        self.assertEqual(self._ids(table), [1])
+        table.close()
+
+    def test_crash_before_commit_keeps_old_state(self):
+        table = Table(self.test_db, pool_size=4, wal=True)
+        table.execute_insert_many((i, "a", "e") for i in range(100))
+        table.sync()
+        table.begin()
+        table.execute_insert_many((i, "b", "e") for i in range(100, 1000))
+
+        crash_db = self.DB_FILES[1]
+        shutil.copy(self.test_db, crash_db)
+        shutil.copy(WriteAheadLog.path_for(self.test_db), WriteAheadLog.path_for(crash_db))
+        recovered = Table(crash_db)
+        self.assertEqual(recovered.row_count, 100)
+        recovered.close()
+        table.close()
+
+    def test_checkpoint_refused_during_transaction(self):
+        table = Table(self.test_db, pool_size=4, wal=True)
+        table.execute_insert_many((i, "a", "e") for i in range(50))
+        table.sync()
+
+        table.begin()
+        table.execute_insert_many((i, "b", "e") for i in range(50, 500))
+        for i in range(0, 50, 2):
+            table.execute_delete(i)
+        with self.assertRaises(RuntimeError):
+            table.checkpoint()
+        table.rollback()
+
+        self.assertEqual(self._ids(table), list(range(50)))
+        table.close()
+        table = Table(self.test_db)
+        self.assertEqual(self._ids(table), list(range(50)))
+        table.close()
+
+    def test_stale_wal_mark_rejected(self):
+        table = Table(self.test_db, wal=True)
+        table.execute_insert(1, "a", "e")
+        mark = table.pager.wal.mark()
+        table.checkpoint()
+        with self.assertRaises(RuntimeError):
+            table.pager.wal.rollback_to(mark)
+        table.close()
+
+    def test_state_errors(self):
+        table = Table(self.test_db)
+        # WAL / Copy-on-Write가 아니면 Commit이 원자적이지 않으므로 거부
+        with self.assertRaises(RuntimeError):
+            table.begin()
+        table.close()
+
+        table = Table(self.test_db, wal=True)
+        with self.assertRaises(RuntimeError):
+            table.commit()
+        table.begin()
+        with self.assertRaises(RuntimeError):
+            table.begin()
+        table.execute_insert(1, "a", "e")
+        # 끝나지 않은 트랜잭션은 close 시 버려짐
+        table.close()
+        table = Table(self.test_db)
+        self.assertEqual(table.row_count, 0)
+        table.close()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -12,9 +12,8 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 
 from src.btree import BTreeManager
 from src.table import Table
-from src.page import Page, PageType
+from src.page import PageType
 from src.row import Row
-from src.node import BTreeNode
 
 
 # 글로벌 카운터
@@ -76,29 +75,16 @@ class DebugBTreeManager(BTreeManager):
 class TestUltraDebug(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        cls.original_max_rows = Page.MAX_ROWS
-        cls.original_max_keys = BTreeNode.MAX_KEYS
-        Page.MAX_ROWS = 3
-        BTreeNode.MAX_KEYS = 3
-
         global insert_into_parent_calls, root_modifications
         insert_into_parent_calls = 0
         root_modifications = []
 
-    @classmethod
-    def tearDownClass(cls):
-        Page.MAX_ROWS = cls.original_max_rows
-        BTreeNode.MAX_KEYS = cls.original_max_keys
-
     def setUp(self):
         self.test_db = "test_ultra_debug.db"
         if os.path.exists(self.test_db):
             os.remove(self.test_db)
-        self.table = Table(self.test_db)
+        self.table = Table(self.test_db, row_limit=3, key_limit=3)
         self.btree = DebugBTreeManager(self.table)  # Debug 버전!
-        root = Page(page_type=PageType.LEAF)
-        root._update_header()
-        self.table.pager.write_page(0, root)
 
     def tearDown(self):
         self.table.close()
@@ -108,7 +94,7 @@ class TestUltraDebug(unittest.TestCase):
     def test_20_rows_detailed(self):
         """20 rows만 삽입하여 상세 추적"""
         print(f"\n{'=' * 70}")
-        print(f"🔍 ULTRA DEBUG: 20 ROWS (MAX_ROWS=3, MAX_KEYS=3)")
+        print(f"🔍 ULTRA DEBUG: 20 ROWS (row_limit=3, key_limit=3)")
         print(f"{'=' * 70}\n")
 
         num_rows = 20
@@ -1,7 +1,7 @@
 """
 Ultra Deep Tree Stress Test
 
-MAX_ROWS와 MAX_KEYS를 모두 축소하여
+row_limit와 key_limit로 Leaf/Internal 용량을 모두 축소하여
 Internal Cascading Split을 강제로 발생시키는 극한 테스트
 """
 
@@ -23,40 +23,22 @@ class TestUltraDeepTreeStress(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        """MAX_ROWS와 MAX_KEYS 모두 축소!"""
-        cls.original_max_rows = Page.MAX_ROWS
-        cls.original_max_keys = BTreeNode.MAX_KEYS
-
-        # 둘 다 매우 작게!
-        Page.MAX_ROWS = 3
-        BTreeNode.MAX_KEYS = 3
-
         print(f"\n{'=' * 60}")
         print(f"⚠️  ULTRA STRESS MODE")
         print(f"{'=' * 60}")
-        print(f"MAX_ROWS:  {cls.original_max_rows} → {Page.MAX_ROWS}")
-        print(f"MAX_KEYS:  {cls.original_max_keys} → {BTreeNode.MAX_KEYS}")
+        print(f"row_limit: {Page.MAX_ROWS} → 3")
+        print(f"key_limit: {BTreeNode.MAX_KEYS} → 3")
         print(f"{'=' * 60}\n")
 
-    @classmethod
-    def tearDownClass(cls):
-        """복원"""
-        Page.MAX_ROWS = cls.original_max_rows
-        BTreeNode.MAX_KEYS = cls.original_max_keys
-        print(f"\n✅ Restored: MAX_ROWS={Page.MAX_ROWS}, MAX_KEYS={BTreeNode.MAX_KEYS}")
-
     def setUp(self):
         self.test_db = "test_ultra_deep.db"
         if os.path.exists(self.test_db):
             os.remove(self.test_db)
 
-        self.table = Table(self.test_db)
+        # 둘 다 매우 작게! (파일 레이아웃은 그대로, 가득 참 판정만 축소)
+        self.table = Table(self.test_db, row_limit=3, key_limit=3)
         self.btree = BTreeManager(self.table)
 
-        root = Page(page_type=PageType.LEAF)
-        root._update_header()
-        self.table.pager.write_page(0, root)
-
     def tearDown(self):
         self.table.close()
         if os.path.exists(self.test_db):
@@ -66,13 +48,13 @@ class TestUltraDeepTreeStress(unittest.TestCase):
         """
         Internal Cascading Split 발생 테스트
 
-        MAX_KEYS=3이므로 Internal도 빠르게 가득 참!
+        key_limit=3이므로 Internal도 빠르게 가득 참!
         """
         print("=" * 60)
         print("TEST: Internal Cascading Split")
         print("=" * 60)
         print(f"Target: Internal Node Split 발생시키기!")
-        print(f"Strategy: MAX_ROWS=3, MAX_KEYS=3\n")
+        print(f"Strategy: row_limit=3, key_limit=3\n")
 
         num_rows = 30  # 충분히 많이
 
@@ -0,0 +1,58 @@
+"""
+Step 5.11 검증: Update / Upsert
+"""
+
+import sys
+import os
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.row import Row
+from src.table import Table
+
+
+class TestUpdate(unittest.TestCase):
+    def setUp(self):
+        self.test_db = "test_update.db"
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+        self.table = Table(self.test_db, row_limit=4, key_limit=3)
+        for key in range(50):
+            self.table.execute_insert(key, f"u{key}", f"u{key}@t.com")
+
+    def tearDown(self):
+        self.table.close()
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def test_update_rewrites_slot_without_split(self):
+        page_count = self.table.pager.page_count
+        for key in range(0, 50, 7):
+            self.assertTrue(self.table.execute_update(key, "new", f"n{key}@t.com"))
+
+        self.assertEqual(self.table.pager.page_count, page_count)
+        self.assertEqual(self.table.row_count, 50)
+        self.assertEqual(self.table.execute_find(14).email, "n14@t.com")
+        self.assertEqual(self.table.execute_find(15).email, "u15@t.com")
+
+    def test_update_missing_key_and_key_change(self):
+        self.assertFalse(self.table.execute_update(100, "x", "x@t.com"))
+        self.assertIsNone(self.table.execute_find(100))
+        with self.assertRaises(ValueError):
+            self.table.btree.update(1, Row(2, "x", "x@t.com"))
+
+    def test_upsert(self):
+        self.assertFalse(self.table.execute_upsert(10, "up", "up@t.com"))
+        self.assertTrue(self.table.execute_upsert(100, "new", "new@t.com"))
+
+        self.assertEqual(self.table.row_count, 51)
+        self.assertEqual(self.table.execute_find(10).username, "up")
+        self.assertEqual(self.table.execute_find(100).username, "new")
+        ids = [row.user_id for row in self.table.btree.scan(0, 1000)]
+        self.assertEqual(ids, list(range(50)) + [100])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,210 @@
+"""
+Step 5.21 검증: Write-Ahead Log (Commit, Recovery, Checkpoint, Group Commit)
+"""
+
+import sys
+import os
+import shutil
+import threading
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.btree import BTreeManager
+from src.page import Page
+from src.table import Table
+from src.wal import WriteAheadLog
+
+
+class TestWal(unittest.TestCase):
+    def setUp(self):
+        self.test_db = "test_wal.db"
+        self.crash_db = "test_wal_crash.db"
+        self._cleanup()
+
+    def tearDown(self):
+        self._cleanup()
+
+    def _cleanup(self):
+        for path in (self.test_db, self.crash_db):
+            for name in (path, WriteAheadLog.path_for(path)):
+                if os.path.exists(name):
+                    os.remove(name)
+
+    def _crash_copy(self) -> str:
+        """열린 상태의 DB 파일 + 로그를 그대로 복사 (프로세스가 죽은 시점의 디스크)"""
+        shutil.copy(self.test_db, self.crash_db)
+        wal_path = WriteAheadLog.path_for(self.test_db)
+        if os.path.exists(wal_path):
+            shutil.copy(wal_path, WriteAheadLog.path_for(self.crash_db))
+        return self.crash_db
+
+    def _ids(self, table):
+        return [row.user_id for row in BTreeManager(table).scan(-(2**31), 2**31 - 1)]
+
+    def test_committed_changes_survive_crash(self):
+        table = Table(self.test_db, wal=True)
+        table.execute_insert_many((i, f"u{i}", "e") for i in range(500))
+        table.sync()
+        # DB 파일은 그대로, 변경은 로그에만
+        self.assertLess(os.path.getsize(self.test_db), 3 * Page.PAGE_SIZE)
+
+        recovered = Table(self._crash_copy())
+        self.assertGreater(recovered.pager.recovered_pages, 1)
+        self.assertEqual(recovered.row_count, 500)
+        self.assertEqual(self._ids(recovered), list(range(500)))
+        self.assertFalse(os.path.exists(WriteAheadLog.path_for(self.crash_db)))
+        recovered.close()
+        table.close()
+
+    def test_uncommitted_work_is_discarded(self):
+        table = Table(self.test_db, pool_size=4, wal=True)
+        table.execute_insert_many((i, "a", "e") for i in range(0, 400, 2))
+        table.sync()
+        # pool이 작아서 Split 도중의 페이지들이 Eviction으로 로그에 기록됨 (Commit 없음)
+        table.execute_insert_many((i, "b", "e") for i in range(1, 400, 2))
+        self.assertGreater(table.pager.wal.frame_count, 0)
+
+        recovered = Table(self._crash_copy())
+        self.assertEqual(recovered.row_count, 200)
+        self.assertEqual(self._ids(recovered), list(range(0, 400, 2)))
+        recovered.close()
+        table.close()
+
+    def test_torn_last_frame_is_ignored(self):
+        table = Table(self.test_db, wal=True)
+        table.execute_insert(1, "a", "e")
+        table.sync()
+        table.execute_insert(2, "b", "e")
+        table.sync()
+        self._crash_copy()
+        table.close()
+
+        wal_path = WriteAheadLog.path_for(self.crash_db)
+        with open(wal_path, "r+b") as f:
+            f.truncate(os.path.getsize(wal_path) - 100)
+
+        recovered = Table(self.crash_db)
+        self.assertEqual(self._ids(recovered), [1])
+        recovered.close()
+
+    def test_checkpoint_and_close_empty_the_log(self):
+        table = Table(self.test_db, wal=True)
+        table.pager.checkpoint_pages = 5
+        table.execute_insert_many((i, "a", "e") for i in range(300))
+        table.sync()
+        self.assertEqual(table.pager.wal.frame_count, 0)
+        self.assertGreater(os.path.getsize(self.test_db), 3 * Page.PAGE_SIZE)
+
+        table.execute_delete(10)
+        table.close()
+        self.assertFalse(os.path.exists(WriteAheadLog.path_for(self.test_db)))
+
+        table = Table(self.test_db)
+        self.assertEqual(table.row_count, 299)
+        self.assertIsNone(table.execute_find(10))
+        table.close()
+
+    def test_mmap_rejected(self):
+        with self.assertRaises(ValueError):
+            Table(self.test_db, use_mmap=True, wal=True)
+
+    def test_table_syncs_share_fsync(self):
+        """[Step 5.25] Table.sync()를 동시에 부른 스레드들의 Commit이 로그 fsync를 함께 씀"""
+        threads_count = 16
+        real_fsync = os.fsync
+
+        def slow_fsync(fd):
+            time.sleep(0.02)
+            real_fsync(fd)
+
+        for checkpoint_pages in (1000, 3):  # 3: Commit 사이에 Checkpoint가 끼어도 끝남
+            with self.subTest(checkpoint_pages=checkpoint_pages):
+                table = Table(self.test_db, wal=True)
+                table.pager.checkpoint_pages = checkpoint_pages
+                table.execute_insert_many((i, "a", "e") for i in range(threads_count))
+                table.sync()
+                writer = threading.Lock()  # B+Tree 수정은 여전히 Writer 하나
+
+                def committer(index):
+                    with writer:
+                        table.execute_update(index, f"t{index}", "e")
+                    table.sync()
+
+                with mock.patch("src.wal.os.fsync", slow_fsync):
+                    table.pager.wal.fsync_count = 0
+                    threads = [
+                        threading.Thread(target=committer, args=(i,))
+                        for i in range(threads_count)
+                    ]
+                    for thread in threads:
+                        thread.start()
+                    for thread in threads:
+                        thread.join()
+
+                if checkpoint_pages > threads_count:
+                    self.assertLess(table.pager.wal.fsync_count, threads_count)
+                recovered = Table(self._crash_copy())
+                self.assertEqual(
+                    [row.username for row in BTreeManager(recovered).scan(0, threads_count)],
+                    [f"t{i}" for i in range(threads_count)],
+                )
+                recovered.close()
+                table.close()
+                self._cleanup()
+
+
+class TestGroupCommit(unittest.TestCase):
+    def setUp(self):
+        self.path = "test_group_commit.db-wal"
+        self.wal = WriteAheadLog(self.path, Page.PAGE_SIZE)
+
+    def tearDown(self):
+        self.wal.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def test_concurrent_commits_share_fsync(self):
+        real_fsync = os.fsync
+
+        def slow_fsync(fd):
+            time.sleep(0.02)
+            real_fsync(fd)
+
+        def committer(pid):
+            lsn = self.wal.append([(pid, bytes(Page.PAGE_SIZE))], commit=True)
+            self.wal.commit(lsn)
+
+        with mock.patch("src.wal.os.fsync", slow_fsync):
+            self.wal.fsync_count = 0
+            threads = [threading.Thread(target=committer, args=(i,)) for i in range(1, 17)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(self.wal.frame_count, 16)
+        self.assertLess(self.wal.fsync_count, 16)
+        self.assertEqual(self.wal._durable, self.wal._end)
+
+    def test_recover_applies_only_committed_frames(self):
+        self.wal.append([(1, b"\x01" * Page.PAGE_SIZE), (2, b"\x02" * Page.PAGE_SIZE)])
+        self.wal.append([(3, b"\x03" * Page.PAGE_SIZE)], commit=True)
+        self.wal.append([(1, b"\xff" * Page.PAGE_SIZE)])
+        self.wal.commit()
+
+        target = "test_group_commit.db"
+        try:
+            with open(target, "w+b") as f:
+                self.assertEqual(WriteAheadLog.recover(self.path, f), 3)
+                f.seek(Page.PAGE_SIZE)
+                self.assertEqual(f.read(1), b"\x01")
+        finally:
+            os.remove(target)
+        self.assertFalse(os.path.exists(self.path))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
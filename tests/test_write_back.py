@@ -0,0 +1,92 @@
+"""
+Step 5.2 검증: Write-back 모드와 SyncPolicy
+"""
+
+import sys
+import os
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.pager import Pager, SyncPolicy
+from src.page import Page, PageType
+from src.row import Row
+
+
+class RecordingPager(Pager):
+    """디스크 write 호출 횟수를 기록하는 Pager"""
+
+    def __init__(self, *args, **kwargs):
+        self.write_calls = 0
+        super().__init__(*args, **kwargs)
+
+    def _pwrite(self, data, offset):
+        self.write_calls += 1
+        super()._pwrite(data, offset)
+
+
+class TestWriteBack(unittest.TestCase):
+    def setUp(self):
+        self.test_db = "test_write_back.db"
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def tearDown(self):
+        self.pager.close()
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def _leaf_with(self, user_id: int) -> Page:
+        page = Page(page_type=PageType.LEAF)
+        page.append(Row(user_id, f"u{user_id}", f"u{user_id}@t.com"))
+        return page
+
+    def test_batch_sync_coalesces_contiguous_pages(self):
+        """연속 PID 0~4 + 떨어진 PID 9 → write 2번"""
+        self.pager = RecordingPager(self.test_db, sync_policy=SyncPolicy.BATCH)
+        for pid in [4, 0, 9, 2, 1, 3]:
+            self.pager.write_page(pid, self._leaf_with(pid))
+
+        self.assertEqual(self.pager.write_calls, 0)
+        self.pager.sync()
+        self.assertEqual(self.pager.write_calls, 2)
+
+        # 두 번째 sync는 dirty가 없으므로 write 없음
+        self.pager.sync()
+        self.assertEqual(self.pager.write_calls, 2)
+
+        self.pager.frames.clear()
+        for pid in [0, 1, 2, 3, 4, 9]:
+            self.assertEqual(self.pager.read_page(pid).read_at(0).user_id, pid)
+
+    def test_write_policy_writes_through(self):
+        """SyncPolicy.WRITE: write_page마다 즉시 디스크 기록"""
+        self.pager = RecordingPager(self.test_db, sync_policy=SyncPolicy.WRITE)
+        self.pager.write_page(0, self._leaf_with(1))
+
+        self.assertEqual(self.pager.write_calls, 1)
+        self.assertEqual(os.path.getsize(self.test_db), Page.PAGE_SIZE)
+        self.assertFalse(self.pager.frames[0].is_dirty)
+
+    def test_interval_policy_syncs_when_elapsed(self):
+        """SyncPolicy.INTERVAL: 주기가 지나면 write_page가 sync 수행"""
+        self.pager = Pager(
+            self.test_db, sync_policy=SyncPolicy.INTERVAL, sync_interval_ms=0
+        )
+        self.pager.write_page(0, self._leaf_with(1))
+
+        self.assertEqual(self.pager.sync_count, 1)
+        self.assertEqual(os.path.getsize(self.test_db), Page.PAGE_SIZE)
+
+    def test_interval_policy_defers_within_interval(self):
+        self.pager = Pager(
+            self.test_db, sync_policy=SyncPolicy.INTERVAL, sync_interval_ms=60_000
+        )
+        self.pager.write_page(0, self._leaf_with(1))
+
+        self.assertEqual(self.pager.sync_count, 0)
+        self.assertEqual(os.path.getsize(self.test_db), 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)